@@ -0,0 +1,69 @@
+"""Compares the throughput of the `Parser` and the lazy `Parser` on the SVD test corpus.
+
+Usage: python benchmarks/benchmark_parser.py [--repeat N] [svd_dir]
+"""
+
+import argparse
+from functools import partial
+import glob
+import os
+import time
+import warnings
+from typing import Any, Callable
+
+from svdsuite.parse import Parser
+
+
+def _load_corpus(svd_dir: str) -> list[bytes]:
+    contents: list[bytes] = []
+    for path in sorted(glob.glob(os.path.join(svd_dir, "**", "*.svd"), recursive=True)):
+        with open(path, "rb") as file:
+            contents.append(file.read())
+
+    return contents
+
+
+def _measure(parse: Callable[[bytes], Any], contents: list[bytes], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in contents:
+            try:
+                parse(content)
+            except Exception:  # pylint: disable=W0718
+                # some test files are invalid on purpose, they cost the same for all parsers
+                pass
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests", "svd")
+
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("svd_dir", nargs="?", default=default_dir)
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    args = argument_parser.parse_args()
+
+    contents = _load_corpus(args.svd_dir)
+    megabytes = sum(len(content) for content in contents) / 1e6
+
+    warnings.simplefilter("ignore")
+
+    print(f"{len(contents)} files, {megabytes:.2f} MB, best of {args.repeat}")
+    parsers: dict[str, Callable[[bytes], Any]] = {
+        "Parser": Parser.from_xml_content,
+        # only the peripheral list is built, the registers are never accessed
+        "Parser(lazy=True)": partial(Parser.from_xml_content, lazy=True),
+    }
+
+    baseline = None
+    for name, parse in parsers.items():
+        seconds = _measure(parse, contents, args.repeat)
+        baseline = baseline or seconds
+        print(f"{name:>17}: {seconds:.3f} s ({megabytes / seconds:.2f} MB/s, {baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
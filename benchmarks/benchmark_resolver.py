@@ -0,0 +1,75 @@
+"""Measures the processing time of a generated device with many derivedFrom registers and fields.
+
+Usage: python benchmarks/benchmark_resolver.py [--repeat N] [--peripherals N] [--registers N] [--fields N]
+"""
+
+import argparse
+import time
+import warnings
+
+from svdsuite.parse import Parser
+from svdsuite.process import Process
+
+
+def _generate_svd(peripherals: int, registers: int, fields: int) -> bytes:
+    field_elements = "".join(
+        f"<field><name>F{i}</name><bitOffset>{i}</bitOffset><bitWidth>1</bitWidth></field>" for i in range(fields)
+    )
+
+    def register(index: int) -> str:
+        if index == 0:
+            return (
+                "<register><name>R0</name><addressOffset>0x0</addressOffset><size>32</size>"
+                f"<fields>{field_elements}</fields></register>"
+            )
+
+        # half of the registers are derived from a register of the same peripheral, the other half from the first
+        # peripheral, which needs the dotted path
+        derived_from = "R0" if index % 2 else "P0.R0"
+        return (
+            f"<register derivedFrom='{derived_from}'><name>R{index}</name>"
+            f"<addressOffset>{4 * index:#x}</addressOffset></register>"
+        )
+
+    peripheral_elements = "".join(
+        f"<peripheral><name>P{p}</name><baseAddress>{0x40000000 + p * 0x10000:#x}</baseAddress>"
+        "<addressBlock><offset>0</offset><size>0x10000</size><usage>registers</usage></addressBlock>"
+        f"<registers>{''.join(register(r) for r in range(registers))}</registers></peripheral>"
+        for p in range(peripherals)
+    )
+
+    return (
+        "<device schemaVersion='1.1' xmlns:xs='http://www.w3.org/2001/XMLSchema-instance' "
+        "xs:noNamespaceSchemaLocation='CMSIS-SVD.xsd'><name>bench</name><version>1</version>"
+        "<description>bench</description><addressUnitBits>8</addressUnitBits><width>32</width>"
+        f"<size>32</size><access>read-write</access><peripherals>{peripheral_elements}</peripherals></device>"
+    ).encode()
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argument_parser.add_argument("--repeat", type=int, default=3)
+    argument_parser.add_argument("--peripherals", type=int, default=4)
+    argument_parser.add_argument("--registers", type=int, default=500)
+    argument_parser.add_argument("--fields", type=int, default=1)
+    args = argument_parser.parse_args()
+
+    warnings.simplefilter("ignore")
+
+    content = _generate_svd(args.peripherals, args.registers, args.fields)
+    parsed_device = Parser.from_xml_content(content).get_parsed_device()
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        Process(parsed_device, None)
+        best = min(best, time.perf_counter() - start)
+
+    print(
+        f"{args.peripherals} peripherals with {args.registers} registers of {args.fields} fields each, "
+        f"best of {args.repeat}: {best:.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,18 @@
-from svdsuite.parse import Parser
+from svdsuite.archive import ArchiveException, list_pack_svd_files, open_svd_file
+from svdsuite.batch import BatchException, BatchResult, collect_svd_files, process_svd_files
+from svdsuite.binary import BinaryDevice, BinaryFormatException, open_device_binary, write_device_binary
+from svdsuite.cache import DeviceCache
+from svdsuite.diagnostics import (
+    Diagnostic,
+    DiagnosticCode,
+    Diagnostics,
+    DiagnosticsSink,
+    NullDiagnostics,
+    Severity,
+    WarningsDiagnostics,
+)
+from svdsuite.document import SVDDocument, DocumentException
+from svdsuite.parse import Parser, PeripheralStream
 from svdsuite.util.parser_exception_warning import ParserException, ParserWarning
 from svdsuite.process import Process, ProcessException, ProcessWarning
 from svdsuite.validate import Validator, ValidatorException, SVDSchemaVersion
@@ -6,7 +20,29 @@ from svdsuite.serialize import Serializer
 from svdsuite.map import PeripheralRegisterMap
 
 __all__ = [
+    "ArchiveException",
+    "list_pack_svd_files",
+    "open_svd_file",
+    "BatchException",
+    "BatchResult",
+    "collect_svd_files",
+    "process_svd_files",
+    "BinaryDevice",
+    "BinaryFormatException",
+    "open_device_binary",
+    "write_device_binary",
+    "DeviceCache",
+    "Diagnostic",
+    "DiagnosticCode",
+    "Diagnostics",
+    "DiagnosticsSink",
+    "NullDiagnostics",
+    "Severity",
+    "WarningsDiagnostics",
+    "SVDDocument",
+    "DocumentException",
     "Parser",
+    "PeripheralStream",
     "ParserException",
     "ParserWarning",
     "Process",
@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+import gzip
+import lzma
+import zipfile
+
+_PACK_SUFFIXES = (".pack", ".zip")
+
+
+class ArchiveException(Exception):
+    pass
+
+
+def list_pack_svd_files(pack_path: str) -> list[str]:
+    """Lists the names of all SVD members of a CMSIS pack (zip file) without extracting anything."""
+
+    with zipfile.ZipFile(pack_path) as pack:
+        return _list_svd_members(pack)
+
+
+def _list_svd_members(pack: zipfile.ZipFile) -> list[str]:
+    # only the central directory is read, no member is decompressed
+    return [info.filename for info in pack.infolist() if not info.is_dir() and info.filename.lower().endswith(".svd")]
+
+
+@contextmanager
+def open_svd_file(path: str, member: None | str = None) -> Iterator[BinaryIO]:
+    """Opens an SVD file for reading, which can be a plain, gzip (`.gz`) or xz (`.xz`) compressed SVD file, or a member
+    of a CMSIS pack (`.pack` or `.zip`).
+
+    Compressed content is decompressed on the fly while it is read, without a temporary file. If `member` is not given
+    for a pack, the pack has to contain exactly one SVD file.
+    """
+
+    lower_path = path.lower()
+
+    if lower_path.endswith(_PACK_SUFFIXES):
+        with zipfile.ZipFile(path) as pack:
+            if member is None:
+                svd_files = _list_svd_members(pack)
+                if len(svd_files) != 1:
+                    raise ArchiveException(
+                        f"Pack '{path}' contains {len(svd_files)} svd files, a member has to be given: {svd_files}"
+                    )
+                member = svd_files[0]
+
+            try:
+                file = pack.open(member)
+            except KeyError as exc:
+                raise ArchiveException(f"Pack '{path}' doesn't contain member '{member}'") from exc
+
+            with file:
+                yield file  # type: ignore[misc]
+        return
+
+    if member is not None:
+        raise ArchiveException(f"A member can only be given for pack files, not for '{path}'")
+
+    if lower_path.endswith(".gz"):
+        with gzip.open(path, "rb") as file:
+            yield file  # type: ignore[misc]
+    elif lower_path.endswith(".xz"):
+        with lzma.open(path, "rb") as file:
+            yield file  # type: ignore[misc]
+    else:
+        with open(path, "rb") as file:
+            yield file
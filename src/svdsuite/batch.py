@@ -0,0 +1,266 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from svdsuite.diagnostics import Diagnostic, Diagnostics
+from svdsuite.model.process import Device
+from svdsuite.process import Process
+
+_SVD_SUFFIXES = (".svd", ".svd.gz", ".svd.xz")
+
+# workers don't inherit the memory of the caller, so the memory limit only applies to the processing of the files
+_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+class BatchException(Exception):
+    pass
+
+
+@dataclass(slots=True)
+class BatchResult:
+    path: str
+    # processing time in seconds, or the time until the timeout or the exit of the worker
+    duration: float
+    diagnostics: list[Diagnostic] = field(default_factory=list)
+    # only kept with `keep_devices`
+    device: None | Device = None
+    # exception, timeout or exit of the worker, which made the processing fail
+    error: None | str = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def collect_svd_files(sources: Iterable[str]) -> list[str]:
+    """Collects the SVD files of the given sources, which can be files, directories (searched recursively for `.svd`,
+    `.svd.gz` and `.svd.xz` files) and glob patterns. The paths are sorted and each is listed once."""
+
+    paths: set[str] = set()
+    for source in sources:
+        if os.path.isdir(source):
+            for directory, _, file_names in os.walk(source):
+                paths.update(
+                    os.path.join(directory, name) for name in file_names if name.lower().endswith(_SVD_SUFFIXES)
+                )
+        elif glob.has_magic(source):
+            paths.update(path for path in glob.glob(source, recursive=True) if os.path.isfile(path))
+        elif os.path.isfile(source):
+            paths.add(source)
+        else:
+            raise BatchException(f"SVD file or directory '{source}' doesn't exist")
+
+    return sorted(paths)
+
+
+def process_svd_files(
+    paths: Iterable[str],
+    workers: None | int = None,
+    timeout: None | float = None,
+    memory_limit: None | int = None,
+    keep_devices: bool = False,
+) -> Iterator[BatchResult]:
+    """Processes the SVD files in `workers` processes (default: number of CPUs) and yields a `BatchResult` as soon as a
+    file is finished, so the results arrive in the order of completion.
+
+    The diagnostics of a file are collected in its worker and returned with the result. A failing file doesn't affect
+    the others: an exception is returned as error, and a worker exceeding the `timeout` (seconds per file) or exiting
+    unexpectedly is replaced. `memory_limit` limits the address space of each worker in bytes, which makes large
+    allocations fail with a `MemoryError`. The processed devices are only sent back with `keep_devices`.
+    """
+
+    if memory_limit is not None:
+        try:
+            import resource  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as exc:
+            raise BatchException("Memory limits are not supported on this platform") from exc
+
+    pending = deque(paths)
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers < 1:
+        raise BatchException("At least one worker is required")
+
+    idle: list[_Worker] = []
+    # busy workers with their file and the time it was handed over, which is None until a new worker is ready
+    busy: dict[_Worker, tuple[str, None | float]] = {}
+    try:
+        while pending or busy:
+            while pending and len(busy) < workers:
+                worker = idle.pop() if idle else _Worker(memory_limit, keep_devices)
+                path = pending.popleft()
+                worker.connection.send(path)
+                busy[worker] = (path, time.monotonic() if worker.ready else None)
+
+            wait_timeout = None
+            starts = [start for _, start in busy.values() if start is not None]
+            if timeout is not None and starts:
+                wait_timeout = max(0.0, min(starts) + timeout - time.monotonic())
+            wait([w.connection for w in busy] + [w.sentinel for w in busy], wait_timeout)
+
+            now = time.monotonic()
+            for worker, (path, start) in list(busy.items()):
+                if worker.connection.poll():
+                    try:
+                        result = worker.connection.recv()
+                    except EOFError:
+                        exitcode = worker.join()
+                        result = BatchResult(path, now - (start or now), error=f"Worker exited with code {exitcode}")
+                    else:
+                        if not worker.ready:
+                            # the worker has started, so the timeout starts now
+                            worker.ready = True
+                            busy[worker] = (path, time.monotonic())
+                            continue
+                        idle.append(worker)
+                elif not worker.is_alive():
+                    exitcode = worker.join()
+                    result = BatchResult(path, now - (start or now), error=f"Worker exited with code {exitcode}")
+                elif timeout is not None and start is not None and now - start >= timeout:
+                    worker.kill()
+                    result = BatchResult(path, now - start, error=f"Timeout after {timeout} s")
+                else:
+                    continue
+
+                del busy[worker]
+                yield result
+    finally:
+        for worker in idle:
+            worker.stop()
+        for worker in busy:
+            worker.kill()
+
+
+class _Worker:
+    def __init__(self, memory_limit: None | int, keep_devices: bool) -> None:
+        self.connection, child_connection = _CONTEXT.Pipe()
+        self._process = _CONTEXT.Process(
+            target=_work, args=(child_connection, memory_limit, keep_devices), daemon=True
+        )
+        self._process.start()
+        child_connection.close()
+        # set when the worker has sent that it is ready
+        self.ready = False
+
+    @property
+    def sentinel(self) -> int:
+        return self._process.sentinel
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass  # the worker has already exited
+        self.join()
+
+    def kill(self):
+        self._process.kill()
+        self.join()
+
+    def join(self) -> None | int:
+        self._process.join()
+        self.connection.close()
+        return self._process.exitcode
+
+
+def _work(connection: Connection, memory_limit: None | int, keep_devices: bool):
+    if memory_limit is not None:
+        import resource  # pylint: disable=import-outside-toplevel
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    connection.send(None)
+    while (path := connection.recv()) is not None:
+        result = _process_svd_file(path, keep_devices)
+        try:
+            connection.send(result)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # e.g. a device, which can't be sent back
+            connection.send(BatchResult(path, result.duration, result.diagnostics, error=_format_exception(exc)))
+
+
+def _process_svd_file(path: str, keep_devices: bool) -> BatchResult:
+    diagnostics = Diagnostics()
+    start = time.monotonic()
+    try:
+        device = Process.from_svd_file(path, diagnostics=diagnostics).get_processed_device()
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return BatchResult(path, time.monotonic() - start, diagnostics.records, error=_format_exception(exc))
+
+    return BatchResult(path, time.monotonic() - start, diagnostics.records, device if keep_devices else None)
+
+
+def _format_exception(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def main(argv: None | list[str] = None) -> int:
+    """Processes SVD files in parallel and prints a line per file as soon as it is finished."""
+
+    argument_parser = argparse.ArgumentParser(prog="svdsuite-batch", description=main.__doc__)
+    argument_parser.add_argument("sources", nargs="+", help="SVD files, directories or glob patterns")
+    argument_parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    argument_parser.add_argument("--timeout", type=float, default=None, help="timeout per file in seconds")
+    argument_parser.add_argument("--memory-limit", type=int, default=None, help="memory limit per worker in MiB")
+    argument_parser.add_argument("--json", action="store_true", help="print a JSON object per file")
+    args = argument_parser.parse_args(argv)
+
+    try:
+        paths = collect_svd_files(args.sources)
+        results = process_svd_files(
+            paths,
+            workers=args.workers,
+            timeout=args.timeout,
+            memory_limit=args.memory_limit * 1024 * 1024 if args.memory_limit is not None else None,
+        )
+        failed = 0
+        for result in results:
+            failed += not result.ok
+            if args.json:
+                print(json.dumps(_result_to_json(result)), flush=True)
+            else:
+                status = "ok" if result.ok else f"failed ({result.error})"
+                print(
+                    f"{result.path}: {status}, {len(result.diagnostics)} diagnostics, {result.duration:.3f} s",
+                    flush=True,
+                )
+    except BatchException as exc:
+        print(f"svdsuite-batch: {exc}", file=sys.stderr)
+        return 2
+
+    if not args.json:
+        print(f"{len(paths)} files, {failed} failed")
+
+    return 1 if failed else 0
+
+
+def _result_to_json(result: BatchResult) -> dict[str, object]:
+    return {
+        "path": result.path,
+        "ok": result.ok,
+        "error": result.error,
+        "duration": result.duration,
+        "diagnostics": [
+            {
+                "code": d.code.value,
+                "severity": d.severity.value,
+                "message": d.message,
+                "path": d.path,
+                "sourceline": d.sourceline,
+            }
+            for d in result.diagnostics
+        ],
+    }
+
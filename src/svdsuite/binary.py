@@ -0,0 +1,604 @@
+from collections.abc import Callable, Sequence
+from enum import Enum
+from typing import Any, overload
+import mmap
+import struct
+
+from svdsuite.model.binary import (
+    BinaryEnumeratedValue,
+    BinaryEnumeratedValueContainer,
+    BinaryField,
+    BinaryPeripheral,
+    BinaryRegister,
+)
+from svdsuite.model.process import (
+    DefaultEnumeratedValue,
+    Device,
+    EnumeratedValue,
+    EnumeratedValueContainer,
+    Field,
+    Peripheral,
+    Register,
+)
+from svdsuite.model.types import (
+    AccessType,
+    DataTypeType,
+    EnumUsageType,
+    ModifiedWriteValuesType,
+    ProtectionStringType,
+    ReadActionType,
+)
+
+# Layout of a file, all little-endian: the header with the offset and count of each section, followed by the sections,
+# each aligned to 8 bytes. Strings are stored once in the string table and referenced by index. Each element is a
+# fixed-width record, which refers to its children by the index of the first child and their count.
+_MAGIC = b"SVDB"
+# increased whenever the layout changes, files of other versions are rejected
+_FORMAT_VERSION = 1
+_SECTIONS = ("string_offsets", "string_data", "device", "peripherals", "registers", "fields", "containers", "values")
+_HEADER = struct.Struct("<4sHH" + "QQ" * len(_SECTIONS))
+_STRING_OFFSET = struct.Struct("<I")
+# name, vendor, vendor_id, series, version, description, license_text, header_system_filename,
+# header_definitions_prefix, size, access, protection, reset_value, reset_mask, address_unit_bits, width
+_DEVICE = struct.Struct("<9IIBBQQII")
+# name, version, description, alternate_peripheral, group_name, prepend_to_name, append_to_name, header_struct_name,
+# disable_condition, base_address, size, access, protection, reset_value, reset_mask, end_address,
+# end_address_effective, peripheral_size, peripheral_size_effective, first register, register count
+_PERIPHERAL = struct.Struct("<9IQIBBQQQQQQII")
+# name, display_name, description, alternate_group, alternate_register, address_offset, base_address, size, access,
+# protection, data_type, modified_write_values, read_action, reset_value, reset_mask, read_mask, write_mask,
+# reserved_mask, first field, field count
+_REGISTER = struct.Struct("<5IQQIBBBBBQQQQQII")
+# name, description, lsb, msb, access, modified_write_values, read_action, mask, first container, container count
+_FIELD = struct.Struct("<2IIIBBBQII")
+# name, header_enum_name, usage, name, description and width of the default, first value, value count
+_CONTAINER = struct.Struct("<2IB2IIII")
+# name, description, value, dont_care_mask
+_VALUE = struct.Struct("<2IQQ")
+
+_NO_STRING = 0xFFFFFFFF
+_NO_ENUM = 0xFF
+# An integer column (Q) with this bit set holds the index of the integer as hex string in the string table, e.g. for
+# the masks of registers wider than 63 bits.
+_WIDE_INT = 1 << 63
+
+_ACCESS_TYPES = tuple(AccessType)
+_PROTECTION_TYPES = tuple(ProtectionStringType)
+_DATA_TYPES = tuple(DataTypeType)
+_MODIFIED_WRITE_VALUES_TYPES = tuple(ModifiedWriteValuesType)
+_READ_ACTION_TYPES = tuple(ReadActionType)
+_ENUM_USAGE_TYPES = tuple(EnumUsageType)
+
+
+class BinaryFormatException(Exception):
+    pass
+
+
+def write_device_binary(device: Device, path: str):
+    """Writes a processed device to a file in the binary format, which is opened with `open_device_binary`.
+
+    The file holds the device, its peripherals, the registers of each peripheral (including those in clusters), their
+    fields, enumerated value containers and enumerated values. The CPU, the clusters, address blocks, interrupts and
+    write constraints as well as the `parsed` elements are not stored.
+    """
+
+    try:
+        content = _Writer(device).get_content()
+    except struct.error as exc:
+        raise BinaryFormatException(f"Device '{device.name}' can't be stored in the binary format: {exc}") from exc
+
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+def open_device_binary(path: str) -> "BinaryDevice":
+    """Opens a file written by `write_device_binary` through mmap. Only the header is read, each element is read from
+    its record when it is accessed."""
+
+    return BinaryDevice(path)
+
+
+class BinaryDevice:
+    """A processed device in the binary format. The peripherals, registers, fields and enumerated values are read from
+    the memory mapped file on access, so a device uses almost no memory until its elements are used. The file is
+    closed with `close` or at the end of a `with` block, after which the elements can't be accessed anymore.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:
+                raise BinaryFormatException(f"File '{path}' is empty") from exc
+
+        try:
+            self._sections = self._read_header(path)
+        except BinaryFormatException:
+            self._mmap.close()
+            raise
+
+        (
+            name,
+            vendor,
+            vendor_id,
+            series,
+            version,
+            description,
+            license_text,
+            header_system_filename,
+            header_definitions_prefix,
+            self.size,
+            access,
+            protection,
+            reset_value,
+            reset_mask,
+            self.address_unit_bits,
+            self.width,
+        ) = _DEVICE.unpack_from(self._mmap, self._sections["device"][0])
+        self.name: str = self._get_string(name)
+        self.vendor = self._get_optional_string(vendor)
+        self.vendor_id = self._get_optional_string(vendor_id)
+        self.series = self._get_optional_string(series)
+        self.version: str = self._get_string(version)
+        self.description: str = self._get_string(description)
+        self.license_text = self._get_optional_string(license_text)
+        self.header_system_filename = self._get_optional_string(header_system_filename)
+        self.header_definitions_prefix = self._get_optional_string(header_definitions_prefix)
+        self.reset_value = self._get_int(reset_value)
+        self.reset_mask = self._get_int(reset_mask)
+        self.access: AccessType = _ACCESS_TYPES[access]
+        self.protection: ProtectionStringType = _PROTECTION_TYPES[protection]
+        self.peripherals: Sequence[BinaryPeripheral] = _RecordSequence(
+            self._get_peripheral, 0, self._sections["peripherals"][1]
+        )
+
+    def __enter__(self) -> "BinaryDevice":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self):
+        self._mmap.close()
+
+    def _read_header(self, path: str) -> dict[str, tuple[int, int]]:
+        if len(self._mmap) < _HEADER.size:
+            raise BinaryFormatException(f"File '{path}' is too small for the binary format")
+
+        magic, version, _, *offsets_counts = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            raise BinaryFormatException(f"File '{path}' isn't in the binary format")
+        if version != _FORMAT_VERSION:
+            raise BinaryFormatException(
+                f"File '{path}' has version {version} of the binary format, but version {_FORMAT_VERSION} is supported"
+            )
+
+        sections = {name: (offsets_counts[2 * i], offsets_counts[2 * i + 1]) for i, name in enumerate(_SECTIONS)}
+        record_sizes = {
+            "string_offsets": _STRING_OFFSET.size,
+            "string_data": 1,
+            "device": _DEVICE.size,
+            "peripherals": _PERIPHERAL.size,
+            "registers": _REGISTER.size,
+            "fields": _FIELD.size,
+            "containers": _CONTAINER.size,
+            "values": _VALUE.size,
+        }
+        for name, (offset, count) in sections.items():
+            if offset + count * record_sizes[name] > len(self._mmap):
+                raise BinaryFormatException(f"Section '{name}' exceeds file '{path}', which may be truncated")
+
+        return sections
+
+    def _get_string(self, index: int) -> str:
+        offset = self._sections["string_offsets"][0] + index * _STRING_OFFSET.size
+        start, end = struct.unpack_from("<II", self._mmap, offset)
+        data_offset = self._sections["string_data"][0]
+
+        return self._mmap[data_offset + start : data_offset + end].decode()
+
+    def _get_optional_string(self, index: int) -> None | str:
+        return None if index == _NO_STRING else self._get_string(index)
+
+    def _get_int(self, value: int) -> int:
+        return value if value < _WIDE_INT else int(self._get_string(value & ~_WIDE_INT), 16)
+
+    def _unpack(self, record: struct.Struct, section: str, index: int) -> tuple[Any, ...]:
+        return record.unpack_from(self._mmap, self._sections[section][0] + index * record.size)
+
+    def _get_peripheral(self, index: int) -> BinaryPeripheral:
+        (
+            name,
+            version,
+            description,
+            alternate_peripheral,
+            group_name,
+            prepend_to_name,
+            append_to_name,
+            header_struct_name,
+            disable_condition,
+            base_address,
+            size,
+            access,
+            protection,
+            reset_value,
+            reset_mask,
+            end_address,
+            end_address_effective,
+            peripheral_size,
+            peripheral_size_effective,
+            first,
+            count,
+        ) = self._unpack(_PERIPHERAL, "peripherals", index)
+
+        return BinaryPeripheral(
+            name=self._get_string(name),
+            version=self._get_optional_string(version),
+            description=self._get_optional_string(description),
+            alternate_peripheral=self._get_optional_string(alternate_peripheral),
+            group_name=self._get_optional_string(group_name),
+            prepend_to_name=self._get_optional_string(prepend_to_name),
+            append_to_name=self._get_optional_string(append_to_name),
+            header_struct_name=self._get_optional_string(header_struct_name),
+            disable_condition=self._get_optional_string(disable_condition),
+            base_address=self._get_int(base_address),
+            size=size,
+            access=_ACCESS_TYPES[access],
+            protection=_PROTECTION_TYPES[protection],
+            reset_value=self._get_int(reset_value),
+            reset_mask=self._get_int(reset_mask),
+            end_address=self._get_int(end_address),
+            end_address_effective=self._get_int(end_address_effective),
+            peripheral_size=self._get_int(peripheral_size),
+            peripheral_size_effective=self._get_int(peripheral_size_effective),
+            registers=_RecordSequence(self._get_register, first, count),
+        )
+
+    def _get_register(self, index: int) -> BinaryRegister:
+        (
+            name,
+            display_name,
+            description,
+            alternate_group,
+            alternate_register,
+            address_offset,
+            base_address,
+            size,
+            access,
+            protection,
+            data_type,
+            modified_write_values,
+            read_action,
+            reset_value,
+            reset_mask,
+            read_mask,
+            write_mask,
+            reserved_mask,
+            first,
+            count,
+        ) = self._unpack(_REGISTER, "registers", index)
+
+        return BinaryRegister(
+            name=self._get_string(name),
+            display_name=self._get_optional_string(display_name),
+            description=self._get_optional_string(description),
+            alternate_group=self._get_optional_string(alternate_group),
+            alternate_register=self._get_optional_string(alternate_register),
+            address_offset=self._get_int(address_offset),
+            base_address=self._get_int(base_address),
+            size=size,
+            access=_ACCESS_TYPES[access],
+            protection=_PROTECTION_TYPES[protection],
+            data_type=_get_optional_enum(_DATA_TYPES, data_type),
+            modified_write_values=_MODIFIED_WRITE_VALUES_TYPES[modified_write_values],
+            read_action=_get_optional_enum(_READ_ACTION_TYPES, read_action),
+            reset_value=self._get_int(reset_value),
+            reset_mask=self._get_int(reset_mask),
+            read_mask=self._get_int(read_mask),
+            write_mask=self._get_int(write_mask),
+            reserved_mask=self._get_int(reserved_mask),
+            fields=_RecordSequence(self._get_field, first, count),
+        )
+
+    def _get_field(self, index: int) -> BinaryField:
+        name, description, lsb, msb, access, modified_write_values, read_action, mask, first, count = self._unpack(
+            _FIELD, "fields", index
+        )
+
+        return BinaryField(
+            name=self._get_string(name),
+            description=self._get_optional_string(description),
+            lsb=lsb,
+            msb=msb,
+            access=_ACCESS_TYPES[access],
+            modified_write_values=_MODIFIED_WRITE_VALUES_TYPES[modified_write_values],
+            read_action=_get_optional_enum(_READ_ACTION_TYPES, read_action),
+            mask=self._get_int(mask),
+            enumerated_value_containers=_RecordSequence(self._get_container, first, count),
+        )
+
+    def _get_container(self, index: int) -> BinaryEnumeratedValueContainer:
+        name, header_enum_name, usage, default_name, default_description, width, first, count = self._unpack(
+            _CONTAINER, "containers", index
+        )
+        enumerated_values = _RecordSequence(self._get_value, first, count)
+
+        default = None
+        if default_name != _NO_STRING:
+            # the default stands for the values, which aren't covered by the other enumerated values
+            default = DefaultEnumeratedValue(
+                name=self._get_string(default_name),
+                description=self._get_optional_string(default_description),
+                parsed=None,  # type: ignore[arg-type]
+                covered_values=frozenset(v.value for v in enumerated_values if not v.dont_care_mask),
+                width=width,
+                covered_dont_care_values=tuple(
+                    (v.value, v.dont_care_mask) for v in enumerated_values if v.dont_care_mask
+                ),
+            )
+
+        return BinaryEnumeratedValueContainer(
+            name=self._get_optional_string(name),
+            header_enum_name=self._get_optional_string(header_enum_name),
+            usage=_ENUM_USAGE_TYPES[usage],
+            enumerated_values=enumerated_values,
+            default=default,
+        )
+
+    def _get_value(self, index: int) -> BinaryEnumeratedValue:
+        name, description, value, dont_care_mask = self._unpack(_VALUE, "values", index)
+
+        return BinaryEnumeratedValue(
+            name=self._get_string(name),
+            description=self._get_optional_string(description),
+            value=self._get_int(value),
+            dont_care_mask=self._get_int(dont_care_mask),
+        )
+
+
+class _RecordSequence[T](Sequence[T]):
+    # the elements are read on each access and not kept
+    def __init__(self, get_element: Callable[[int], T], first: int, count: int) -> None:
+        self._get_element = get_element
+        self._first = first
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._get_element(self._first + i) for i in range(self._count)[index]]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+
+        return self._get_element(self._first + index)
+
+    def __eq__(self, other: object) -> bool:
+        # the same records of the same file
+        return isinstance(other, _RecordSequence) and (self._get_element, self._first, self._count) == (
+            other._get_element,
+            other._first,
+            other._count,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._first, self._count))
+
+    def __repr__(self) -> str:
+        return f"_RecordSequence(count={self._count})"
+
+
+def _get_optional_enum[T: Enum](members: tuple[T, ...], index: int) -> None | T:
+    return None if index == _NO_ENUM else members[index]
+
+
+def _get_enum_index[T: Enum](members: tuple[T, ...], value: None | T) -> int:
+    return _NO_ENUM if value is None else members.index(value)
+
+
+class _Writer:
+    def __init__(self, device: Device) -> None:
+        self._string_indices: dict[str, int] = {}
+        self._string_offsets = bytearray(_STRING_OFFSET.pack(0))
+        self._string_data = bytearray()
+        self._tables = {name: bytearray() for name in _SECTIONS[3:]}
+        self._counts = dict.fromkeys(_SECTIONS[3:], 0)
+        # The fields of an array, or derived from the same field, have equal containers, which are distinct objects.
+        # Equal lists of container records and of value records are stored once and shared by their range.
+        self._container_ranges: dict[tuple[tuple[Any, ...], ...], tuple[int, int]] = {}
+        self._value_ranges: dict[tuple[tuple[Any, ...], ...], tuple[int, int]] = {}
+
+        for peripheral in device.peripherals:
+            self._add_peripheral(peripheral)
+
+        self._device = _DEVICE.pack(
+            self._add_string(device.name),
+            self._add_optional_string(device.vendor),
+            self._add_optional_string(device.vendor_id),
+            self._add_optional_string(device.series),
+            self._add_string(device.version),
+            self._add_string(device.description),
+            self._add_optional_string(device.license_text),
+            self._add_optional_string(device.header_system_filename),
+            self._add_optional_string(device.header_definitions_prefix),
+            device.size,
+            _get_enum_index(_ACCESS_TYPES, device.access),
+            _get_enum_index(_PROTECTION_TYPES, device.protection),
+            self._add_int(device.reset_value),
+            self._add_int(device.reset_mask),
+            device.address_unit_bits,
+            device.width,
+        )
+
+    def get_content(self) -> bytes:
+        sections = [
+            (self._string_offsets, len(self._string_offsets) // _STRING_OFFSET.size),
+            (self._string_data, len(self._string_data)),
+            (self._device, 1),
+            *((self._tables[name], self._counts[name]) for name in _SECTIONS[3:]),
+        ]
+
+        content = bytearray(_HEADER.size)
+        offsets_counts: list[int] = []
+        for data, count in sections:
+            content.extend(bytes(-len(content) % 8))
+            offsets_counts.extend((len(content), count))
+            content.extend(data)
+        _HEADER.pack_into(content, 0, _MAGIC, _FORMAT_VERSION, 0, *offsets_counts)
+
+        return bytes(content)
+
+    def _add_string(self, value: str) -> int:
+        index = self._string_indices.get(value)
+        if index is None:
+            index = self._string_indices[value] = len(self._string_indices)
+            self._string_data.extend(value.encode())
+            self._string_offsets.extend(_STRING_OFFSET.pack(len(self._string_data)))
+
+        return index
+
+    def _add_optional_string(self, value: None | str) -> int:
+        return _NO_STRING if value is None else self._add_string(value)
+
+    def _add_int(self, value: int) -> int:
+        return value if 0 <= value < _WIDE_INT else _WIDE_INT | self._add_string(hex(value))
+
+    def _add_record(self, table: str, record: struct.Struct, *values: Any) -> int:
+        self._tables[table].extend(record.pack(*values))
+        self._counts[table] += 1
+
+        return self._counts[table] - 1
+
+    def _add_peripheral(self, peripheral: Peripheral):
+        # the registers of a peripheral are consecutive, so they are added before the peripheral itself
+        first = self._counts["registers"]
+        for register in peripheral.registers:
+            self._add_register(register)
+
+        self._add_record(
+            "peripherals",
+            _PERIPHERAL,
+            self._add_string(peripheral.name),
+            self._add_optional_string(peripheral.version),
+            self._add_optional_string(peripheral.description),
+            self._add_optional_string(peripheral.alternate_peripheral),
+            self._add_optional_string(peripheral.group_name),
+            self._add_optional_string(peripheral.prepend_to_name),
+            self._add_optional_string(peripheral.append_to_name),
+            self._add_optional_string(peripheral.header_struct_name),
+            self._add_optional_string(peripheral.disable_condition),
+            self._add_int(peripheral.base_address),
+            peripheral.size,
+            _get_enum_index(_ACCESS_TYPES, peripheral.access),
+            _get_enum_index(_PROTECTION_TYPES, peripheral.protection),
+            self._add_int(peripheral.reset_value),
+            self._add_int(peripheral.reset_mask),
+            self._add_int(peripheral.end_address),
+            self._add_int(peripheral.end_address_effective),
+            self._add_int(peripheral.peripheral_size),
+            self._add_int(peripheral.peripheral_size_effective),
+            first,
+            len(peripheral.registers),
+        )
+
+    def _add_register(self, register: Register):
+        # the fields of all registers are added in the order of the registers, so they are consecutive as well
+        first = self._counts["fields"]
+        fields = [self._pack_field(field) for field in register.fields]
+        for field in fields:
+            self._add_record("fields", _FIELD, *field)
+
+        self._add_record(
+            "registers",
+            _REGISTER,
+            self._add_string(register.name),
+            self._add_optional_string(register.display_name),
+            self._add_optional_string(register.description),
+            self._add_optional_string(register.alternate_group),
+            self._add_optional_string(register.alternate_register),
+            self._add_int(register.address_offset),
+            self._add_int(register.base_address),
+            register.size,
+            _get_enum_index(_ACCESS_TYPES, register.access),
+            _get_enum_index(_PROTECTION_TYPES, register.protection),
+            _get_enum_index(_DATA_TYPES, register.data_type),
+            _get_enum_index(_MODIFIED_WRITE_VALUES_TYPES, register.modified_write_values),
+            _get_enum_index(_READ_ACTION_TYPES, register.read_action),
+            self._add_int(register.reset_value),
+            self._add_int(register.reset_mask),
+            self._add_int(register.read_mask),
+            self._add_int(register.write_mask),
+            self._add_int(register.reserved_mask),
+            first,
+            len(fields),
+        )
+
+    def _pack_field(self, field: Field) -> tuple[Any, ...]:
+        first, count = self._add_containers(field.enumerated_value_containers)
+
+        return (
+            self._add_string(field.name),
+            self._add_optional_string(field.description),
+            field.lsb,
+            field.msb,
+            _get_enum_index(_ACCESS_TYPES, field.access),
+            _get_enum_index(_MODIFIED_WRITE_VALUES_TYPES, field.modified_write_values),
+            _get_enum_index(_READ_ACTION_TYPES, field.read_action),
+            self._add_int(field.mask),
+            first,
+            count,
+        )
+
+    def _add_containers(self, containers: list[EnumeratedValueContainer]) -> tuple[int, int]:
+        records = tuple(self._pack_container(container) for container in containers)
+        return self._add_shared_records("containers", _CONTAINER, records, self._container_ranges)
+
+    def _pack_container(self, container: EnumeratedValueContainer) -> tuple[Any, ...]:
+        values = tuple(self._pack_value(value) for value in container.enumerated_values)
+        first, count = self._add_shared_records("values", _VALUE, values, self._value_ranges)
+
+        default = container.default
+        return (
+            self._add_optional_string(container.name),
+            self._add_optional_string(container.header_enum_name),
+            _get_enum_index(_ENUM_USAGE_TYPES, container.usage),
+            _NO_STRING if default is None else self._add_string(default.name),
+            _NO_STRING if default is None else self._add_optional_string(default.description),
+            0 if default is None else default.width,
+            first,
+            count,
+        )
+
+    def _pack_value(self, value: EnumeratedValue) -> tuple[Any, ...]:
+        return (
+            self._add_string(value.name),
+            self._add_optional_string(value.description),
+            self._add_int(value.value),
+            self._add_int(value.dont_care_mask),
+        )
+
+    def _add_shared_records(
+        self,
+        table: str,
+        record: struct.Struct,
+        records: tuple[tuple[Any, ...], ...],
+        ranges: dict[tuple[tuple[Any, ...], ...], tuple[int, int]],
+    ) -> tuple[int, int]:
+        # the records are consecutive and referenced by the index of the first record and their count
+        if records not in ranges:
+            first = self._counts[table]
+            for values in records:
+                self._add_record(table, record, *values)
+            ranges[records] = (first, len(records))
+
+        return ranges[records]
@@ -0,0 +1,290 @@
+from collections.abc import Iterator
+from functools import cache
+from importlib import metadata
+from typing import Any
+import hashlib
+import io
+import json
+import os
+import pickle
+import tempfile
+import time
+
+from svdsuite.archive import open_svd_file
+from svdsuite.diagnostics import Diagnostic, Diagnostics, DiagnosticsSink, WarningsDiagnostics
+from svdsuite.model.parse import (
+    SVDCPU,
+    SVDAddressBlock,
+    SVDCluster,
+    SVDDevice,
+    SVDDimArrayIndex,
+    SVDEnumeratedValue,
+    SVDEnumeratedValueContainer,
+    SVDField,
+    SVDInterrupt,
+    SVDPeripheral,
+    SVDRegister,
+    SVDSauRegion,
+    SVDSauRegionsConfig,
+    SVDWriteConstraint,
+)
+from svdsuite.model.process import Device
+from svdsuite.parse import Parser
+from svdsuite.process import Process, ProcessWarning
+from svdsuite.util.parser_exception_warning import ParserWarning
+
+# increased whenever the layout of the cache entries changes
+_FORMAT_VERSION = 1
+_SUFFIX = ".pickle"
+# temporary files of a writer that died before renaming them are removed after this time in seconds
+_STALE_TEMPORARY_FILE_AGE = 3600
+
+try:
+    _SVDSUITE_VERSION = metadata.version("svdsuite")
+except metadata.PackageNotFoundError:
+    _SVDSUITE_VERSION = "unknown"
+
+
+@cache
+def _get_source_hash() -> str:
+    # The version of an editable install doesn't change with the code, so the sources of the package are part of the
+    # key as well. Any change of the parser, the process or the models may change the processed device. The sources are
+    # hashed on the first use of a cache, not on import of svdsuite.
+    package_directory = os.path.dirname(os.path.abspath(__file__))
+    source_hash = hashlib.sha256()
+    for directory, directory_names, file_names in os.walk(package_directory):
+        directory_names.sort()
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py"):
+                path = os.path.join(directory, file_name)
+                source_hash.update(os.path.relpath(path, package_directory).encode())
+                with open(path, "rb") as file:
+                    source_hash.update(file.read())
+
+    return source_hash.hexdigest()
+
+
+_PARSED_TYPES = frozenset(
+    {
+        SVDDevice,
+        SVDCPU,
+        SVDSauRegionsConfig,
+        SVDSauRegion,
+        SVDPeripheral,
+        SVDCluster,
+        SVDRegister,
+        SVDField,
+        SVDAddressBlock,
+        SVDInterrupt,
+        SVDWriteConstraint,
+        SVDEnumeratedValueContainer,
+        SVDEnumeratedValue,
+        SVDDimArrayIndex,
+    }
+)
+
+
+class DeviceCache:
+    """On-disk cache of processed devices, keyed by the SHA-256 hash of the SVD content, the svdsuite version, the
+    sources of the svdsuite package and the options, which change the processed device.
+
+    An entry holds the processed device and the diagnostics of the `Parser` and the `Process`, which are reported
+    again on each hit. Without `keep_parsed`, the `parsed` elements of the cached devices are `None`, which makes the
+    entries much smaller and faster to load. The device returned on a miss is read back from the stored entry, so it is
+    the same as on a later hit.
+
+    With `max_size` (in bytes), the least recently used entries are removed once the entries exceed it. Several
+    processes can use the same directory: entries are written to a temporary file and renamed, so an entry is either
+    complete or missing, and an unreadable entry is processed again.
+
+    The entries are pickles, and loading a pickle can execute arbitrary code. Anyone who can write to the directory can
+    therefore run code in every process using the cache. A new directory is only accessible by its owner, an existing
+    directory must not be writable by untrusted users.
+    """
+
+    def __init__(self, directory: str, max_size: None | int = None, keep_parsed: bool = False) -> None:
+        self._directory = directory
+        self._max_size = max_size
+        self._keep_parsed = keep_parsed
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def process_svd_file(
+        self,
+        path: str,
+        member: None | str = None,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ) -> Device:
+        with open_svd_file(path, member) as file:
+            content = file.read()
+
+        return self.process_xml_content(content, diagnostics, peripherals)
+
+    def process_xml_content(
+        self,
+        content: bytes,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ) -> Device:
+        entry_path = os.path.join(self._directory, self._get_key(content, peripherals) + _SUFFIX)
+
+        entry = self._load_entry(entry_path)
+        if entry is None:
+            entry = self._process_and_store(entry_path, content, diagnostics, peripherals)
+        else:
+            parser_records, process_records, _ = entry
+            _report(parser_records, diagnostics, ParserWarning)
+            _report(process_records, diagnostics, ProcessWarning)
+
+        return entry[2]
+
+    def clear(self):
+        for entry in self._iter_entries():
+            _remove(entry.path)
+
+    def _get_key(self, content: bytes, peripherals: None | list[str]) -> str:
+        options = {
+            "format": _FORMAT_VERSION,
+            "svdsuite": _SVDSUITE_VERSION,
+            "source": _get_source_hash(),
+            "keep_parsed": self._keep_parsed,
+            # only the membership of a peripheral name changes the processed device
+            "peripherals": sorted(set(peripherals)) if peripherals is not None else None,
+        }
+        key = hashlib.sha256(json.dumps(options, sort_keys=True).encode())
+        key.update(content)
+
+        return key.hexdigest()
+
+    def _load_entry(self, entry_path: str) -> None | tuple[list[Diagnostic], list[Diagnostic], Device]:
+        try:
+            with open(entry_path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            entry = self._loads(data)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # e.g. a corrupted file, which is replaced by the processed entry
+            return None
+
+        # the modification time orders the entries for the eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass  # the entry has been evicted by another process in the meantime
+
+        return entry
+
+    def _process_and_store(
+        self,
+        entry_path: str,
+        content: bytes,
+        diagnostics: None | DiagnosticsSink,
+        peripherals: None | list[str],
+    ) -> tuple[list[Diagnostic], list[Diagnostic], Device]:
+        # the diagnostics are collected for the entry and reported afterwards, also if the processing fails
+        parser_diagnostics = Diagnostics()
+        process_diagnostics = Diagnostics()
+        try:
+            parsed_device = Parser.from_xml_content(content, diagnostics=parser_diagnostics).get_parsed_device()
+            device = Process(parsed_device, None, process_diagnostics, peripherals=peripherals).get_processed_device()
+        finally:
+            _report(parser_diagnostics.records, diagnostics, ParserWarning)
+            _report(process_diagnostics.records, diagnostics, ProcessWarning)
+
+        data = self._dumps((parser_diagnostics.records, process_diagnostics.records, device))
+        self._store(entry_path, data)
+        if self._max_size is not None:
+            self._evict(self._max_size)
+
+        return self._loads(data)
+
+    def _dumps(self, entry: tuple[list[Diagnostic], list[Diagnostic], Device]) -> bytes:
+        file = io.BytesIO()
+        pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL) if self._keep_parsed else _DropParsedPickler(file)
+        pickler.dump(entry)
+
+        return file.getvalue()
+
+    def _loads(self, data: bytes) -> tuple[list[Diagnostic], list[Diagnostic], Device]:
+        if self._keep_parsed:
+            return pickle.loads(data)
+
+        return _DropParsedUnpickler(io.BytesIO(data)).load()
+
+    def _store(self, entry_path: str, data: bytes):
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, entry_path)
+        except OSError:
+            # e.g. the entry is open in another process on Windows, which has stored the same entry
+            _remove(temporary_path)
+
+    def _evict(self, max_size: int):
+        now = time.time()
+        entries: list[tuple[float, int, str]] = []
+        for entry in self._iter_entries(with_temporary_files=True):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue  # removed by another process in the meantime
+
+            if entry.name.endswith(_SUFFIX):
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+            elif now - stat.st_mtime > _STALE_TEMPORARY_FILE_AGE:
+                _remove(entry.path)
+
+        # the least recently used entries are removed first
+        entries.sort()
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= max_size:
+                break
+            _remove(path)
+            size -= entry_size
+
+    def _iter_entries(self, with_temporary_files: bool = False) -> Iterator[os.DirEntry[str]]:
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(_SUFFIX) or (with_temporary_files and entry.name.endswith(".tmp")):
+                    yield entry
+
+
+class _DropParsedPickler(pickle.Pickler):
+    # the parsed elements are replaced by a reference, which is loaded as None
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+
+    def persistent_id(self, obj: Any) -> None | str:
+        return "parsed" if type(obj) in _PARSED_TYPES else None
+
+
+class _DropParsedUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> None:
+        if pid != "parsed":
+            raise pickle.UnpicklingError(f"Unknown persistent id '{pid}'")
+
+
+def _report(records: list[Diagnostic], diagnostics: None | DiagnosticsSink, category: type[Warning]):
+    # without a sink, the diagnostics are emitted as warnings, as by the `Parser` and the `Process`
+    sink = diagnostics if diagnostics is not None else WarningsDiagnostics(category)
+    if not sink.enabled:
+        return
+
+    for record in records:
+        sink.report(record.code, record.message, record.path, record.sourceline)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass  # removed by another process or still open on Windows
@@ -0,0 +1,144 @@
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum
+import warnings
+
+
+class Severity(Enum):
+    # cosmetic issue, the content is used as intended (e.g. stripped whitespace, ignored 'reserved' elements)
+    INFO = "info"
+    # questionable content, which is used nevertheless
+    WARNING = "warning"
+    # invalid content, which is dropped or replaced by a default value
+    ERROR = "error"
+
+
+class DiagnosticCode(Enum):
+    # parser
+    MULTIPLE_ELEMENTS = "multiple-elements"
+    TEXT_STRIPPED = "text-stripped"
+    ATTRIBUTE_STRIPPED = "attribute-stripped"
+    MISSING_SCHEMA_LOCATION = "missing-schema-location"
+    MISSING_DEVICE_DESCRIPTION = "missing-device-description"
+    MISSING_INTERRUPT_VALUE = "missing-interrupt-value"
+
+    # process
+    BIT_RANGE_SWAPPED = "bit-range-swapped"
+    FIELD_MSB_BELOW_LSB = "field-msb-below-lsb"
+    DIM_WITHOUT_PLACEHOLDER = "dim-without-placeholder"
+    EMPTY_PERIPHERAL = "empty-peripheral"
+    PERIPHERAL_MISALIGNED = "peripheral-misaligned"
+    PERIPHERAL_SIZE_INVALID = "peripheral-size-invalid"
+    ADDRESS_BLOCK_OVERLAP = "address-block-overlap"
+    PERIPHERAL_OVERLAP = "peripheral-overlap"
+    PERIPHERAL_ADDRESS_BLOCK_OVERLAP = "peripheral-address-block-overlap"
+    REGISTER_CLUSTER_SIZE_INVALID = "register-cluster-size-invalid"
+    REGISTER_CLUSTER_MISALIGNED = "register-cluster-misaligned"
+    EMPTY_CLUSTER = "empty-cluster"
+    RESERVED_REGISTER = "reserved-register"
+    REGISTER_OVERLAP = "register-overlap"
+    CLUSTER_OVERLAP = "cluster-overlap"
+    RESERVED_FIELD = "reserved-field"
+    FIELD_EXCEEDS_REGISTER = "field-exceeds-register"
+    ENUMERATED_VALUE_OUT_OF_RANGE = "enumerated-value-out-of-range"
+    RESERVED_ENUMERATED_VALUE = "reserved-enumerated-value"
+    DUPLICATE_ENUMERATED_VALUE_NAME = "duplicate-enumerated-value-name"
+    DUPLICATE_ENUMERATED_VALUE_VALUE = "duplicate-enumerated-value-value"
+    DEFAULT_ENUMERATED_VALUE_WITH_VALUE = "default-enumerated-value-with-value"
+
+    @property
+    def severity(self) -> Severity:
+        return _SEVERITIES.get(self, Severity.WARNING)
+
+
+_SEVERITIES = {
+    DiagnosticCode.TEXT_STRIPPED: Severity.INFO,
+    DiagnosticCode.ATTRIBUTE_STRIPPED: Severity.INFO,
+    DiagnosticCode.RESERVED_REGISTER: Severity.INFO,
+    DiagnosticCode.RESERVED_FIELD: Severity.INFO,
+    DiagnosticCode.RESERVED_ENUMERATED_VALUE: Severity.INFO,
+    DiagnosticCode.MISSING_INTERRUPT_VALUE: Severity.ERROR,
+    DiagnosticCode.PERIPHERAL_SIZE_INVALID: Severity.ERROR,
+    DiagnosticCode.REGISTER_CLUSTER_SIZE_INVALID: Severity.ERROR,
+    DiagnosticCode.ENUMERATED_VALUE_OUT_OF_RANGE: Severity.ERROR,
+    DiagnosticCode.DUPLICATE_ENUMERATED_VALUE_NAME: Severity.ERROR,
+    DiagnosticCode.DUPLICATE_ENUMERATED_VALUE_VALUE: Severity.ERROR,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Diagnostic:
+    code: DiagnosticCode
+    message: str
+    # path of the xml element for parser diagnostics, path of the svd element names for process diagnostics
+    path: None | str = None
+    sourceline: None | int = None
+
+    @property
+    def severity(self) -> Severity:
+        return self.code.severity
+
+
+class DiagnosticsSink:
+    """Receives the diagnostics of the `Parser` and the `Process`.
+
+    The message and path of a diagnostic are only built if the sink is `enabled`, so a disabled sink costs a single
+    attribute lookup per detected problem.
+    """
+
+    enabled = True
+
+    def report(self, code: DiagnosticCode, message: str, path: None | str = None, sourceline: None | int = None):
+        raise NotImplementedError
+
+
+class WarningsDiagnostics(DiagnosticsSink):
+    """Emits each diagnostic as a warning of the given category. This is the default of the `Parser` (`ParserWarning`)
+    and the `Process` (`ProcessWarning`)."""
+
+    def __init__(self, category: type[Warning]) -> None:
+        self._category = category
+
+    def report(self, code: DiagnosticCode, message: str, path: None | str = None, sourceline: None | int = None):
+        # the warning is attributed to the reporting line in the parser or process, as before the sinks existed
+        warnings.warn(message, self._category, stacklevel=2)
+
+
+class NullDiagnostics(DiagnosticsSink):
+    """Drops all diagnostics without building them."""
+
+    enabled = False
+
+    def report(self, code: DiagnosticCode, message: str, path: None | str = None, sourceline: None | int = None):
+        pass
+
+
+class Diagnostics(DiagnosticsSink):
+    """Collects the diagnostics of the `Parser` and the `Process`.
+
+    Unlike warnings, repeated diagnostics are never filtered. With `keep_records=False`, only the counts per code are
+    kept, which bounds the memory for dirty vendor files.
+    """
+
+    def __init__(self, keep_records: bool = True) -> None:
+        self._keep_records = keep_records
+        self._records: list[Diagnostic] = []
+        self._counts: Counter[DiagnosticCode] = Counter()
+
+    @property
+    def records(self) -> list[Diagnostic]:
+        return self._records
+
+    def report(self, code: DiagnosticCode, message: str, path: None | str = None, sourceline: None | int = None):
+        self._counts[code] += 1
+
+        if self._keep_records:
+            self._records.append(Diagnostic(code, message, path, sourceline))
+
+    def summary(self) -> dict[DiagnosticCode, int]:
+        """Returns the number of diagnostics per code, most frequent first."""
+
+        return dict(self._counts.most_common())
+
+    def count(self, severity: None | Severity = None) -> int:
+        return sum(n for code, n in self._counts.items() if severity is None or code.severity is severity)
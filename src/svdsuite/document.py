@@ -0,0 +1,61 @@
+import lxml.etree
+
+from svdsuite.util.xml_parse import safe_fromstring
+from svdsuite.archive import open_svd_file
+
+
+class DocumentException(Exception):
+    pass
+
+
+class SVDDocument:
+    """Holds the raw bytes and the lxml tree of one SVD file.
+
+    The file is read and parsed once, so that the Validator, Parser, Process and PeripheralRegisterMap can share the
+    same tree. The raw buffer is released by the Parser as soon as the SVDDevice has been built.
+    """
+
+    @classmethod
+    def from_svd_file(cls, path: str, member: None | str = None):
+        with open_svd_file(path, member) as file:
+            return cls(file.read(), path)
+
+    @classmethod
+    def from_xml_str(cls, xml_str: str):
+        return cls(xml_str.encode())
+
+    @classmethod
+    def from_xml_content(cls, content: bytes):
+        return cls(content)
+
+    def __init__(self, content: bytes, path: None | str = None) -> None:
+        self._content: None | bytes = content
+        self._path = path
+        self._tree: None | lxml.etree._ElementTree = None  # pyright: ignore[reportPrivateUsage]
+
+    @property
+    def path(self) -> None | str:
+        return self._path
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            raise DocumentException("Content of the document has already been released")
+
+        return self._content
+
+    @property
+    def is_content_released(self) -> bool:
+        return self._content is None
+
+    @property
+    def tree(self) -> lxml.etree._ElementTree:  # pyright: ignore[reportPrivateUsage]
+        if self._tree is None:
+            self._tree = safe_fromstring(self.content, base_url=self._path).getroottree()
+
+        return self._tree
+
+    def release_content(self):
+        # the tree is built before the buffer is dropped, since it can't be built afterwards
+        _ = self.tree
+        self._content = None
@@ -1,21 +1,49 @@
+from collections.abc import Buffer
+
+from svdsuite.cache import DeviceCache
 from svdsuite.process import Process
+from svdsuite.document import SVDDocument
 from svdsuite.model.map import MapPeripheral, MapRegister
 from svdsuite.model.process import Device, Peripheral, Cluster, Register, AddressBlock
 
 
 class PeripheralRegisterMap:
     @classmethod
-    def from_svd_file(cls, path: str, resolver_logging_file_path: None | str = None):
-        return cls(Process.from_svd_file(path, resolver_logging_file_path).get_processed_device())
+    def from_svd_file(
+        cls,
+        path: str,
+        resolver_logging_file_path: None | str = None,
+        member: None | str = None,
+        cache: None | DeviceCache = None,
+    ):
+        # the resolver only writes its log while processing, so a requested log bypasses the cache
+        if cache is not None and resolver_logging_file_path is None:
+            return cls(cache.process_svd_file(path, member))
+        return cls(Process.from_svd_file(path, resolver_logging_file_path, member).get_processed_device())
 
     @classmethod
-    def from_xml_str(cls, xml_str: str, resolver_logging_file_path: None | str = None):
-        return cls(Process.from_xml_content(xml_str.encode(), resolver_logging_file_path).get_processed_device())
+    def from_xml_str(
+        cls, xml_str: str, resolver_logging_file_path: None | str = None, cache: None | DeviceCache = None
+    ):
+        return cls.from_xml_content(xml_str.encode(), resolver_logging_file_path, cache)
 
     @classmethod
-    def from_xml_content(cls, content: bytes, resolver_logging_file_path: None | str = None):
+    def from_xml_content(
+        cls, content: bytes, resolver_logging_file_path: None | str = None, cache: None | DeviceCache = None
+    ):
+        # the resolver only writes its log while processing, so a requested log bypasses the cache
+        if cache is not None and resolver_logging_file_path is None:
+            return cls(cache.process_xml_content(content))
         return cls(Process.from_xml_content(content, resolver_logging_file_path).get_processed_device())
 
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, resolver_logging_file_path: None | str = None):
+        return cls(Process.from_buffer(buffer, resolver_logging_file_path).get_processed_device())
+
+    @classmethod
+    def from_document(cls, document: SVDDocument, resolver_logging_file_path: None | str = None):
+        return cls(Process.from_document(document, resolver_logging_file_path).get_processed_device())
+
     def __init__(self, processed_device: Device) -> None:
         self.peripheral_map = self._build_map(processed_device)
 
@@ -0,0 +1,105 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from svdsuite.model.process import DefaultEnumeratedValue
+from svdsuite.model.types import (
+    AccessType,
+    DataTypeType,
+    EnumUsageType,
+    ModifiedWriteValuesType,
+    ProtectionStringType,
+    ReadActionType,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryEnumeratedValue:
+    name: str
+    description: None | str
+    value: int
+    dont_care_mask: int
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryEnumeratedValueContainer:
+    name: None | str
+    header_enum_name: None | str
+    usage: EnumUsageType
+    enumerated_values: Sequence[BinaryEnumeratedValue]  # without the values of default
+    default: None | DefaultEnumeratedValue  # its `parsed` is None
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryField:
+    name: str
+    description: None | str
+    lsb: int
+    msb: int
+    access: AccessType
+    modified_write_values: ModifiedWriteValuesType
+    read_action: None | ReadActionType
+    mask: int
+    enumerated_value_containers: Sequence[BinaryEnumeratedValueContainer]
+
+    @property
+    def bit_offset(self) -> int:
+        return self.lsb
+
+    @property
+    def bit_width(self) -> int:
+        return self.msb - self.lsb + 1
+
+    @property
+    def bit_range(self) -> tuple[int, int]:
+        return (self.msb, self.lsb)
+
+    @property
+    def shift(self) -> int:
+        return self.lsb
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryRegister:
+    name: str
+    display_name: None | str
+    description: None | str
+    alternate_group: None | str
+    alternate_register: None | str
+    address_offset: int
+    base_address: int
+    size: int
+    access: AccessType
+    protection: ProtectionStringType
+    data_type: None | DataTypeType
+    modified_write_values: ModifiedWriteValuesType
+    read_action: None | ReadActionType
+    reset_value: int
+    reset_mask: int
+    read_mask: int
+    write_mask: int
+    reserved_mask: int
+    fields: Sequence[BinaryField]
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryPeripheral:
+    name: str
+    version: None | str
+    description: None | str
+    alternate_peripheral: None | str
+    group_name: None | str
+    prepend_to_name: None | str
+    append_to_name: None | str
+    header_struct_name: None | str
+    disable_condition: None | str
+    base_address: int
+    size: int
+    access: AccessType
+    protection: ProtectionStringType
+    reset_value: int
+    reset_mask: int
+    end_address: int
+    end_address_effective: int
+    peripheral_size: int
+    peripheral_size_effective: int
+    registers: Sequence[BinaryRegister]  # all registers of the peripheral, including those in clusters
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Any, Callable, overload
 
 from svdsuite.model.types import (
     AccessType,
@@ -14,6 +15,47 @@ from svdsuite.model.types import (
 )
 
 
+class LazyList[T]:
+    """Placeholder for the content of a lazily parsed list field, which is loaded on first access."""
+
+    def __init__(self, loader: Callable[[], list[T]]) -> None:
+        self._loader = loader
+
+    def load(self) -> list[T]:
+        return self._loader()
+
+
+class _LazyListField[T]:
+    """Data descriptor for a list field that accepts a `LazyList`, which is replaced by its content on first access.
+
+    The default of the field is an empty list.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, instance: None, owner: None | type = None) -> None: ...
+
+    @overload
+    def __get__(self, instance: object, owner: None | type = None) -> list[T]: ...
+
+    def __get__(self, instance: object, owner: None | type = None) -> None | list[T]:
+        # dataclass asks the class for the default value of the field
+        if instance is None:
+            return None
+
+        value: list[T] | LazyList[T] = instance.__dict__[self._name]
+        if isinstance(value, LazyList):
+            value = value.load()
+            instance.__dict__[self._name] = value
+
+        return value
+
+    def __set__(self, instance: Any, value: None | list[T] | LazyList[T]) -> None:
+        instance.__dict__[self._name] = [] if value is None else value
+
+
 @dataclass(kw_only=True)
 class SVDSauRegion:
     enabled: None | bool = None
@@ -184,7 +226,7 @@ class SVDPeripheral(_SVDDimElementGroup, _SVDRegisterPropertiesGroup):
     base_address: int
     address_blocks: list[SVDAddressBlock] = field(default_factory=list)
     interrupts: list[SVDInterrupt] = field(default_factory=list)
-    registers_clusters: list[SVDRegister | SVDCluster] = field(default_factory=list)
+    registers_clusters: _LazyListField[SVDRegister | SVDCluster] = _LazyListField()
     derived_from: None | str = None
     parent: "None | SVDDevice" = None
 
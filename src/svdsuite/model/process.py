@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass, fields as dataclass_fields
 
 from svdsuite.model.types import (
@@ -30,6 +31,11 @@ from svdsuite.model.parse import (
     SVDWriteConstraint,
 )
 
+_READABLE_ACCESS_TYPES = frozenset({AccessType.READ_ONLY, AccessType.READ_WRITE, AccessType.READ_WRITE_ONCE})
+_WRITABLE_ACCESS_TYPES = frozenset(
+    {AccessType.WRITE_ONLY, AccessType.READ_WRITE, AccessType.WRITE_ONCE, AccessType.READ_WRITE_ONCE}
+)
+
 
 def reg_prop_validator(
     size: None | int,
@@ -106,24 +112,101 @@ class EnumeratedValueBase:
     parsed: SVDEnumeratedValue
 
 
+def iter_dont_care_values(value: int, dont_care_mask: int) -> Iterator[int]:
+    # each value with the bits of value, except the ones in dont_care_mask, in ascending order
+    subset = 0
+    while True:
+        yield value | subset
+        if subset == dont_care_mask:
+            return
+        subset = (subset - dont_care_mask) & dont_care_mask
+
+
 @dataclass
 class IEnumeratedValue(EnumeratedValueBase):
     value: None | int
     is_default: bool
+    dont_care_mask: int = 0
 
 
 @dataclass
 class EnumeratedValue(EnumeratedValueBase):
     value: int
+    # The bits of value which are marked with 'x' (do not care), which are 0 in value. The enumerated value stands for
+    # each value with the other bits of value, e.g. `0b1x` for 2 and 3, without listing them.
+    dont_care_mask: int = 0
 
     def __repr__(self):
+        if self.dont_care_mask:
+            return f"EnumeratedValue(name={self.name}, value={self.value}, dont_care_mask={self.dont_care_mask})"
         return f"EnumeratedValue(name={self.name}, value={self.value})"
 
     @classmethod
     def from_intermediate_enum_value(cls, i_enum_value: IEnumeratedValue, value: int) -> "EnumeratedValue":
         base_kwargs = {field.name: getattr(i_enum_value, field.name) for field in dataclass_fields(EnumeratedValueBase)}
 
-        return cls(**base_kwargs, value=value)
+        return cls(**base_kwargs, value=value, dont_care_mask=i_enum_value.dont_care_mask)
+
+    def matches(self, value: int) -> bool:
+        return value & ~self.dont_care_mask == self.value
+
+    def expand(self) -> Iterator["EnumeratedValue"]:
+        # one enumerated value per value, named `<name>_<value>` if there are do not care bits, lazily, sorted by value
+        if not self.dont_care_mask:
+            yield self
+            return
+
+        for value in iter_dont_care_values(self.value, self.dont_care_mask):
+            yield EnumeratedValue(
+                name=f"{self.name}_{value}", description=self.description, parsed=self.parsed, value=value
+            )
+
+
+@dataclass
+class DefaultEnumeratedValue(EnumeratedValueBase):
+    # The `isDefault` enumerated value of a container, which stands for each value of the field that isn't covered by
+    # another enumerated value, e.g. `name_5` for 5. It is kept as the complement of the covered values, instead of
+    # 2^width enumerated values.
+    covered_values: frozenset[int]
+    width: int
+    # (value, dont_care_mask) of the covered enumerated values with do not care bits, which don't overlap
+    covered_dont_care_values: tuple[tuple[int, int], ...] = ()
+
+    def __repr__(self):
+        return f"DefaultEnumeratedValue(name={self.name}, size={self.size})"
+
+    def __contains__(self, value: object) -> bool:
+        return (
+            isinstance(value, int)
+            and 0 <= value < 1 << self.width
+            and value not in self.covered_values
+            and not self._is_covered_by_dont_care_value(value)
+        )
+
+    def __iter__(self) -> Iterator[EnumeratedValue]:
+        # lazily, sorted by value
+        start = 0
+        for covered_value in [*sorted(self.covered_values), 1 << self.width]:
+            for value in range(start, covered_value):
+                if not self._is_covered_by_dont_care_value(value):
+                    yield self.get_enumerated_value(value)
+            start = covered_value + 1
+
+    @property
+    def size(self) -> int:
+        covered_dont_care_count = sum(1 << mask.bit_count() for _, mask in self.covered_dont_care_values)
+        return (1 << self.width) - len(self.covered_values) - covered_dont_care_count
+
+    def _is_covered_by_dont_care_value(self, value: int) -> bool:
+        return any(value & ~mask == covered_value for covered_value, mask in self.covered_dont_care_values)
+
+    def get_enumerated_value(self, value: int) -> EnumeratedValue:
+        if value not in self:
+            raise ValueError(f"Value '{value}' is not covered by default enumerated value '{self.name}'")
+
+        return EnumeratedValue(
+            name=f"{self.name}_{value}", description=self.description, parsed=self.parsed, value=value
+        )
 
 
 @dataclass
@@ -187,21 +270,26 @@ class EnumeratedValueContainerBase:
 @dataclass
 class IEnumeratedValueContainer(EnumeratedValueContainerBase):
     enumerated_values: list[IEnumeratedValue]
+    default: None | IEnumeratedValue
 
 
 @dataclass
 class EnumeratedValueContainer(EnumeratedValueContainerBase):
-    enumerated_values: list[EnumeratedValue]
+    enumerated_values: list[EnumeratedValue]  # without the values of default
+    default: None | DefaultEnumeratedValue = None
 
     def __repr__(self):
         return (
             f"EnumeratedValueContainer(name={self.name}, header_enum_name={self.header_enum_name}, "
-            f"usage={self.usage}, enumerated_values={self.enumerated_values})"
+            f"usage={self.usage}, enumerated_values={self.enumerated_values}, default={self.default})"
         )
 
     @classmethod
     def from_intermediate_enum_value_container(
-        cls, i_enum_container: IEnumeratedValueContainer, enumerated_values: list[EnumeratedValue]
+        cls,
+        i_enum_container: IEnumeratedValueContainer,
+        enumerated_values: list[EnumeratedValue],
+        default: None | DefaultEnumeratedValue = None,
     ) -> "EnumeratedValueContainer":
         base_kwargs = {
             field.name: getattr(i_enum_container, field.name)
@@ -211,8 +299,30 @@ class EnumeratedValueContainer(EnumeratedValueContainerBase):
         return cls(
             **base_kwargs,
             enumerated_values=enumerated_values,
+            default=default,
         )
 
+    def get_expanded_enumerated_values(self) -> list[EnumeratedValue]:
+        # one enumerated value per value, including the ones of default, sorted by value
+        enumerated_values = [
+            value for enumerated_value in self.enumerated_values for value in enumerated_value.expand()
+        ]
+        if self.default is not None:
+            enumerated_values.extend(self.default)
+
+        return sorted(enumerated_values, key=lambda enumerated_value: enumerated_value.value)
+
+    def get_enumerated_value(self, value: int) -> None | EnumeratedValue:
+        # the enumerated value which stands for value, independent of the number of do not care bits
+        for enumerated_value in self.enumerated_values:
+            if enumerated_value.matches(value):
+                return enumerated_value
+
+        if self.default is not None and value in self.default:
+            return self.default.get_enumerated_value(value)
+
+        return None
+
 
 @dataclass
 class FieldBase:
@@ -241,6 +351,9 @@ class Field(FieldBase):
     bit_offset: int
     bit_width: int
     bit_range: tuple[int, int]
+    # the bits of the field within the register, e.g. `(value & mask) >> shift` reads the field from a register value
+    mask: int
+    shift: int
     enumerated_value_containers: list[EnumeratedValueContainer]
 
     def __repr__(self):
@@ -261,6 +374,8 @@ class Field(FieldBase):
             bit_offset=i_field.lsb,
             bit_width=i_field.msb - i_field.lsb + 1,
             bit_range=(i_field.msb, i_field.lsb),
+            mask=((1 << max(i_field.msb - i_field.lsb + 1, 0)) - 1) << i_field.lsb,
+            shift=i_field.lsb,
             enumerated_value_containers=enumerated_value_containers,
         )
 
@@ -302,6 +417,11 @@ class Register(RegisterBase):
     reset_mask: int
     fields: list[Field]
     base_address: int
+    # The bits of the register, which are readable, writable or not covered by a field. A register without fields is
+    # accessed as a whole.
+    read_mask: int
+    write_mask: int
+    reserved_mask: int
 
     def __repr__(self):
         return f"Register(name={self.name}, base_address=0x{self.base_address:08X})"
@@ -323,6 +443,20 @@ class Register(RegisterBase):
             i_register.reset_mask,
         )
 
+        register_mask = (1 << size) - 1
+        if fields:
+            read_mask = write_mask = field_mask = 0
+            for field in fields:
+                if field.access in _READABLE_ACCESS_TYPES:
+                    read_mask |= field.mask
+                if field.access in _WRITABLE_ACCESS_TYPES:
+                    write_mask |= field.mask
+                field_mask |= field.mask
+        else:
+            read_mask = register_mask if access in _READABLE_ACCESS_TYPES else 0
+            write_mask = register_mask if access in _WRITABLE_ACCESS_TYPES else 0
+            field_mask = register_mask
+
         return cls(
             **base_kwargs,
             size=size,
@@ -332,6 +466,9 @@ class Register(RegisterBase):
             reset_mask=reset_mask,
             fields=fields,
             base_address=base_address,
+            read_mask=read_mask & register_mask,
+            write_mask=write_mask & register_mask,
+            reserved_mask=register_mask & ~field_mask,
         )
 
 
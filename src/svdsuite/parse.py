@@ -1,5 +1,8 @@
+import io
 import warnings
-from typing import Literal, Optional, overload
+from collections.abc import Buffer
+from functools import partial
+from typing import BinaryIO, Iterator, Literal, Optional, overload
 
 import lxml.etree
 
@@ -12,6 +15,7 @@ from svdsuite.model.parse import (
     SVDEnumeratedValueContainer,
     SVDEnumeratedValue,
     SVDField,
+    LazyList,
     SVDInterrupt,
     SVDPeripheral,
     SVDRegister,
@@ -33,10 +37,16 @@ from svdsuite.model.types import (
     SauAccessType,
 )
 from svdsuite.util.parser_exception_warning import ParserException, ParserWarning, custom_warning_format
-from svdsuite.util.xml_parse import safe_parse, safe_fromstring
+from svdsuite.diagnostics import DiagnosticCode, DiagnosticsSink, WarningsDiagnostics
+from svdsuite.util.xml_parse import safe_parse, safe_fromstring, safe_frombuffer, safe_iterparse
+from svdsuite.document import SVDDocument
+from svdsuite.archive import open_svd_file
 
 warnings.formatwarning = custom_warning_format
 
+# Number of bytes used to sniff the encoding if only the device header is read
+_PEEK_SNIFF_SIZE = 1 << 15
+
 
 @overload
 def _to_bool(value: str, default: None = None) -> bool: ...
@@ -96,30 +106,49 @@ def _to_int(value: None | str, base: int = 0) -> None | int:
             raise NotImplementedError(f"can't parse value '{value}' in function _to_int") from exc
 
 
-class Parser:
-    @classmethod
-    def from_svd_file(cls, path: str):
-        return cls(safe_parse(path))
+class _ChildElements:
+    """Child elements of an element, grouped by tag in a single pass.
 
-    @staticmethod
-    def from_xml_str(xml_str: str):
-        return Parser.from_xml_content(xml_str.encode())
+    Parsing an element looks up many different tags among the same children. Grouping them once replaces a `findall`
+    scan over all children for every tag with a dictionary lookup.
+    """
 
-    @classmethod
-    def from_xml_content(cls, content: bytes):
-        return cls(safe_fromstring(content).getroottree())
+    __slots__ = ("_elements_by_tag",)
 
-    def __init__(self, tree: lxml.etree._ElementTree) -> None:  # pyright: ignore[reportPrivateUsage]
-        self._parsed_device = self._parse_device(tree.getroot())
+    def __init__(self, element: lxml.etree._Element) -> None:  # pyright: ignore[reportPrivateUsage]
+        self._elements_by_tag: dict[str, list[lxml.etree._Element]] = {}  # pyright: ignore[reportPrivateUsage]
 
-    def get_parsed_device(self) -> SVDDevice:
-        return self._parsed_device
+        for child in element:
+            # comments and processing instructions don't have a string tag and are never looked up
+            self._elements_by_tag.setdefault(child.tag, []).append(child)  # type: ignore[arg-type]
+
+    def find(self, tag: str) -> None | lxml.etree._Element:  # pyright: ignore[reportPrivateUsage]
+        elements = self._elements_by_tag.get(tag)
+        return elements[0] if elements else None
+
+    def findall(self, tag: str) -> list[lxml.etree._Element]:  # pyright: ignore[reportPrivateUsage]
+        return self._elements_by_tag.get(tag, [])
+
+
+def _element_path(element: lxml.etree._Element) -> str:  # pyright: ignore[reportPrivateUsage]
+    tags: list[str] = []
+    while element is not None:
+        tags.append(element.tag)  # type: ignore[arg-type]
+        element = element.getparent()  # type: ignore[assignment]
+
+    return "/" + "/".join(reversed(tags))
+
+
+class _ElementParser:
+    # if set, the registers and clusters of a peripheral are parsed on first access of `registers_clusters`
+    _lazy = False
+    _diagnostics: DiagnosticsSink = WarningsDiagnostics(ParserWarning)
 
     @overload
     def _parse_element_text(
         self,
         element_name: str,
-        parent: lxml.etree._Element,  # pyright: ignore[reportPrivateUsage]
+        children: _ChildElements,
         strip: bool = True,
         optional: Literal[False] = False,
     ) -> str: ...
@@ -128,7 +157,7 @@ class Parser:
     def _parse_element_text(
         self,
         element_name: str,
-        parent: lxml.etree._Element,  # pyright: ignore[reportPrivateUsage]
+        children: _ChildElements,
         strip: bool = True,
         optional: Literal[True] = True,
     ) -> None | str: ...
@@ -136,19 +165,21 @@ class Parser:
     def _parse_element_text(
         self,
         element_name: str,
-        parent: lxml.etree._Element,  # pyright: ignore[reportPrivateUsage]
+        children: _ChildElements,
         strip: bool = True,
         optional: bool = False,
     ) -> None | str:
-        elements = parent.findall(element_name)
+        elements = children.findall(element_name)
 
-        if len(elements) > 1:
+        if len(elements) > 1 and self._diagnostics.enabled:
             texts = ", ".join([x.text for x in elements])  # type: ignore[union-attr]
             lines = ", ".join([str(x.sourceline) for x in elements])
-            warnings.warn(
+            self._diagnostics.report(
+                DiagnosticCode.MULTIPLE_ELEMENTS,
                 f"Multiple elements '{element_name}' with texts '{texts}' found at svd file source lines '{lines}'. "
                 "To be compatible with SVDConv, only the last one will be used",
-                ParserWarning,
+                _element_path(elements[-1]),
+                elements[-1].sourceline,
             )
 
         if not elements:
@@ -169,10 +200,12 @@ class Parser:
 
         text_after_strip = text_before_strip.strip()
 
-        if text_before_strip != text_after_strip:
-            warnings.warn(
+        if self._diagnostics.enabled and text_before_strip != text_after_strip:
+            self._diagnostics.report(
+                DiagnosticCode.TEXT_STRIPPED,
                 f"Element '{element_name}' has been stripped from '{text_before_strip}' to '{text_after_strip}'",
-                ParserWarning,
+                _element_path(element),
+                element.sourceline,
             )
 
         return text_after_strip
@@ -214,49 +247,62 @@ class Parser:
 
         attr_after_strip = attr_before_strip.strip()
 
-        if attr_before_strip != attr_after_strip:
-            warnings.warn(
+        if self._diagnostics.enabled and attr_before_strip != attr_after_strip:
+            self._diagnostics.report(
+                DiagnosticCode.ATTRIBUTE_STRIPPED,
                 f"Attribute '{attribute_name}' has been stripped from '{attr_before_strip}' to '{attr_after_strip}'",
-                ParserWarning,
+                _element_path(element),
+                element.sourceline,
             )
 
         return attr_after_strip
 
-    def _parse_device(self, device_element: lxml.etree._Element) -> SVDDevice:  # pyright: ignore[reportPrivateUsage]
+    def _parse_device_header(
+        self, device_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
+    ) -> SVDDevice:
         try:
             ns_key = "xs" if "xs" in device_element.nsmap else "xsi"
             xs_no_namesp = self._parse_element_attribute(
                 f"{{{device_element.nsmap[ns_key]}}}noNamespaceSchemaLocation", device_element, optional=False
             )
         except (ParserException, KeyError):
-            warnings.warn(
-                "Can't find noNamespaceSchemaLocation attribute in the device element. Set to empty string",
-                ParserWarning,
-            )
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.MISSING_SCHEMA_LOCATION,
+                    "Can't find noNamespaceSchemaLocation attribute in the device element. Set to empty string",
+                    _element_path(device_element),
+                    device_element.sourceline,
+                )
             xs_no_namesp = ""
 
+        device_children = _ChildElements(device_element)
         schema_version = self._parse_element_attribute("schemaVersion", device_element, optional=False)
-        vendor = self._parse_element_text("vendor", device_element, optional=True)
-        vendor_id = self._parse_element_text("vendorID", device_element, optional=True)
-        name = self._parse_element_text("name", device_element, optional=False)
-        series = self._parse_element_text("series", device_element, optional=True)
-        version = self._parse_element_text("version", device_element, optional=False)
+        vendor = self._parse_element_text("vendor", device_children, optional=True)
+        vendor_id = self._parse_element_text("vendorID", device_children, optional=True)
+        name = self._parse_element_text("name", device_children, optional=False)
+        series = self._parse_element_text("series", device_children, optional=True)
+        version = self._parse_element_text("version", device_children, optional=False)
 
         # dirty hack to handle the case where description is not present although it is required
         # (e.g. DialogSemiconductor.DA1468x_DFP.1.1.3/DA14681.svd)
-        description = self._parse_element_text("description", device_element, strip=False, optional=True)
+        description = self._parse_element_text("description", device_children, strip=False, optional=True)
         if description is None:
-            warnings.warn("Mandatory description is missing in the device element. Set to empty string", ParserWarning)
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.MISSING_DEVICE_DESCRIPTION,
+                    "Mandatory description is missing in the device element. Set to empty string",
+                    _element_path(device_element),
+                    device_element.sourceline,
+                )
             description = ""
 
-        license_text = self._parse_element_text("licenseText", device_element, strip=False, optional=True)
-        cpu = self._parse_cpu(device_element)
-        header_system_filename = self._parse_element_text("headerSystemFilename", device_element, optional=True)
-        header_definitions_prefix = self._parse_element_text("headerDefinitionsPrefix", device_element, optional=True)
-        address_unit_bits = _to_int(self._parse_element_text("addressUnitBits", device_element, optional=False))
-        width = _to_int(self._parse_element_text("width", device_element, optional=False))
-        size, access, protection, reset_value, reset_mask = self._parse_register_properties(device_element)
-        peripherals = self._parse_peripherals(device_element)
+        license_text = self._parse_element_text("licenseText", device_children, strip=False, optional=True)
+        cpu = self._parse_cpu(device_children)
+        header_system_filename = self._parse_element_text("headerSystemFilename", device_children, optional=True)
+        header_definitions_prefix = self._parse_element_text("headerDefinitionsPrefix", device_children, optional=True)
+        address_unit_bits = _to_int(self._parse_element_text("addressUnitBits", device_children, optional=False))
+        width = _to_int(self._parse_element_text("width", device_children, optional=False))
+        size, access, protection, reset_value, reset_mask = self._parse_register_properties(device_children)
 
         device = SVDDevice(
             xs_no_namespace_schema_location=xs_no_namesp,
@@ -278,25 +324,21 @@ class Parser:
             protection=protection,
             reset_value=reset_value,
             reset_mask=reset_mask,
-            peripherals=peripherals,
         )
 
         if device.cpu is not None:
             device.cpu.parent = device
 
-        for peripheral in device.peripherals:
-            peripheral.parent = device
-
         return device
 
     def _parse_register_properties(
-        self, element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
+        self, children: _ChildElements
     ) -> tuple[Optional[int], Optional[AccessType], Optional[ProtectionStringType], Optional[int], Optional[int]]:
-        size = _to_int(self._parse_element_text("size", element, optional=True))
-        access = self._parse_element_text("access", element, optional=True)
-        protection = self._parse_element_text("protection", element, optional=True)
-        reset_value = _to_int(self._parse_element_text("resetValue", element, optional=True))
-        reset_mask = _to_int(self._parse_element_text("resetMask", element, optional=True))
+        size = _to_int(self._parse_element_text("size", children, optional=True))
+        access = self._parse_element_text("access", children, optional=True)
+        protection = self._parse_element_text("protection", children, optional=True)
+        reset_value = _to_int(self._parse_element_text("resetValue", children, optional=True))
+        reset_mask = _to_int(self._parse_element_text("resetMask", children, optional=True))
 
         if access is not None:
             access = AccessType.from_str(access)
@@ -306,31 +348,33 @@ class Parser:
 
         return size, access, protection, reset_value, reset_mask
 
-    def _parse_cpu(self, device_element: lxml.etree._Element) -> None | SVDCPU:  # pyright: ignore[reportPrivateUsage]
-        cpu_element = device_element.find("cpu")
+    def _parse_cpu(self, device_children: _ChildElements) -> None | SVDCPU:
+        cpu_element = device_children.find("cpu")
 
         if cpu_element is None:
             return None
 
-        name = CPUNameType.from_str(self._parse_element_text("name", cpu_element, optional=False))
-        revision = self._parse_element_text("revision", cpu_element, optional=False)
-        endian = EndianType.from_str(self._parse_element_text("endian", cpu_element, optional=False))
-        mpu_present = _to_none_or_bool(self._parse_element_text("mpuPresent", cpu_element, optional=True))
-        fpu_present = _to_none_or_bool(self._parse_element_text("fpuPresent", cpu_element, optional=True))
-        fpu_dp = _to_none_or_bool(self._parse_element_text("fpuDP", cpu_element, optional=True))
-        dsp_present = _to_none_or_bool(self._parse_element_text("dspPresent", cpu_element, optional=True))
-        icache_present = _to_none_or_bool(self._parse_element_text("icachePresent", cpu_element, optional=True))
-        dcache_present = _to_none_or_bool(self._parse_element_text("dcachePresent", cpu_element, optional=True))
-        itcm_present = _to_none_or_bool(self._parse_element_text("itcmPresent", cpu_element, optional=True))
-        dtcm_present = _to_none_or_bool(self._parse_element_text("dtcmPresent", cpu_element, optional=True))
-        vtor_present = _to_none_or_bool(self._parse_element_text("vtorPresent", cpu_element, optional=True))
-        nvic_prio_bits = _to_int(self._parse_element_text("nvicPrioBits", cpu_element, optional=False))
+        cpu_children = _ChildElements(cpu_element)
+
+        name = CPUNameType.from_str(self._parse_element_text("name", cpu_children, optional=False))
+        revision = self._parse_element_text("revision", cpu_children, optional=False)
+        endian = EndianType.from_str(self._parse_element_text("endian", cpu_children, optional=False))
+        mpu_present = _to_none_or_bool(self._parse_element_text("mpuPresent", cpu_children, optional=True))
+        fpu_present = _to_none_or_bool(self._parse_element_text("fpuPresent", cpu_children, optional=True))
+        fpu_dp = _to_none_or_bool(self._parse_element_text("fpuDP", cpu_children, optional=True))
+        dsp_present = _to_none_or_bool(self._parse_element_text("dspPresent", cpu_children, optional=True))
+        icache_present = _to_none_or_bool(self._parse_element_text("icachePresent", cpu_children, optional=True))
+        dcache_present = _to_none_or_bool(self._parse_element_text("dcachePresent", cpu_children, optional=True))
+        itcm_present = _to_none_or_bool(self._parse_element_text("itcmPresent", cpu_children, optional=True))
+        dtcm_present = _to_none_or_bool(self._parse_element_text("dtcmPresent", cpu_children, optional=True))
+        vtor_present = _to_none_or_bool(self._parse_element_text("vtorPresent", cpu_children, optional=True))
+        nvic_prio_bits = _to_int(self._parse_element_text("nvicPrioBits", cpu_children, optional=False))
         vendor_systick_config = _to_bool(
-            self._parse_element_text("vendorSystickConfig", cpu_element, optional=False), default=False
+            self._parse_element_text("vendorSystickConfig", cpu_children, optional=False), default=False
         )
-        device_num_interrupts = _to_int(self._parse_element_text("deviceNumInterrupts", cpu_element, optional=True))
-        sau_num_regions = _to_int(self._parse_element_text("sauNumRegions", cpu_element, optional=True))
-        sau_regions_config = self._parse_sau_regions_config(cpu_element)
+        device_num_interrupts = _to_int(self._parse_element_text("deviceNumInterrupts", cpu_children, optional=True))
+        sau_num_regions = _to_int(self._parse_element_text("sauNumRegions", cpu_children, optional=True))
+        sau_regions_config = self._parse_sau_regions_config(cpu_children)
 
         cpu = SVDCPU(
             name=name,
@@ -357,19 +401,19 @@ class Parser:
 
         return cpu
 
-    def _parse_sau_regions_config(
-        self, cpu_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> None | SVDSauRegionsConfig:
-        config_element = cpu_element.find("sauRegionsConfig")
+    def _parse_sau_regions_config(self, cpu_children: _ChildElements) -> None | SVDSauRegionsConfig:
+        config_element = cpu_children.find("sauRegionsConfig")
 
         if config_element is None:
             return None
 
+        config_children = _ChildElements(config_element)
+
         enabled = _to_none_or_bool(self._parse_element_attribute("enabled", config_element, optional=True))
         protection_when_disabled = self._parse_element_attribute(
             "protectionWhenDisabled", config_element, optional=True
         )
-        regions = self._parse_sau_regions(config_element)
+        regions = self._parse_sau_regions(config_children)
 
         if protection_when_disabled is not None:
             protection_when_disabled = ProtectionStringType.from_str(protection_when_disabled)
@@ -385,117 +429,142 @@ class Parser:
 
         return sau_regions_config
 
-    def _parse_sau_regions(
-        self, config_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> list[SVDSauRegion]:
+    def _parse_sau_regions(self, config_children: _ChildElements) -> list[SVDSauRegion]:
         regions: list[SVDSauRegion] = []
-        for region_element in config_element.findall("region"):
+        for region_element in config_children.findall("region"):
+            region_children = _ChildElements(region_element)
             enabled = _to_none_or_bool(self._parse_element_attribute("enabled", region_element, optional=True))
             name = self._parse_element_attribute("name", region_element, optional=True)
-            base = _to_int(self._parse_element_text("base", region_element, optional=False))
-            limit = _to_int(self._parse_element_text("limit", region_element, optional=False))
-            access = SauAccessType.from_str(self._parse_element_text("access", region_element, optional=False))
+            base = _to_int(self._parse_element_text("base", region_children, optional=False))
+            limit = _to_int(self._parse_element_text("limit", region_children, optional=False))
+            access = SauAccessType.from_str(self._parse_element_text("access", region_children, optional=False))
 
             regions.append(SVDSauRegion(enabled=enabled, name=name, base=base, limit=limit, access=access))
 
         return regions
 
-    def _parse_peripherals(
-        self, device_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> list[SVDPeripheral]:
-        peripherals_element = device_element.find("peripherals")
+    def _parse_peripherals(self, device_children: _ChildElements) -> list[SVDPeripheral]:
+        peripherals_element = device_children.find("peripherals")
 
         if peripherals_element is None:
             raise ParserException("can't find peripherals element")
 
-        peripherals: list[SVDPeripheral] = []
-        for peripheral_element in peripherals_element.findall("peripheral"):
-            derived_from = self._parse_element_attribute("derivedFrom", peripheral_element, optional=True)
-            name = self._parse_element_text("name", peripheral_element, optional=False)
-            version = self._parse_element_text("version", peripheral_element, optional=True)
-            description = self._parse_element_text("description", peripheral_element, strip=False, optional=True)
-            alternate_peripheral = self._parse_element_text("alternatePeripheral", peripheral_element, optional=True)
-            group_name = self._parse_element_text("groupName", peripheral_element, optional=True)
-            prepend_to_name = self._parse_element_text("prependToName", peripheral_element, optional=True)
-            append_to_name = self._parse_element_text("appendToName", peripheral_element, optional=True)
-            header_struct_name = self._parse_element_text("headerStructName", peripheral_element, optional=True)
-            disable_condition = self._parse_element_text(
-                "disableCondition", peripheral_element, strip=False, optional=True
-            )
-            base_address = _to_int(self._parse_element_text("baseAddress", peripheral_element, optional=False))
-            address_blocks = self._parse_address_blocks(peripheral_element)
-            interrupts = self._parse_interrupts(peripheral_element)
+        return [self._parse_peripheral(element) for element in peripherals_element.findall("peripheral")]
 
-            # Some svd files have multiple <registers> elements in a <peripheral> element (not allowed by the schema)
-            # To be compatible with SVDConv, all <registers> elements are parsed
-            registers_clusters: list[SVDRegister | SVDCluster] = []
-            for registers_element in peripheral_element.findall("registers"):
-                registers_clusters.extend(self._parse_registers_clusters(registers_element))
+    def _parse_peripheral(
+        self, peripheral_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
+    ) -> SVDPeripheral:
+        peripheral_children = _ChildElements(peripheral_element)
+        derived_from = self._parse_element_attribute("derivedFrom", peripheral_element, optional=True)
+        name = self._parse_element_text("name", peripheral_children, optional=False)
+        version = self._parse_element_text("version", peripheral_children, optional=True)
+        description = self._parse_element_text("description", peripheral_children, strip=False, optional=True)
+        alternate_peripheral = self._parse_element_text("alternatePeripheral", peripheral_children, optional=True)
+        group_name = self._parse_element_text("groupName", peripheral_children, optional=True)
+        prepend_to_name = self._parse_element_text("prependToName", peripheral_children, optional=True)
+        append_to_name = self._parse_element_text("appendToName", peripheral_children, optional=True)
+        header_struct_name = self._parse_element_text("headerStructName", peripheral_children, optional=True)
+        disable_condition = self._parse_element_text(
+            "disableCondition", peripheral_children, strip=False, optional=True
+        )
+        base_address = _to_int(self._parse_element_text("baseAddress", peripheral_children, optional=False))
+        address_blocks = self._parse_address_blocks(peripheral_children)
+        interrupts = self._parse_interrupts(peripheral_children)
 
-            dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(peripheral_element)
+        # Some svd files have multiple <registers> elements in a <peripheral> element (not allowed by the schema)
+        # To be compatible with SVDConv, all <registers> elements are parsed
+        registers_elements = peripheral_children.findall("registers")
+        registers_clusters = None if self._lazy else self._parse_registers_elements(registers_elements)
 
-            size, access, protection, reset_value, reset_mask = self._parse_register_properties(peripheral_element)
+        dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(peripheral_children)
 
-            peripheral = SVDPeripheral(
-                name=name,
-                version=version,
-                description=description,
-                alternate_peripheral=alternate_peripheral,
-                group_name=group_name,
-                prepend_to_name=prepend_to_name,
-                append_to_name=append_to_name,
-                header_struct_name=header_struct_name,
-                disable_condition=disable_condition,
-                base_address=base_address,
-                address_blocks=address_blocks,
-                interrupts=interrupts,
-                registers_clusters=registers_clusters,
-                dim=dim,
-                dim_increment=dim_increment,
-                dim_index=dim_index,
-                dim_name=dim_name,
-                dim_array_index=dim_array_index,
-                size=size,
-                access=access,
-                protection=protection,
-                reset_value=reset_value,
-                reset_mask=reset_mask,
-                derived_from=derived_from,
-            )
+        size, access, protection, reset_value, reset_mask = self._parse_register_properties(peripheral_children)
 
-            for address_block in peripheral.address_blocks:
-                address_block.parent = peripheral
+        peripheral = SVDPeripheral(
+            name=name,
+            version=version,
+            description=description,
+            alternate_peripheral=alternate_peripheral,
+            group_name=group_name,
+            prepend_to_name=prepend_to_name,
+            append_to_name=append_to_name,
+            header_struct_name=header_struct_name,
+            disable_condition=disable_condition,
+            base_address=base_address,
+            address_blocks=address_blocks,
+            interrupts=interrupts,
+            registers_clusters=registers_clusters,
+            dim=dim,
+            dim_increment=dim_increment,
+            dim_index=dim_index,
+            dim_name=dim_name,
+            dim_array_index=dim_array_index,
+            size=size,
+            access=access,
+            protection=protection,
+            reset_value=reset_value,
+            reset_mask=reset_mask,
+            derived_from=derived_from,
+        )
+
+        for address_block in peripheral.address_blocks:
+            address_block.parent = peripheral
 
-            for interrupt in peripheral.interrupts:
-                interrupt.parent = peripheral
+        for interrupt in peripheral.interrupts:
+            interrupt.parent = peripheral
 
+        if self._lazy:
+            peripheral.registers_clusters = LazyList(
+                partial(self._parse_lazy_registers_clusters, peripheral, registers_elements)
+            )
+        else:
             for register_cluster in peripheral.registers_clusters:
                 register_cluster.parent = peripheral
 
-            if peripheral.dim_array_index is not None:
-                peripheral.dim_array_index.parent = peripheral
+        if peripheral.dim_array_index is not None:
+            peripheral.dim_array_index.parent = peripheral
 
-            peripherals.append(peripheral)
+        return peripheral
 
-        return peripherals
+    def _parse_registers_elements(
+        self, registers_elements: list[lxml.etree._Element]  # pyright: ignore[reportPrivateUsage]
+    ) -> list[SVDRegister | SVDCluster]:
+        registers_clusters: list[SVDRegister | SVDCluster] = []
+        for registers_element in registers_elements:
+            registers_clusters.extend(self._parse_registers_clusters(registers_element))
+
+        return registers_clusters
+
+    def _parse_lazy_registers_clusters(
+        self,
+        peripheral: SVDPeripheral,
+        registers_elements: list[lxml.etree._Element],  # pyright: ignore[reportPrivateUsage]
+    ) -> list[SVDRegister | SVDCluster]:
+        registers_clusters = self._parse_registers_elements(registers_elements)
+
+        for register_cluster in registers_clusters:
+            register_cluster.parent = peripheral
+
+        return registers_clusters
 
     def _parse_register(self, register_element: lxml.etree._Element):  # pyright: ignore[reportPrivateUsage]
+        register_children = _ChildElements(register_element)
         derived_from = self._parse_element_attribute("derivedFrom", register_element, optional=True)
-        name = self._parse_element_text("name", register_element, optional=False)
-        display_name = self._parse_element_text("displayName", register_element, optional=True)
-        description = self._parse_element_text("description", register_element, strip=False, optional=True)
-        alternate_group = self._parse_element_text("alternateGroup", register_element, optional=True)
-        alternate_register = self._parse_element_text("alternateRegister", register_element, optional=True)
-        address_offset = _to_int(self._parse_element_text("addressOffset", register_element, optional=False))
-        data_type = self._parse_element_text("dataType", register_element, optional=True)
-        modified_write_values = self._parse_element_text("modifiedWriteValues", register_element, optional=True)
-        write_constraint = self._parse_write_constraint(register_element)
-        read_action = self._parse_element_text("readAction", register_element, optional=True)
-        fields = self._parse_fields(register_element)
-
-        dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(register_element)
-
-        size, access, protection, reset_value, reset_mask = self._parse_register_properties(register_element)
+        name = self._parse_element_text("name", register_children, optional=False)
+        display_name = self._parse_element_text("displayName", register_children, optional=True)
+        description = self._parse_element_text("description", register_children, strip=False, optional=True)
+        alternate_group = self._parse_element_text("alternateGroup", register_children, optional=True)
+        alternate_register = self._parse_element_text("alternateRegister", register_children, optional=True)
+        address_offset = _to_int(self._parse_element_text("addressOffset", register_children, optional=False))
+        data_type = self._parse_element_text("dataType", register_children, optional=True)
+        modified_write_values = self._parse_element_text("modifiedWriteValues", register_children, optional=True)
+        write_constraint = self._parse_write_constraint(register_children)
+        read_action = self._parse_element_text("readAction", register_children, optional=True)
+        fields = self._parse_fields(register_children)
+
+        dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(register_children)
+
+        size, access, protection, reset_value, reset_mask = self._parse_register_properties(register_children)
 
         if data_type is not None:
             data_type = DataTypeType.from_str(data_type)
@@ -542,33 +611,32 @@ class Parser:
 
         return register
 
-    def _parse_fields(
-        self, register_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> list[SVDField]:
+    def _parse_fields(self, register_children: _ChildElements) -> list[SVDField]:
         # Some svd files have multiple <fields> elements in a <register> element (not allowed by the schema)
         # To be compatible with SVDConv, all <fields> elements are parsed
-        fields_elements = register_element.findall("fields")
+        fields_elements = register_children.findall("fields")
         if not fields_elements:
             return []
 
         fields: list[SVDField] = []
         for fields_element in fields_elements:
-            for field_element in fields_element.findall("field"):
+            for field_element in _ChildElements(fields_element).findall("field"):
+                field_children = _ChildElements(field_element)
                 derived_from = self._parse_element_attribute("derivedFrom", field_element, optional=True)
-                name = self._parse_element_text("name", field_element, optional=False)
-                description = self._parse_element_text("description", field_element, strip=False, optional=True)
-                bit_offset = _to_int(self._parse_element_text("bitOffset", field_element, optional=True))
-                bit_width = _to_int(self._parse_element_text("bitWidth", field_element, optional=True))
-                lsb = _to_int(self._parse_element_text("lsb", field_element, optional=True))
-                msb = _to_int(self._parse_element_text("msb", field_element, optional=True))
-                bit_range = self._parse_element_text("bitRange", field_element, optional=True)
-                access = self._parse_element_text("access", field_element, optional=True)
-                modified_write_values = self._parse_element_text("modifiedWriteValues", field_element, optional=True)
-                write_constraint = self._parse_write_constraint(field_element)
-                read_action = self._parse_element_text("readAction", field_element, optional=True)
-                enumerated_value_containers = self._parse_enumerated_value_containers(field_element)
-
-                dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(field_element)
+                name = self._parse_element_text("name", field_children, optional=False)
+                description = self._parse_element_text("description", field_children, strip=False, optional=True)
+                bit_offset = _to_int(self._parse_element_text("bitOffset", field_children, optional=True))
+                bit_width = _to_int(self._parse_element_text("bitWidth", field_children, optional=True))
+                lsb = _to_int(self._parse_element_text("lsb", field_children, optional=True))
+                msb = _to_int(self._parse_element_text("msb", field_children, optional=True))
+                bit_range = self._parse_element_text("bitRange", field_children, optional=True)
+                access = self._parse_element_text("access", field_children, optional=True)
+                modified_write_values = self._parse_element_text("modifiedWriteValues", field_children, optional=True)
+                write_constraint = self._parse_write_constraint(field_children)
+                read_action = self._parse_element_text("readAction", field_children, optional=True)
+                enumerated_value_containers = self._parse_enumerated_value_containers(field_children)
+
+                dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(field_children)
 
                 if access is not None:
                     access = AccessType.from_str(access)
@@ -613,16 +681,15 @@ class Parser:
 
         return fields
 
-    def _parse_enumerated_value_containers(
-        self, field_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> list[SVDEnumeratedValueContainer]:
+    def _parse_enumerated_value_containers(self, field_children: _ChildElements) -> list[SVDEnumeratedValueContainer]:
         enumerated_value_containers: list[SVDEnumeratedValueContainer] = []
-        for container_element in field_element.findall("enumeratedValues"):
+        for container_element in field_children.findall("enumeratedValues"):
+            container_children = _ChildElements(container_element)
             derived_from = self._parse_element_attribute("derivedFrom", container_element, optional=True)
-            name = self._parse_element_text("name", container_element, optional=True)
-            header_enum_name = self._parse_element_text("headerEnumName", container_element, optional=True)
-            usage = self._parse_element_text("usage", container_element, optional=True)
-            enumerated_values = self._parse_enumerated_values(container_element)
+            name = self._parse_element_text("name", container_children, optional=True)
+            header_enum_name = self._parse_element_text("headerEnumName", container_children, optional=True)
+            usage = self._parse_element_text("usage", container_children, optional=True)
+            enumerated_values = self._parse_enumerated_values(container_children)
 
             if usage is not None:
                 usage = EnumUsageType.from_str(usage)
@@ -642,24 +709,25 @@ class Parser:
 
         return enumerated_value_containers
 
-    def _parse_write_constraint(
-        self, parent_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> None | SVDWriteConstraint:
-        write_cronstraint_element = parent_element.find("writeConstraint")
+    def _parse_write_constraint(self, parent_children: _ChildElements) -> None | SVDWriteConstraint:
+        write_cronstraint_element = parent_children.find("writeConstraint")
 
         if write_cronstraint_element is None:
             return None
 
+        write_cronstraint_children = _ChildElements(write_cronstraint_element)
+
         write_as_read = _to_none_or_bool(
-            self._parse_element_text("writeAsRead", write_cronstraint_element, optional=True)
+            self._parse_element_text("writeAsRead", write_cronstraint_children, optional=True)
         )
         use_enumerated_values = _to_none_or_bool(
-            self._parse_element_text("useEnumeratedValues", write_cronstraint_element, optional=True)
+            self._parse_element_text("useEnumeratedValues", write_cronstraint_children, optional=True)
         )
 
-        if (range_element := write_cronstraint_element.find("range")) is not None:
-            minimum = _to_int(self._parse_element_text("minimum", range_element, optional=False))
-            maximum = _to_int(self._parse_element_text("maximum", range_element, optional=False))
+        if (range_element := write_cronstraint_children.find("range")) is not None:
+            range_children = _ChildElements(range_element)
+            minimum = _to_int(self._parse_element_text("minimum", range_children, optional=False))
+            maximum = _to_int(self._parse_element_text("maximum", range_children, optional=False))
 
             range_ = (minimum, maximum)
         else:
@@ -672,17 +740,18 @@ class Parser:
         )
 
     def _parse_cluster(self, cluster_element: lxml.etree._Element):  # pyright: ignore[reportPrivateUsage]
+        cluster_children = _ChildElements(cluster_element)
         derived_from = self._parse_element_attribute("derivedFrom", cluster_element, optional=True)
-        name = self._parse_element_text("name", cluster_element, optional=False)
-        description = self._parse_element_text("description", cluster_element, strip=False, optional=True)
-        alternate_cluster = self._parse_element_text("alternateCluster", cluster_element, optional=True)
-        header_struct_name = self._parse_element_text("headerStructName", cluster_element, optional=True)
-        address_offset = _to_int(self._parse_element_text("addressOffset", cluster_element, optional=False))
+        name = self._parse_element_text("name", cluster_children, optional=False)
+        description = self._parse_element_text("description", cluster_children, strip=False, optional=True)
+        alternate_cluster = self._parse_element_text("alternateCluster", cluster_children, optional=True)
+        header_struct_name = self._parse_element_text("headerStructName", cluster_children, optional=True)
+        address_offset = _to_int(self._parse_element_text("addressOffset", cluster_children, optional=False))
         registers_clusters = self._parse_registers_clusters(cluster_element)
 
-        dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(cluster_element)
+        dim, dim_increment, dim_index, dim_name, dim_array_index = self._parse_dim_element_group(cluster_children)
 
-        size, access, protection, reset_value, reset_mask = self._parse_register_properties(cluster_element)
+        size, access, protection, reset_value, reset_mask = self._parse_register_properties(cluster_children)
 
         cluster = SVDCluster(
             name=name,
@@ -730,42 +799,43 @@ class Parser:
 
         return registers_clusters
 
-    def _parse_interrupts(
-        self, peripheral_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> list[SVDInterrupt]:
+    def _parse_interrupts(self, peripheral_children: _ChildElements) -> list[SVDInterrupt]:
         interrupts: list[SVDInterrupt] = []
-        for interrupt_element in peripheral_element.findall("interrupt"):
-            name = self._parse_element_text("name", interrupt_element, optional=False)
-            description = self._parse_element_text("description", interrupt_element, strip=False, optional=True)
+        for interrupt_element in peripheral_children.findall("interrupt"):
+            interrupt_children = _ChildElements(interrupt_element)
+            name = self._parse_element_text("name", interrupt_children, optional=False)
+            description = self._parse_element_text("description", interrupt_children, strip=False, optional=True)
 
             # Necessary for NSING.N32H47x_DFP.1.0.1/N32H474.svd
             try:
-                value = _to_int(self._parse_element_text("value", interrupt_element, optional=False))
+                value = _to_int(self._parse_element_text("value", interrupt_children, optional=False))
             except ParserException:
-                warnings.warn(
-                    f"Can't find mandatory value attribute in the interrupt element with name '{name}'. "
-                    "Setting value to 0 to be compatible with SVDConv.",
-                    ParserWarning,
-                )
+                if self._diagnostics.enabled:
+                    self._diagnostics.report(
+                        DiagnosticCode.MISSING_INTERRUPT_VALUE,
+                        f"Can't find mandatory value attribute in the interrupt element with name '{name}'. "
+                        "Setting value to 0 to be compatible with SVDConv.",
+                        _element_path(interrupt_element),
+                        interrupt_element.sourceline,
+                    )
                 value = 0
 
             interrupts.append(SVDInterrupt(name=name, description=description, value=value))
 
         return interrupts
 
-    def _parse_address_blocks(
-        self, peripheral_element: lxml.etree._Element  # pyright: ignore[reportPrivateUsage]
-    ) -> list[SVDAddressBlock]:
+    def _parse_address_blocks(self, peripheral_children: _ChildElements) -> list[SVDAddressBlock]:
         address_blocks: list[SVDAddressBlock] = []
-        for address_block_element in peripheral_element.findall("addressBlock"):
+        for address_block_element in peripheral_children.findall("addressBlock"):
+            address_block_children = _ChildElements(address_block_element)
             # dirty hack to handle the case where offset is not present
             # (e.g. Brainchip.AKD1000_DeviceFamilyPack.1.0.2/AKD1000.svd)
-            offset = _to_int(self._parse_element_text("offset", address_block_element, optional=True)) or 0
-            size = _to_int(self._parse_element_text("size", address_block_element, optional=False))
+            offset = _to_int(self._parse_element_text("offset", address_block_children, optional=True)) or 0
+            size = _to_int(self._parse_element_text("size", address_block_children, optional=False))
             usage = EnumeratedTokenType.from_str(
-                self._parse_element_text("usage", address_block_element, optional=False)
+                self._parse_element_text("usage", address_block_children, optional=False)
             )
-            protection = self._parse_element_text("protection", address_block_element, optional=True)
+            protection = self._parse_element_text("protection", address_block_children, optional=True)
 
             if protection is not None:
                 protection = ProtectionStringType.from_str(protection)
@@ -776,27 +846,29 @@ class Parser:
 
     def _parse_dim_element_group(
         self,
-        element: lxml.etree._Element,  # pyright: ignore[reportPrivateUsage]
+        children: _ChildElements,
     ) -> tuple[Optional[int], Optional[int], Optional[str], Optional[str], Optional[SVDDimArrayIndex]]:
-        dim = _to_int(self._parse_element_text("dim", element, optional=True))
-        dim_increment = _to_int(self._parse_element_text("dimIncrement", element, optional=True))
-        dim_index = self._parse_element_text("dimIndex", element, optional=True)
-        dim_name = self._parse_element_text("dimName", element, optional=True)
-        dim_array_index = self.parse_dim_array_index(element)
+        dim = _to_int(self._parse_element_text("dim", children, optional=True))
+        dim_increment = _to_int(self._parse_element_text("dimIncrement", children, optional=True))
+        dim_index = self._parse_element_text("dimIndex", children, optional=True)
+        dim_name = self._parse_element_text("dimName", children, optional=True)
+        dim_array_index = self.parse_dim_array_index(children)
 
         return dim, dim_increment, dim_index, dim_name, dim_array_index
 
     def parse_dim_array_index(
         self,
-        element: lxml.etree._Element,  # pyright: ignore[reportPrivateUsage]
+        children: _ChildElements,
     ) -> None | SVDDimArrayIndex:
-        dim_array_index_element = element.find("dimArrayIndex")
+        dim_array_index_element = children.find("dimArrayIndex")
 
         if dim_array_index_element is None:
             return None
 
-        header_enum_name = self._parse_element_text("headerEnumName", dim_array_index_element, optional=True)
-        enumerated_values = self._parse_enumerated_values(dim_array_index_element)
+        dim_array_index_children = _ChildElements(dim_array_index_element)
+
+        header_enum_name = self._parse_element_text("headerEnumName", dim_array_index_children, optional=True)
+        enumerated_values = self._parse_enumerated_values(dim_array_index_children)
 
         dim_array_index = SVDDimArrayIndex(header_enum_name=header_enum_name, enumerated_values=enumerated_values)
 
@@ -807,15 +879,16 @@ class Parser:
 
     def _parse_enumerated_values(
         self,
-        parent_element: lxml.etree._Element,  # pyright: ignore[reportPrivateUsage]
+        parent_children: _ChildElements,
     ) -> list[SVDEnumeratedValue]:
         enumerated_values: list[SVDEnumeratedValue] = []
-        for enumerated_value_element in parent_element.findall("enumeratedValue"):
-            name = self._parse_element_text("name", enumerated_value_element, optional=False)
-            description = self._parse_element_text("description", enumerated_value_element, strip=False, optional=True)
-            value = self._parse_element_text("value", enumerated_value_element, optional=True)
+        for enumerated_value_element in parent_children.findall("enumeratedValue"):
+            enumerated_value_children = _ChildElements(enumerated_value_element)
+            name = self._parse_element_text("name", enumerated_value_children, optional=False)
+            description = self._parse_element_text("description", enumerated_value_children, strip=False, optional=True)
+            value = self._parse_element_text("value", enumerated_value_children, optional=True)
             is_default = _to_none_or_bool(
-                self._parse_element_text("isDefault", enumerated_value_element, optional=True)
+                self._parse_element_text("isDefault", enumerated_value_children, optional=True)
             )
 
             enumerated_values.append(
@@ -823,3 +896,150 @@ class Parser:
             )
 
         return enumerated_values
+
+
+class Parser(_ElementParser):
+    @classmethod
+    def from_svd_file(
+        cls, path: str, lazy: bool = False, member: None | str = None, diagnostics: None | DiagnosticsSink = None
+    ):
+        # plain and compressed svd files as well as members of CMSIS packs are streamed into the parser
+        with open_svd_file(path, member) as file:
+            return cls(safe_parse(file), lazy, diagnostics)
+
+    @staticmethod
+    def from_xml_str(xml_str: str, lazy: bool = False, diagnostics: None | DiagnosticsSink = None):
+        return Parser.from_xml_content(xml_str.encode(), lazy, diagnostics)
+
+    @classmethod
+    def from_xml_content(cls, content: bytes, lazy: bool = False, diagnostics: None | DiagnosticsSink = None):
+        return cls(safe_fromstring(content).getroottree(), lazy, diagnostics)
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer, lazy: bool = False, diagnostics: None | DiagnosticsSink = None):
+        # e.g. an mmap of the svd file, which is parsed without copying it into a bytes object
+        return cls(safe_frombuffer(buffer).getroottree(), lazy, diagnostics)
+
+    @classmethod
+    def from_document(cls, document: SVDDocument, lazy: bool = False, diagnostics: None | DiagnosticsSink = None):
+        parser = cls(document.tree, lazy, diagnostics)
+
+        # the raw buffer is not needed anymore once the device has been built
+        document.release_content()
+
+        return parser
+
+    def __init__(
+        self,
+        tree: lxml.etree._ElementTree,  # pyright: ignore[reportPrivateUsage]
+        lazy: bool = False,
+        diagnostics: None | DiagnosticsSink = None,
+    ) -> None:
+        # In lazy mode, the registers and clusters of each peripheral are parsed from the retained tree on first access
+        # of `SVDPeripheral.registers_clusters`. Their warnings are emitted at that point.
+        self._lazy = lazy
+        # without a sink, the diagnostics are emitted as `ParserWarning`
+        if diagnostics is not None:
+            self._diagnostics = diagnostics
+        self._parsed_device = self._parse_device(tree.getroot())
+
+    @staticmethod
+    def peek_device_info(path_or_file: str | BinaryIO) -> SVDDevice:
+        """Parses only the device header of an SVD file, i.e. the device and cpu information in front of the
+        `<peripherals>` element, without any peripherals.
+
+        Reading stops at the `<peripherals>` start tag, so usually only the first few KB of the file are read.
+        """
+
+        stream = PeripheralStream(path_or_file, sniff_size=_PEEK_SNIFF_SIZE)
+        try:
+            return stream.get_device_header()
+        finally:
+            stream.close()
+
+    def get_parsed_device(self) -> SVDDevice:
+        return self._parsed_device
+
+    def _parse_device(self, device_element: lxml.etree._Element) -> SVDDevice:  # pyright: ignore[reportPrivateUsage]
+        device = self._parse_device_header(device_element)
+        device.peripherals = self._parse_peripherals(_ChildElements(device_element))
+
+        for peripheral in device.peripherals:
+            peripheral.parent = device
+
+        return device
+
+
+class PeripheralStream(_ElementParser):
+    """Parses an SVD file incrementally with `lxml.etree.iterparse` and yields one `SVDPeripheral` at a time.
+
+    The device header (everything in front of the `<peripherals>` element) is parsed as soon as the `<peripherals>`
+    element starts. Every peripheral subtree is cleared after it has been parsed, so the memory needed for parsing
+    doesn't grow with the number of peripherals. The yielded peripherals have the header device as parent, but are not
+    added to its `peripherals` list. A stream can be iterated only once.
+    """
+
+    @classmethod
+    def from_svd_file(cls, path: str, diagnostics: None | DiagnosticsSink = None):
+        return cls(path, diagnostics=diagnostics)
+
+    @classmethod
+    def from_xml_str(cls, xml_str: str, diagnostics: None | DiagnosticsSink = None):
+        return cls.from_xml_content(xml_str.encode(), diagnostics)
+
+    @classmethod
+    def from_xml_content(cls, content: bytes, diagnostics: None | DiagnosticsSink = None):
+        return cls(io.BytesIO(content), diagnostics=diagnostics)
+
+    def __init__(
+        self,
+        path_or_file: str | BinaryIO,
+        sniff_size: None | int = None,
+        diagnostics: None | DiagnosticsSink = None,
+    ) -> None:
+        if diagnostics is not None:
+            self._diagnostics = diagnostics
+
+        self._events = safe_iterparse(
+            path_or_file, events=("start", "end"), tag=("peripherals", "peripheral"), sniff_size=sniff_size
+        )
+        self._device: None | SVDDevice = None
+        self._peripherals_element: None | lxml.etree._Element = None  # pyright: ignore[reportPrivateUsage]
+
+    def get_device_header(self) -> SVDDevice:
+        if self._device is None:
+            for event, element in self._events:
+                if event == "start" and element.tag == "peripherals":
+                    device_element = element.getparent()
+                    if device_element is None:
+                        raise ParserException("can't find device element")
+
+                    self._peripherals_element = element
+                    self._device = self._parse_device_header(device_element)
+                    break
+            else:
+                raise ParserException("can't find peripherals element")
+
+        return self._device
+
+    def close(self):
+        # stops reading, the file is closed if it has been opened by the stream
+        self._events.close()
+
+    def __iter__(self) -> Iterator[SVDPeripheral]:
+        device = self.get_device_header()
+
+        for event, element in self._events:
+            if event != "end" or element.tag != "peripheral" or element.getparent() is not self._peripherals_element:
+                continue
+
+            peripheral = self._parse_peripheral(element)
+            peripheral.parent = device
+
+            # drop the finished subtree and all preceding siblings, so that only the current peripheral is in memory
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]  # type: ignore[union-attr]
+
+            yield peripheral
+
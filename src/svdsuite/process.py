@@ -1,8 +1,10 @@
-import re
 import itertools
-import warnings
+import re
+from collections.abc import Buffer, Iterable, Iterator
+from typing import Any
 
 from svdsuite.parse import Parser
+from svdsuite.document import SVDDocument
 from svdsuite.model.parse import (
     SVDDevice,
     SVDCPU,
@@ -39,6 +41,8 @@ from svdsuite.model.process import (
     EnumeratedValueContainer,
     IEnumeratedValue,
     EnumeratedValue,
+    DefaultEnumeratedValue,
+    iter_dont_care_values,
 )
 from svdsuite.util.process_parse_model_convert import process_parse_convert_device
 from svdsuite.model.types import AccessType, ProtectionStringType, CPUNameType, ModifiedWriteValuesType, EnumUsageType
@@ -50,6 +54,13 @@ from svdsuite.resolve.exception import (
     UnprocessedNodesException,
 )
 from svdsuite.model.type_alias import ParsedDimablePeripheralTypes, IntermediateDimablePeripheralTypes
+from svdsuite.diagnostics import (
+    Diagnostic,
+    DiagnosticCode,
+    Diagnostics,
+    DiagnosticsSink,
+    WarningsDiagnostics,
+)
 
 
 def or_if_none[T](a: None | T, b: None | T) -> None | T:
@@ -64,22 +75,214 @@ class ProcessWarning(Warning):
     pass
 
 
+def _svd_path(parsed: Any) -> str:
+    # names of the svd elements from the peripheral down to the given element, e.g. 'UART0/CR/EN'
+    names: list[str] = []
+    while parsed is not None and not isinstance(parsed, SVDDevice):
+        name = getattr(parsed, "name", None)
+        if name is not None:
+            names.append(name)
+        parsed = parsed.parent
+
+    return "/".join(reversed(names))
+
+
+def _dim_name_pattern(name: str) -> None | re.Pattern[str]:
+    # pattern of the names, which the instances of a dim element may get
+    if "%s" not in name:
+        return None
+
+    name_parts = name.replace("[%s]", "%s").split("%s")
+    return re.compile(".*".join(re.escape(part) for part in name_parts))
+
+
+def _referenced_peripheral_names(parsed_peripheral: SVDPeripheral) -> Iterator[str]:
+    # a derivedFrom path is looked up in the scope of the element first and then from the peripherals of the device,
+    # so only its first part can name another peripheral
+    if parsed_peripheral.alternate_peripheral is not None:
+        yield parsed_peripheral.alternate_peripheral
+
+    elements: list[SVDPeripheral | SVDCluster | SVDRegister | SVDField | SVDEnumeratedValueContainer] = [
+        parsed_peripheral
+    ]
+    while elements:
+        element = elements.pop()
+        if element.derived_from is not None:
+            yield element.derived_from.split(".")[0]
+
+        if isinstance(element, SVDPeripheral | SVDCluster):
+            elements.extend(element.registers_clusters)
+        elif isinstance(element, SVDRegister):
+            elements.extend(element.fields)
+        elif isinstance(element, SVDField):
+            elements.extend(element.enumerated_value_containers)
+
+
+class _PeripheralDependencies:
+    # A peripheral depends on the peripherals named by its alternatePeripheral or by the first part of a derivedFrom
+    # path at any level. A dim peripheral is named by each name one of its instances may get, so more dependencies may
+    # be found than there are, but never less. The peripherals are returned in the order of the device.
+    def __init__(
+        self,
+        parsed_peripherals: list[SVDPeripheral],
+        references: None | dict[int, tuple[SVDPeripheral, set[str]]] = None,
+    ) -> None:
+        self._parsed_peripherals = parsed_peripherals
+        self._peripherals_by_name: dict[str, list[SVDPeripheral]] = {}
+        self._dim_peripherals: list[tuple[re.Pattern[str], SVDPeripheral]] = []
+        for parsed_peripheral in parsed_peripherals:
+            self._peripherals_by_name.setdefault(parsed_peripheral.name, []).append(parsed_peripheral)
+            pattern = _dim_name_pattern(parsed_peripheral.name)
+            if pattern is not None:
+                self._dim_peripherals.append((pattern, parsed_peripheral))
+        # peripheral names referenced by each peripheral, which are collected on demand
+        self._references = references if references is not None else {}
+
+    def select(self, names: list[str]) -> list[SVDPeripheral]:
+        # the peripherals with the given names and, transitively, the peripherals they depend on
+        for name in names:
+            if not self._get_peripherals_by_name(name):
+                raise ProcessException(f"Peripheral '{name}' not found")
+
+        return self._close(names, [])
+
+    def get_dependencies(self, parsed_peripherals: list[SVDPeripheral]) -> list[SVDPeripheral]:
+        # the given peripherals and, transitively, the peripherals they depend on
+        return self._close([], parsed_peripherals)
+
+    def get_dependents(self, names: Iterable[str]) -> list[SVDPeripheral]:
+        # the peripherals, which depend transitively on a peripheral with one of the given names
+        dependents: set[int] = set()
+        visited_names: set[str] = set()
+        pending_names = list(names)
+        while pending_names:
+            name = pending_names.pop()
+            if name in visited_names:
+                continue
+            visited_names.add(name)
+
+            pattern = _dim_name_pattern(name)
+            for parsed_peripheral in self._parsed_peripherals:
+                if id(parsed_peripheral) in dependents:
+                    continue
+
+                references = self._get_references(parsed_peripheral)
+                if name in references or (pattern is not None and any(pattern.fullmatch(r) for r in references)):
+                    dependents.add(id(parsed_peripheral))
+                    pending_names.append(parsed_peripheral.name)
+
+        return [p for p in self._parsed_peripherals if id(p) in dependents]
+
+    def _close(self, names: list[str], parsed_peripherals: list[SVDPeripheral]) -> list[SVDPeripheral]:
+        selected = {id(parsed_peripheral) for parsed_peripheral in parsed_peripherals}
+        visited_names: set[str] = set()
+        pending_names = names + [name for p in parsed_peripherals for name in self._get_references(p)]
+        while pending_names:
+            name = pending_names.pop()
+            if name in visited_names:
+                continue
+            visited_names.add(name)
+
+            for parsed_peripheral in self._get_peripherals_by_name(name):
+                if id(parsed_peripheral) not in selected:
+                    selected.add(id(parsed_peripheral))
+                    pending_names.extend(self._get_references(parsed_peripheral))
+
+        return [p for p in self._parsed_peripherals if id(p) in selected]
+
+    def _get_peripherals_by_name(self, name: str) -> list[SVDPeripheral]:
+        return self._peripherals_by_name.get(name, []) + [
+            p for pattern, p in self._dim_peripherals if pattern.fullmatch(name)
+        ]
+
+    def _get_references(self, parsed_peripheral: SVDPeripheral) -> set[str]:
+        # the peripheral is kept with its references, so its id isn't reused by another peripheral
+        entry = self._references.get(id(parsed_peripheral))
+        if entry is None or entry[0] is not parsed_peripheral:
+            entry = (parsed_peripheral, set(_referenced_peripheral_names(parsed_peripheral)))
+            self._references[id(parsed_peripheral)] = entry
+
+        return entry[1]
+
+
 class Process:
     @classmethod
-    def from_svd_file(cls, path: str, resolver_logging_file_path: None | str = None):
-        return cls(Parser.from_svd_file(path).get_parsed_device(), resolver_logging_file_path)
+    def from_svd_file(
+        cls,
+        path: str,
+        resolver_logging_file_path: None | str = None,
+        member: None | str = None,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ):
+        parsed_device = Parser.from_svd_file(path, member=member, diagnostics=diagnostics).get_parsed_device()
+        return cls(parsed_device, resolver_logging_file_path, diagnostics, peripherals)
+
+    @classmethod
+    def from_xml_str(
+        cls,
+        xml_str: str,
+        resolver_logging_file_path: None | str = None,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ):
+        parsed_device = Parser.from_xml_content(xml_str.encode(), diagnostics=diagnostics).get_parsed_device()
+        return cls(parsed_device, resolver_logging_file_path, diagnostics, peripherals)
 
     @classmethod
-    def from_xml_str(cls, xml_str: str, resolver_logging_file_path: None | str = None):
-        return cls(Parser.from_xml_content(xml_str.encode()).get_parsed_device(), resolver_logging_file_path)
+    def from_xml_content(
+        cls,
+        content: bytes,
+        resolver_logging_file_path: None | str = None,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ):
+        parsed_device = Parser.from_xml_content(content, diagnostics=diagnostics).get_parsed_device()
+        return cls(parsed_device, resolver_logging_file_path, diagnostics, peripherals)
 
     @classmethod
-    def from_xml_content(cls, content: bytes, resolver_logging_file_path: None | str = None):
-        return cls(Parser.from_xml_content(content).get_parsed_device(), resolver_logging_file_path)
+    def from_buffer(
+        cls,
+        buffer: Buffer,
+        resolver_logging_file_path: None | str = None,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ):
+        parsed_device = Parser.from_buffer(buffer, diagnostics=diagnostics).get_parsed_device()
+        return cls(parsed_device, resolver_logging_file_path, diagnostics, peripherals)
 
-    def __init__(self, parsed_device: SVDDevice, resolver_logging_file_path: None | str) -> None:
-        self._resolver = Resolver(self, resolver_logging_file_path)
-        self._processed_device: Device = self._process_device(parsed_device)
+    @classmethod
+    def from_document(
+        cls,
+        document: SVDDocument,
+        resolver_logging_file_path: None | str = None,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ):
+        parsed_device = Parser.from_document(document, diagnostics=diagnostics).get_parsed_device()
+        return cls(parsed_device, resolver_logging_file_path, diagnostics, peripherals)
+
+    def __init__(
+        self,
+        parsed_device: SVDDevice,
+        resolver_logging_file_path: None | str,
+        diagnostics: None | DiagnosticsSink = None,
+        peripherals: None | list[str] = None,
+    ) -> None:
+        # without a sink, the diagnostics are emitted as `ProcessWarning`
+        self._diagnostics = diagnostics if diagnostics is not None else WarningsDiagnostics(ProcessWarning)
+        # optional names of the peripherals, which the processed device holds
+        self._peripheral_names = peripherals
+        self._resolver_logging_file_path = resolver_logging_file_path
+        # processed enumerated value containers by parsed container, with their diagnostics
+        self._enumerated_value_containers: dict[int, tuple[IEnumeratedValueContainer, list[Diagnostic]]] = {}
+        # kept for `reprocess`: the finalized peripherals, the processed parsed peripherals with their names at the time
+        # of processing and the peripheral names they refer to, all by id of the parsed peripheral
+        self._parsed_device = parsed_device
+        self._finalized_peripherals: dict[int, list[Peripheral]] = {}
+        self._processed_peripherals: dict[int, tuple[SVDPeripheral, str]] = {}
+        self._peripheral_references: dict[int, tuple[SVDPeripheral, set[str]]] = {}
+        self._processed_device: Device = self._process_device(self._get_parsed_peripherals())
 
     def get_processed_device(self) -> Device:
         return self._processed_device
@@ -87,23 +290,86 @@ class Process:
     def convert_processed_device_to_svd_device(self) -> SVDDevice:
         return process_parse_convert_device(self._processed_device)
 
-    def _process_device(self, parsed_device: SVDDevice) -> Device:
+    def reprocess(self, changed_elements: Iterable[Any]) -> Device:
+        # Updates the processed device after the given elements of the parsed device have been changed. Only the
+        # peripherals of the changed elements, the added peripherals and, transitively, the peripherals depending on
+        # them or on a removed peripheral are processed again. A changed device or cpu leads to a full processing.
+        changed: set[int] = set()
+        for element in changed_elements:
+            while element is not None and not isinstance(element, SVDPeripheral | SVDDevice):
+                element = element.parent
+            if element is None:
+                raise ProcessException("Changed element isn't part of a parsed device")
+            if isinstance(element, SVDDevice):
+                return self._reprocess_device()
+            changed.add(id(element))
+            self._peripheral_references.pop(id(element), None)
+
+        parsed_peripherals = self._get_parsed_peripherals()
+        parsed_ids = {id(p) for p in parsed_peripherals}
+        removed = [parsed_id for parsed_id in self._processed_peripherals if parsed_id not in parsed_ids]
+        affected = [p for p in parsed_peripherals if id(p) in changed or id(p) not in self._processed_peripherals]
+
+        # the dependents are found by the names of the affected peripherals before and after the change
+        names = {self._processed_peripherals[parsed_id][1] for parsed_id in removed}
+        for parsed_peripheral in affected:
+            names.add(parsed_peripheral.name)
+            if id(parsed_peripheral) in self._processed_peripherals:
+                names.add(self._processed_peripherals[id(parsed_peripheral)][1])
+
+        dependencies = _PeripheralDependencies(self._parsed_device.peripherals, self._peripheral_references)
+        affected_ids = {id(p) for p in affected}
+        for parsed_peripheral in dependencies.get_dependents(names):
+            if id(parsed_peripheral) in parsed_ids and id(parsed_peripheral) not in affected_ids:
+                affected.append(parsed_peripheral)
+                affected_ids.add(id(parsed_peripheral))
+
+        # a peripheral is kept as processed only once it has been processed again, so an exception doesn't leave
+        # stale peripherals behind
+        for parsed_id in itertools.chain(removed, affected_ids):
+            self._finalized_peripherals.pop(parsed_id, None)
+            self._processed_peripherals.pop(parsed_id, None)
+
+        self._enumerated_value_containers.clear()
+        self._processed_device = self._process_device(dependencies.get_dependencies(affected), affected_ids)
+
+        return self._processed_device
+
+    def _reprocess_device(self) -> Device:
+        self._enumerated_value_containers.clear()
+        self._finalized_peripherals.clear()
+        self._processed_peripherals.clear()
+        self._peripheral_references.clear()
+        self._processed_device = self._process_device(self._get_parsed_peripherals())
+
+        return self._processed_device
+
+    def _get_parsed_peripherals(self) -> list[SVDPeripheral]:
+        # with requested peripherals, only these and the peripherals they depend on are processed
+        if self._peripheral_names is None:
+            return self._parsed_device.peripherals
+
+        dependencies = _PeripheralDependencies(self._parsed_device.peripherals, self._peripheral_references)
+        return dependencies.select(self._peripheral_names)
+
+    def _process_device(self, parsed_peripherals: list[SVDPeripheral], processed: None | set[int] = None) -> Device:
+        # The given peripherals are resolved, and the ones in `processed`, or all, are finalized. The peripherals
+        # finalized before are reused.
+        parsed_device = self._parsed_device
         size = parsed_device.size if parsed_device.size is not None else 32
         access = parsed_device.access if parsed_device.access is not None else AccessType.READ_WRITE
         protection = parsed_device.protection if parsed_device.protection is not None else ProtectionStringType.ANY
         reset_value = parsed_device.reset_value if parsed_device.reset_value is not None else 0
         reset_mask = parsed_device.reset_mask if parsed_device.reset_mask is not None else 0xFFFFFFFF
 
-        try:
-            peripherals = self._resolver.resolve_peripherals(parsed_device)
-        except EnumeratedValueContainerException as e:
-            raise ProcessException("Exception within enumerated value container processing") from e
-        except LoopException as e:
-            raise ProcessException("Resolving stucks in a loop") from e
-        except CycleException as e:
-            raise ProcessException("A circular inheritance was detected during resolving") from e
-        except UnprocessedNodesException as e:
-            raise ProcessException("Some nodes were not processed during resolving") from e
+        # a reprocessing may only need the checks between the peripherals
+        if processed is not None and not parsed_peripherals:
+            peripherals: list[IPeripheral] = []
+        else:
+            peripherals = self._resolve_peripherals(parsed_peripherals)
+
+        if processed is not None:
+            peripherals = [p for p in peripherals if id(p.parsed) in processed]
 
         intermediate_device = IDevice(
             size=size,
@@ -129,10 +395,32 @@ class Process:
 
         _InheritProperties().inherit_properties(intermediate_device)
 
-        device = _ValidateAndFinalize().validate_and_finalize(intermediate_device)
+        device = _ValidateAndFinalize(self._diagnostics).validate_and_finalize(
+            intermediate_device, self._finalized_peripherals
+        )
+        for parsed_peripheral in parsed_peripherals:
+            if processed is None or id(parsed_peripheral) in processed:
+                self._processed_peripherals[id(parsed_peripheral)] = (parsed_peripheral, parsed_peripheral.name)
+
+        # the peripherals, which the requested peripherals depend on, are only processed
+        if self._peripheral_names is not None:
+            device.peripherals = [p for p in device.peripherals if p.name in self._peripheral_names]
 
         return device
 
+    def _resolve_peripherals(self, parsed_peripherals: list[SVDPeripheral]) -> list[IPeripheral]:
+        resolver = Resolver(self, self._resolver_logging_file_path)
+        try:
+            return resolver.resolve_peripherals(self._parsed_device, parsed_peripherals)
+        except EnumeratedValueContainerException as e:
+            raise ProcessException("Exception within enumerated value container processing") from e
+        except LoopException as e:
+            raise ProcessException("Resolving stucks in a loop") from e
+        except CycleException as e:
+            raise ProcessException("A circular inheritance was detected during resolving") from e
+        except UnprocessedNodesException as e:
+            raise ProcessException("Some nodes were not processed during resolving") from e
+
     def _process_cpu(self, parsed_cpu: None | SVDCPU) -> None | CPU:
         if parsed_cpu is None:
             return None
@@ -443,11 +731,13 @@ class Process:
                     field_msb, field_lsb = map(int, match.groups())
 
                     if field_msb < field_lsb:
-                        warnings.warn(
-                            f"BitRange '{bit_range}' has a smaller MSB than LSB. "
-                            f"Switching bitRange to [{field_lsb}:{field_msb}]",
-                            ProcessWarning,
-                        )
+                        if self._diagnostics.enabled:
+                            self._diagnostics.report(
+                                DiagnosticCode.BIT_RANGE_SWAPPED,
+                                f"BitRange '{bit_range}' has a smaller MSB than LSB. "
+                                f"Switching bitRange to [{field_lsb}:{field_msb}]",
+                                _svd_path(parsed_field),
+                            )
                         field_msb, field_lsb = field_lsb, field_msb
                 else:
                     raise ProcessException(f"Invalid bit range format: {parsed_field.bit_range}")
@@ -455,18 +745,35 @@ class Process:
         if field_lsb is None or field_msb is None:
             raise ProcessException("Field must have bit_offset and bit_width, lsb and msb, or bit_range")
 
-        if field_msb < field_lsb:
-            warnings.warn(
+        if self._diagnostics.enabled and field_msb < field_lsb:
+            self._diagnostics.report(
+                DiagnosticCode.FIELD_MSB_BELOW_LSB,
                 f"Field with name '{parsed_field.name}': MSB '{field_msb}' is smaller than LSB '{field_lsb}'",
-                ProcessWarning,
+                _svd_path(parsed_field),
             )
 
         return (field_msb, field_lsb)
 
     def _process_enumerated_value_container(
-        self, parsed_enum_container: SVDEnumeratedValueContainer, lsb: int, msb: int
+        self, parsed_enum_container: SVDEnumeratedValueContainer
     ) -> IEnumeratedValueContainer:
-        return _ProcessEnumeratedValueContainer().create_enumerated_value_container(parsed_enum_container, lsb, msb)
+        # The container of a field is the same for each dim instance and derived replica of the field, and it doesn't
+        # depend on the field. Hence, it is processed once and the fields share the result. The diagnostics of the
+        # processing are reported for each field, as if it was processed again.
+        key = id(parsed_enum_container)
+
+        if key not in self._enumerated_value_containers:
+            recorder = Diagnostics()
+            enum_container = _ProcessEnumeratedValueContainer(
+                recorder if self._diagnostics.enabled else self._diagnostics
+            ).create_enumerated_value_container(parsed_enum_container)
+            self._enumerated_value_containers[key] = (enum_container, recorder.records)
+
+        enum_container, diagnostics = self._enumerated_value_containers[key]
+        for diagnostic in diagnostics:
+            self._diagnostics.report(diagnostic.code, diagnostic.message, diagnostic.path, diagnostic.sourceline)
+
+        return enum_container
 
     def _extract_and_process_dimension(
         self, parsed_element: ParsedDimablePeripheralTypes, base_element: None | IntermediateDimablePeripheralTypes
@@ -489,10 +796,12 @@ class Process:
             raise ProcessException(f"Dim is None, but name '{parsed_element.name}' contains '%s'")
 
         if dim is not None and "%s" not in parsed_element.name:
-            warnings.warn(
-                f"Dim is not None, but name '{parsed_element.name}' does not contain '%s'. Setting dim to None",
-                ProcessWarning,
-            )
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.DIM_WITHOUT_PLACEHOLDER,
+                    f"Dim is not None, but name '{parsed_element.name}' does not contain '%s'. Setting dim to None",
+                    _svd_path(parsed_element),
+                )
             dim = None
 
         if display_name is not None and dim is None and "%s" in display_name:
@@ -585,28 +894,109 @@ def _get_alignment(size_bytes: int) -> int:
         raise ProcessException(f"Unsupported register size: {size_bytes} bytes")
 
 
+class _AlternateGroups:
+    # The names connected by alternates (a name and its alternate are connected), grouped with union-find once per
+    # scope instead of searching all names for each element.
+    def __init__(self, alternates: dict[str, None | str]) -> None:
+        self._alternates = alternates
+        self._alternated_by: dict[str, list[str]] = {}
+        self._parents: dict[str, str] = {}
+
+        for name, alternate in alternates.items():
+            if alternate is not None:
+                self._alternated_by.setdefault(alternate, []).append(name)
+                self._parents[self._find(name)] = self._find(alternate)
+
+        # groups with an alternate that isn't one of the names
+        self._incomplete_roots = {self._find(name) for name in self._parents if name not in alternates}
+
+    def _find(self, name: str) -> str:
+        root = self._parents.setdefault(name, name)
+        while self._parents[root] != root:
+            root = self._parents[root]
+        while self._parents[name] != root:
+            self._parents[name], name = root, self._parents[name]
+        return root
+
+    def is_connected(self, name: str, other: str) -> bool:
+        return name in self._parents and other in self._parents and self._find(name) == self._find(other)
+
+    def is_incomplete(self, name: str) -> bool:
+        return name in self._parents and self._find(name) in self._incomplete_roots
+
+    def get_names(self, name: str) -> set[str]:
+        # the names connected with name, added in depth-first order, since the order of the set is part of diagnostics
+        names: set[str] = set()
+        stack = [name]
+
+        while stack:
+            current = stack.pop()
+            if current in names:
+                continue
+
+            names.add(current)
+            stack.extend(self._alternated_by.get(current, ()))
+            alternate = self._alternates.get(current)
+            if alternate is not None:
+                stack.append(alternate)
+
+        return names
+
+
+class _FieldAccessDomain:
+    # The fields of a register in the read or write domain and the bits they occupy, so a field is checked for overlaps
+    # with one mask test instead of comparing it with each field. Fields with msb below lsb don't occupy bits, so they
+    # are compared by their range as before.
+    def __init__(self, access_label: str) -> None:
+        self._access_label = access_label
+        self._fields: list[Field] = []
+        self._mask = 0
+        self._has_inverted_range = False
+
+    def add(self, field: Field) -> None:
+        if field.mask & self._mask or self._has_inverted_range or field.msb < field.lsb:
+            for existing in self._fields:
+                if field.lsb <= existing.msb and field.msb >= existing.lsb:
+                    raise ProcessException(
+                        f"Field '{field.name}' overlaps with '{existing.name}' in {self._access_label} access"
+                    )
+
+        self._fields.append(field)
+        self._mask |= field.mask
+        self._has_inverted_range |= field.msb < field.lsb
+
+
 class _ValidateAndFinalize:
-    def validate_and_finalize(self, i_device: IDevice) -> Device:
-        # Finalize the device by processing its peripherals.
-        peripherals = self._validate_and_finalize_peripherals(i_device.peripherals)
+    def __init__(self, diagnostics: DiagnosticsSink) -> None:
+        self._diagnostics = diagnostics
+
+    def validate_and_finalize(self, i_device: IDevice, finalized_peripherals: dict[int, list[Peripheral]]) -> Device:
+        # Finalize the device by processing its peripherals. The finalized peripherals are added to
+        # `finalized_peripherals` by id of their parsed peripheral, and the device holds all peripherals in there.
+        peripherals = self._validate_and_finalize_peripherals(i_device.peripherals, finalized_peripherals)
         return Device.from_intermediate_device(i_device, peripherals)
 
-    def _validate_and_finalize_peripherals(self, i_peripherals: list[IPeripheral]) -> list[Peripheral]:
-        peripheral_lookup: dict[str, Peripheral] = {}
-        finalized_peripherals: list[Peripheral] = []
+    def _validate_and_finalize_peripherals(
+        self, i_peripherals: list[IPeripheral], finalized_peripherals: dict[int, list[Peripheral]]
+    ) -> list[Peripheral]:
         for i_peripheral in i_peripherals:
             peripheral = self._validate_and_finalize_peripheral(i_peripheral)
             if peripheral:
-                if peripheral.name in peripheral_lookup:
-                    raise ProcessException(f"Duplicate peripheral name found: {peripheral.name}")
-                peripheral_lookup[peripheral.name] = peripheral
+                finalized_peripherals.setdefault(id(i_peripheral.parsed), []).append(peripheral)
 
-                finalized_peripherals.append(peripheral)
+        # the resolved peripherals are sorted the same way, so the peripherals are checked in their order
+        peripherals = sorted(
+            itertools.chain.from_iterable(finalized_peripherals.values()), key=lambda p: (p.base_address, p.name)
+        )
+        peripheral_lookup: dict[str, Peripheral] = {}
+        for peripheral in peripherals:
+            if peripheral.name in peripheral_lookup:
+                raise ProcessException(f"Duplicate peripheral name found: {peripheral.name}")
+            peripheral_lookup[peripheral.name] = peripheral
 
-        finalized_peripherals.sort(key=lambda p: (p.base_address, p.name))
-        self._check_peripheral_address_overlaps(finalized_peripherals, peripheral_lookup)
+        self._check_peripheral_address_overlaps(peripherals, peripheral_lookup)
 
-        return finalized_peripherals
+        return peripherals
 
     def _validate_and_finalize_peripheral(self, i_peripheral: IPeripheral) -> None | Peripheral:
         # Finalize registers/clusters.
@@ -614,25 +1004,30 @@ class _ValidateAndFinalize:
             i_peripheral.registers_clusters, i_peripheral.base_address
         )
         if not registers_clusters:
-            warnings.warn(
-                f"Peripheral '{i_peripheral.name}' has no registers or clusters. Peripheral will be ignored!",
-                ProcessWarning,
-            )
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.EMPTY_PERIPHERAL,
+                    f"Peripheral '{i_peripheral.name}' has no registers or clusters. Peripheral will be ignored!",
+                    _svd_path(i_peripheral.parsed),
+                )
             return None
 
         # Warn if base address is not 4-byte aligned.
-        if i_peripheral.base_address % 4 != 0:
-            warnings.warn(
+        if self._diagnostics.enabled and i_peripheral.base_address % 4 != 0:
+            self._diagnostics.report(
+                DiagnosticCode.PERIPHERAL_MISALIGNED,
                 f"Peripheral '{i_peripheral.name}' base address is not 4 byte aligned",
-                ProcessWarning,
+                _svd_path(i_peripheral.parsed),
             )
 
         # Check if specified size is a multiple of 8.
         if i_peripheral.size is not None and i_peripheral.size % 8 != 0:
-            warnings.warn(
-                f"Peripheral '{i_peripheral.name}' size must be a multiple of 8. Peripheral will be ignored!",
-                ProcessWarning,
-            )
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.PERIPHERAL_SIZE_INVALID,
+                    f"Peripheral '{i_peripheral.name}' size must be a multiple of 8. Peripheral will be ignored!",
+                    _svd_path(i_peripheral.parsed),
+                )
             return None
 
         # Ensure address blocks are provided.
@@ -683,94 +1078,94 @@ class _ValidateAndFinalize:
         return registers
 
     def _validate_address_blocks(self, i_peripheral: IPeripheral) -> None:
+        if not self._diagnostics.enabled:
+            return
+
         for idx in range(1, len(i_peripheral.address_blocks)):
             prev = i_peripheral.address_blocks[idx - 1]
             curr = i_peripheral.address_blocks[idx]
             if curr.offset < prev.offset + prev.size:
-                warnings.warn(
+                self._diagnostics.report(
+                    DiagnosticCode.ADDRESS_BLOCK_OVERLAP,
                     f"Address block with offset '{curr.offset}' overlaps with address block "
                     f"with offset '{prev.offset}'",
-                    ProcessWarning,
+                    _svd_path(i_peripheral.parsed),
                 )
 
     def _check_peripheral_address_overlaps(
         self, finalized_peripherals: list[Peripheral], peripheral_lookup: dict[str, Peripheral]
     ):
+        alternate_groups = _AlternateGroups(
+            {name: peripheral.alternate_peripheral for name, peripheral in peripheral_lookup.items()}
+        )
+
+        # The peripherals are sorted by base address, so only the intervals that end at or after the base address
+        # can overlap with the current and the following peripherals.
         effective_intervals: list[tuple[int, str]] = []
         specified_intervals: list[tuple[int, str]] = []
         for periph in finalized_peripherals:
-            allowed_names = self._compute_allowed_alternate_peripheral_names(periph, peripheral_lookup)
+            alternate = periph.alternate_peripheral
+            if alternate is not None and alternate_groups.is_incomplete(alternate):
+                raise ProcessException(
+                    f"Alternate peripherals of peripheral '{periph.name}' refer to a peripheral that doesn't exist"
+                )
+            # the intervals are only needed for the diagnostics
+            if not self._diagnostics.enabled:
+                continue
+
+            effective_intervals = [(end, name) for end, name in effective_intervals if periph.base_address <= end]
+            specified_intervals = [(end, name) for end, name in specified_intervals if periph.base_address <= end]
 
             # Check effective address overlaps.
-            for end, name in effective_intervals:
-                if periph.base_address <= end:
-                    if allowed_names:
-                        if name not in allowed_names:
-                            warnings.warn(
-                                f"Effective peripheral address overlap: '{periph.name}' overlaps with '{name}', "
-                                f"which is not among the allowed alternate peripherals {allowed_names}",
-                                ProcessWarning,
-                            )
-                    else:
-                        existing_peripheral = peripheral_lookup[name]
-                        if (
-                            not existing_peripheral.alternate_peripheral
-                            or existing_peripheral.alternate_peripheral != periph.name
-                        ):
-                            warnings.warn(
-                                f"Effective peripheral address overlap: '{periph.name}' overlaps with '{name}'",
-                                ProcessWarning,
-                            )
+            for _, name in effective_intervals:
+                if alternate is not None:
+                    if not alternate_groups.is_connected(name, alternate):
+                        self._diagnostics.report(
+                            DiagnosticCode.PERIPHERAL_OVERLAP,
+                            f"Effective peripheral address overlap: '{periph.name}' overlaps with '{name}', "
+                            f"which is not among the allowed alternate peripherals "
+                            f"{alternate_groups.get_names(alternate)}",
+                            _svd_path(periph.parsed),
+                        )
+                else:
+                    existing_peripheral = peripheral_lookup[name]
+                    if (
+                        not existing_peripheral.alternate_peripheral
+                        or existing_peripheral.alternate_peripheral != periph.name
+                    ):
+                        self._diagnostics.report(
+                            DiagnosticCode.PERIPHERAL_OVERLAP,
+                            f"Effective peripheral address overlap: '{periph.name}' overlaps with '{name}'",
+                            _svd_path(periph.parsed),
+                        )
 
             # Check specified address overlaps.
-            for end, name in specified_intervals:
-                if periph.base_address <= end:
-                    if allowed_names:
-                        if name not in allowed_names:
-                            warnings.warn(
-                                f"Specified peripheral address overlap in address_blocks: '{periph.name}' overlaps "
-                                f"with '{name}', which is not among the allowed alternate peripherals {allowed_names}",
-                                ProcessWarning,
-                            )
-                    else:
-                        existing_peripheral = peripheral_lookup[name]
-                        if (
-                            not existing_peripheral.alternate_peripheral
-                            or existing_peripheral.alternate_peripheral != periph.name
-                        ):
-                            warnings.warn(
-                                f"Specified peripheral address overlap in address_blocks: '{periph.name}' "
-                                f"overlaps with '{name}'",
-                                ProcessWarning,
-                            )
+            for _, name in specified_intervals:
+                if alternate is not None:
+                    if not alternate_groups.is_connected(name, alternate):
+                        self._diagnostics.report(
+                            DiagnosticCode.PERIPHERAL_ADDRESS_BLOCK_OVERLAP,
+                            f"Specified peripheral address overlap in address_blocks: '{periph.name}' overlaps "
+                            f"with '{name}', which is not among the allowed alternate peripherals "
+                            f"{alternate_groups.get_names(alternate)}",
+                            _svd_path(periph.parsed),
+                        )
+                else:
+                    existing_peripheral = peripheral_lookup[name]
+                    if (
+                        not existing_peripheral.alternate_peripheral
+                        or existing_peripheral.alternate_peripheral != periph.name
+                    ):
+                        self._diagnostics.report(
+                            DiagnosticCode.PERIPHERAL_ADDRESS_BLOCK_OVERLAP,
+                            f"Specified peripheral address overlap in address_blocks: '{periph.name}' "
+                            f"overlaps with '{name}'",
+                            _svd_path(periph.parsed),
+                        )
 
             effective_intervals.append((periph.end_address_effective, periph.name))
             specified_intervals.append((periph.end_address, periph.name))
 
-    def _compute_allowed_alternate_peripheral_names(
-        self, periph: Peripheral, peripheral_lookup: dict[str, Peripheral]
-    ) -> set[str]:
-        if periph.alternate_peripheral is None:
-            return set()
-
-        allowed: set[str] = set()
-        stack = [periph.alternate_peripheral]
-
-        while stack:
-            current = stack.pop()
-            if current in allowed:
-                continue
-
-            allowed.add(current)
-            # Add peripherals that have 'current' as their alternate.
-            stack.extend(name for name, p in peripheral_lookup.items() if p.alternate_peripheral == current)
-            # If the current peripheral has an alternate (primary), add it.
-            primary = peripheral_lookup[current].alternate_peripheral
-            if primary is not None:
-                stack.append(primary)
-
-        return allowed
-
     def _validate_and_finalize_registers_clusters(
         self, i_registers_clusters: list[ICluster | IRegister], parent_base: int
     ) -> list[Cluster | Register]:
@@ -823,20 +1218,24 @@ class _ValidateAndFinalize:
 
         # Ensure size is a multiple of 8 if specified.
         if i_reg_cluster.size % 8 != 0:
-            warnings.warn(
-                f"Register/Cluster '{i_reg_cluster.name}' size must be a multiple of 8. "
-                "Register/Cluster will be ignored!",
-                ProcessWarning,
-            )
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.REGISTER_CLUSTER_SIZE_INVALID,
+                    f"Register/Cluster '{i_reg_cluster.name}' size must be a multiple of 8. "
+                    "Register/Cluster will be ignored!",
+                    _svd_path(i_reg_cluster.parsed),
+                )
             return None
 
         # Check that the offset is size aligned.
+        # the alignment also rejects unsupported sizes, so it is checked with disabled diagnostics as well
         alignment = _get_alignment(_to_byte(i_reg_cluster.size))
-        if i_reg_cluster.address_offset % alignment != 0:
-            warnings.warn(
+        if self._diagnostics.enabled and i_reg_cluster.address_offset % alignment != 0:
+            self._diagnostics.report(
+                DiagnosticCode.REGISTER_CLUSTER_MISALIGNED,
                 f"Register/Cluster '{i_reg_cluster.name}' offset ({hex(i_reg_cluster.address_offset)}) "
                 f"is not properly aligned to {alignment} bytes.",
-                ProcessWarning,
+                _svd_path(i_reg_cluster.parsed),
             )
 
         if isinstance(i_reg_cluster, ICluster):
@@ -849,10 +1248,12 @@ class _ValidateAndFinalize:
                     for child in children
                 )
             else:
-                warnings.warn(
-                    f"Cluster '{i_reg_cluster.name}' has no registers. Cluster will be ignored!",
-                    ProcessWarning,
-                )
+                if self._diagnostics.enabled:
+                    self._diagnostics.report(
+                        DiagnosticCode.EMPTY_CLUSTER,
+                        f"Cluster '{i_reg_cluster.name}' has no registers. Cluster will be ignored!",
+                        _svd_path(i_reg_cluster.parsed),
+                    )
                 return None
 
             cluster_size = cluster_effective_end - effective_base + 1
@@ -865,10 +1266,12 @@ class _ValidateAndFinalize:
             )
         elif isinstance(i_reg_cluster, IRegister):  # pyright: ignore[reportUnnecessaryIsInstance]
             if i_reg_cluster.name.lower() == "reserved":
-                warnings.warn(
-                    "Register with name 'reserved'. Register will be ignored!",
-                    ProcessWarning,
-                )
+                if self._diagnostics.enabled:
+                    self._diagnostics.report(
+                        DiagnosticCode.RESERVED_REGISTER,
+                        "Register with name 'reserved'. Register will be ignored!",
+                        _svd_path(i_reg_cluster.parsed),
+                    )
                 return None
 
             if i_reg_cluster.alternate_register is not None and i_reg_cluster.alternate_group is not None:
@@ -890,6 +1293,15 @@ class _ValidateAndFinalize:
         register_lookup: dict[str, Register],
         cluster_lookup: dict[str, Cluster],
     ):
+        alternate_register_groups = _AlternateGroups(
+            {name: register.alternate_register for name, register in register_lookup.items()}
+        )
+        alternate_cluster_groups = _AlternateGroups(
+            {name: cluster.alternate_cluster for name, cluster in cluster_lookup.items()}
+        )
+
+        # The registers and clusters are sorted by base address, so only the intervals that end at or after the base
+        # address can overlap with the current and the following registers and clusters.
         intervals: list[tuple[int, str]] = []
         for item in finalized_rc:
             if isinstance(item, Register) and item.alternate_group is not None:
@@ -897,99 +1309,65 @@ class _ValidateAndFinalize:
 
             # Set type-specific variables.
             if isinstance(item, Register):
-                allowed_names = self._compute_allowed_alternate_register_names(item, register_lookup)
+                alternate = item.alternate_register
+                alternate_groups = alternate_register_groups
                 lookup = register_lookup
                 alt_attr = "alternate_register"
                 type_label = "Register"
+                code = DiagnosticCode.REGISTER_OVERLAP
                 end_addr = item.base_address + _to_byte(item.size) - 1
             else:
-                allowed_names = self._compute_allowed_alternate_cluster_names(item, cluster_lookup)
+                alternate = item.alternate_cluster
+                if alternate is not None and alternate_cluster_groups.is_incomplete(alternate):
+                    raise ProcessException(
+                        f"Alternate clusters of cluster '{item.name}' refer to a cluster that doesn't exist"
+                    )
+                alternate_groups = alternate_cluster_groups
                 lookup = cluster_lookup
                 alt_attr = "alternate_cluster"
                 type_label = "Cluster"
+                code = DiagnosticCode.CLUSTER_OVERLAP
                 end_addr = item.end_address
 
-            # Check for overlapping intervals.
-            for end, name in intervals:
-                if item.base_address <= end:
-                    if allowed_names:
-                        if name not in allowed_names:
-                            warnings.warn(
-                                f"{type_label} '{item.name}' overlaps with '{name}', "
-                                f"which is not among the allowed alternate {type_label.lower()}s {allowed_names}",
-                                ProcessWarning,
-                            )
-                    else:
-                        alt_value = getattr(lookup.get(name, None), alt_attr, None)
-                        if alt_value != item.name:
-                            warnings.warn(
-                                f"{type_label} '{item.name}' overlaps with '{name}'",
-                                ProcessWarning,
-                            )
-
-            intervals.append((end_addr, item.name))
-
-    def _compute_allowed_alternate_register_names(
-        self, register: Register, register_lookup: dict[str, Register]
-    ) -> set[str]:
-        if register.alternate_register is None:
-            return set()
-
-        allowed: set[str] = set()
-        stack = [register.alternate_register]
-
-        while stack:
-            current = stack.pop()
-            if current in allowed:
+            # the intervals are only needed for the diagnostics
+            if not self._diagnostics.enabled:
                 continue
 
-            allowed.add(current)
-            # Add registers that have 'current' as their alternate.
-            stack.extend(name for name, p in register_lookup.items() if p.alternate_register == current)
-            # If the current register has an alternate (primary), add it.
-            try:
-                primary = register_lookup[current].alternate_register
-            except KeyError:
-                primary = None
-
-            if primary is not None:
-                stack.append(primary)
-
-        return allowed
-
-    def _compute_allowed_alternate_cluster_names(
-        self, cluster: Cluster, cluster_lookup: dict[str, Cluster]
-    ) -> set[str]:
-        if cluster.alternate_cluster is None:
-            return set()
+            intervals = [(end, name) for end, name in intervals if item.base_address <= end]
 
-        allowed: set[str] = set()
-        stack = [cluster.alternate_cluster]
-
-        while stack:
-            current = stack.pop()
-            if current in allowed:
-                continue
-
-            allowed.add(current)
-            # Add clusters that have 'current' as their alternate.
-            stack.extend(name for name, p in cluster_lookup.items() if p.alternate_cluster == current)
-            # If the current cluster has an alternate (primary), add it.
-            primary = cluster_lookup[current].alternate_cluster
-            if primary is not None:
-                stack.append(primary)
+            # Check for overlapping intervals.
+            for _, name in intervals:
+                if alternate is not None:
+                    if not alternate_groups.is_connected(name, alternate):
+                        self._diagnostics.report(
+                            code,
+                            f"{type_label} '{item.name}' overlaps with '{name}', "
+                            f"which is not among the allowed alternate {type_label.lower()}s "
+                            f"{alternate_groups.get_names(alternate)}",
+                            _svd_path(item.parsed),
+                        )
+                else:
+                    alt_value = getattr(lookup.get(name, None), alt_attr, None)
+                    if alt_value != item.name:
+                        self._diagnostics.report(
+                            code,
+                            f"{type_label} '{item.name}' overlaps with '{name}'",
+                            _svd_path(item.parsed),
+                        )
 
-        return allowed
+            intervals.append((end_addr, item.name))
 
     def _validate_and_finalize_fields(self, i_fields: list[IField], reg_size: int) -> list[Field]:
         seen_names: set[str] = set()
         fields: list[Field] = []
         for i_field in i_fields:
             if i_field.name.lower() == "reserved":
-                warnings.warn(
-                    "Field with name 'reserved'. Field will be ignored!",
-                    ProcessWarning,
-                )
+                if self._diagnostics.enabled:
+                    self._diagnostics.report(
+                        DiagnosticCode.RESERVED_FIELD,
+                        "Field with name 'reserved'. Field will be ignored!",
+                        _svd_path(i_field.parsed),
+                    )
                 continue
 
             if i_field.name in seen_names:
@@ -1008,43 +1386,30 @@ class _ValidateAndFinalize:
         fields.sort(key=lambda f: f.lsb)
 
         # Check for overlapping fields but difference between access types (same as in SVDConv SvdRegister::CheckFields)
-        read_fields: list[Field] = []
-        write_fields: list[Field] = []
+        read_domain = _FieldAccessDomain("read")
+        write_domain = _FieldAccessDomain("write")
         for field in fields:
             # Check if field exceeds register size
-            if field.msb >= reg_size:
-                warnings.warn(
+            if self._diagnostics.enabled and field.msb >= reg_size:
+                self._diagnostics.report(
+                    DiagnosticCode.FIELD_EXCEEDS_REGISTER,
                     f"Field '{field.name}' msb {field.msb} exceeds register size limit of {reg_size} bits",
-                    ProcessWarning,
+                    _svd_path(field.parsed),
                 )
 
             # Process based on access type
             if field.access == AccessType.READ_ONLY:
                 # Check only the read domain
-                for existing in read_fields:
-                    if field.lsb <= existing.msb and field.msb >= existing.lsb:
-                        raise ProcessException(f"Field '{field.name}' overlaps with '{existing.name}' in read access")
-                read_fields.append(field)
+                read_domain.add(field)
 
             elif field.access == AccessType.WRITE_ONLY:
                 # Check only the write domain
-                for existing in write_fields:
-                    if field.lsb <= existing.msb and field.msb >= existing.lsb:
-                        raise ProcessException(f"Field '{field.name}' overlaps with '{existing.name}' in write access")
-                write_fields.append(field)
+                write_domain.add(field)
 
             elif field.access in {AccessType.READ_WRITE, AccessType.WRITE_ONCE, AccessType.READ_WRITE_ONCE}:
-                # First, check the read domain.
-                for existing in read_fields:
-                    if field.lsb <= existing.msb and field.msb >= existing.lsb:
-                        raise ProcessException(f"Field '{field.name}' overlaps with '{existing.name}' in read access")
-                # If no read conflict, add to read_fields.
-                read_fields.append(field)
-                # Then, check the write domain.
-                for existing in write_fields:
-                    if field.lsb <= existing.msb and field.msb >= existing.lsb:
-                        raise ProcessException(f"Field '{field.name}' overlaps with '{existing.name}' in write access")
-                write_fields.append(field)
+                # First, check the read domain, then the write domain.
+                read_domain.add(field)
+                write_domain.add(field)
 
         return fields
 
@@ -1053,12 +1418,28 @@ class _ValidateAndFinalize:
     ) -> list[EnumeratedValueContainer]:
         enum_value_containers: list[EnumeratedValueContainer] = []
         for i_enum_container in i_enum_containers:
+            enum_values = self._validate_and_finalize_enum_values(i_enum_container.enumerated_values, lsb, msb)
+
+            default = None
+            if i_enum_container.default is not None:
+                default = DefaultEnumeratedValue(
+                    name=i_enum_container.default.name,
+                    description=i_enum_container.default.description,
+                    parsed=i_enum_container.default.parsed,
+                    covered_values=frozenset(
+                        enum_value.value for enum_value in enum_values if not enum_value.dont_care_mask
+                    ),
+                    width=msb - lsb + 1,
+                    covered_dont_care_values=tuple(
+                        (enum_value.value, enum_value.dont_care_mask)
+                        for enum_value in enum_values
+                        if enum_value.dont_care_mask
+                    ),
+                )
+
             enum_value_containers.append(
                 EnumeratedValueContainer.from_intermediate_enum_value_container(
-                    i_enum_container=i_enum_container,
-                    enumerated_values=self._validate_and_finalize_enum_values(
-                        i_enum_container.enumerated_values, lsb, msb
-                    ),
+                    i_enum_container=i_enum_container, enumerated_values=enum_values, default=default
                 )
             )
 
@@ -1067,18 +1448,37 @@ class _ValidateAndFinalize:
     def _validate_and_finalize_enum_values(
         self, i_enum_values: list[IEnumeratedValue], lsb: int, msb: int
     ) -> list[EnumeratedValue]:
+        max_value = 2 ** (msb - lsb + 1) - 1
+
+        # values with do not care bits, which exceed the field, are validated value by value
+        if any(_exceeds_dont_care_value(i_enum_value, max_value) for i_enum_value in i_enum_values):
+            i_enum_values = sorted(
+                (
+                    expanded_value
+                    for i_enum_value in i_enum_values
+                    for expanded_value in (
+                        _expand_dont_care_value(i_enum_value)
+                        if _exceeds_dont_care_value(i_enum_value, max_value)
+                        else (i_enum_value,)
+                    )
+                ),
+                key=lambda ev: ev.value if ev.value is not None else 0,
+            )
+
         enum_values: list[EnumeratedValue] = []
         for i_enum_value in i_enum_values:
             if i_enum_value.value is None:
                 raise ProcessException("Enumerated value must have a value")
 
-            if i_enum_value.value < 0 or i_enum_value.value > (2 ** (msb - lsb + 1) - 1):
-                warnings.warn(
-                    f"Enumerated value '{i_enum_value.name}' with value '{i_enum_value.value}' is outside of the valid "
-                    f"range for a field of width {msb - lsb + 1} (0 to {2 ** (msb - lsb + 1) - 1}). "
-                    "Enumerated value will be ignored.",
-                    ProcessWarning,
-                )
+            if i_enum_value.value < 0 or i_enum_value.value > max_value:
+                if self._diagnostics.enabled:
+                    self._diagnostics.report(
+                        DiagnosticCode.ENUMERATED_VALUE_OUT_OF_RANGE,
+                        f"Enumerated value '{i_enum_value.name}' with value '{i_enum_value.value}' is outside of the "
+                        f"valid range for a field of width {msb - lsb + 1} (0 to {max_value}). "
+                        "Enumerated value will be ignored.",
+                        _svd_path(i_enum_value.parsed),
+                    )
                 continue
 
             enum_values.append(
@@ -1182,94 +1582,66 @@ class _ProcessDimension:
 
 
 class _ProcessEnumeratedValueContainer:
+    def __init__(self, diagnostics: DiagnosticsSink) -> None:
+        self._diagnostics = diagnostics
+
     def create_enumerated_value_container(
-        self, parsed_enum_container: SVDEnumeratedValueContainer, lsb: int, msb: int
+        self, parsed_enum_container: SVDEnumeratedValueContainer
     ) -> IEnumeratedValueContainer:
+        enumerated_values, default = self._process_enumerated_values(parsed_enum_container.enumerated_values)
+
         return IEnumeratedValueContainer(
             name=parsed_enum_container.name,
             header_enum_name=parsed_enum_container.header_enum_name,
             usage=parsed_enum_container.usage if parsed_enum_container.usage is not None else EnumUsageType.READ_WRITE,
-            enumerated_values=self._process_enumerated_values(parsed_enum_container.enumerated_values, lsb, msb),
+            enumerated_values=enumerated_values,
+            default=default,
             parsed=parsed_enum_container,
         )
 
     def _process_enumerated_values(
-        self, parsed_enumerated_values: list[SVDEnumeratedValue], lsb: int, msb: int
-    ) -> list[IEnumeratedValue]:
-        enum_value_validator = _EnumeratedValueValidator()
+        self, parsed_enumerated_values: list[SVDEnumeratedValue]
+    ) -> tuple[list[IEnumeratedValue], None | IEnumeratedValue]:
+        enum_value_validator = _EnumeratedValueValidator(self._diagnostics)
         enumerated_values: list[IEnumeratedValue] = []
 
         for parsed_enumerated_value in parsed_enumerated_values:
-            processed_enumerated_values = self._process_enumerated_value_resolve_wildcard(parsed_enumerated_value)
-
-            for value in processed_enumerated_values:
-                if enum_value_validator.is_value_valid(value):
-                    enumerated_values.append(value)
+            processed_enumerated_value = self._process_enumerated_value_resolve_wildcard(parsed_enumerated_value)
 
-        if default_enumerated_value := enum_value_validator.get_default():
-            enumerated_values = self._extend_enumerated_values_with_default(
-                enumerated_values, default_enumerated_value, lsb, msb
-            )
+            if processed_enumerated_value is not None:
+                enumerated_values.extend(enum_value_validator.get_valid_values(processed_enumerated_value))
 
-        return sorted(enumerated_values, key=lambda ev: ev.value if ev.value is not None else 0)
+        # the default stands for the uncovered values of the field, which are only known with the field width
+        enumerated_values = [value for value in enumerated_values if not value.is_default]
 
-    def _process_enumerated_value_resolve_wildcard(self, parsed_value: SVDEnumeratedValue) -> list[IEnumeratedValue]:
-        value_list = self._convert_enumerated_value(parsed_value.value) if parsed_value.value else [None]
+        return (
+            sorted(enumerated_values, key=lambda ev: ev.value if ev.value is not None else 0),
+            enum_value_validator.get_default(),
+        )
 
-        enumerated_values: list[IEnumeratedValue] = []
-        for value in value_list:
-            name = parsed_value.name
+    def _process_enumerated_value_resolve_wildcard(self, parsed_value: SVDEnumeratedValue) -> None | IEnumeratedValue:
+        value, dont_care_mask = self._convert_enumerated_value(parsed_value.value) if parsed_value.value else (None, 0)
 
-            if name.lower() == "reserved":
-                warnings.warn(
+        if parsed_value.name.lower() == "reserved":
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.RESERVED_ENUMERATED_VALUE,
                     "Enumerated value with name 'reserved' found. Enumerated values with name 'reserved' are ignored.",
-                    ProcessWarning,
+                    _svd_path(parsed_value),
                 )
-                continue
-
-            if value is not None and parsed_value.value:
-                substring = (
-                    parsed_value.value[2:]
-                    if parsed_value.value.lower().startswith("0x")
-                    else parsed_value.value.lower()
-                )
-                if "x" in substring.lower():
-                    name = f"{name}_{value}"
-
-            enumerated_values.append(
-                IEnumeratedValue(
-                    name=name,
-                    description=parsed_value.description,
-                    value=value,
-                    is_default=parsed_value.is_default or False,
-                    parsed=parsed_value,
-                )
-            )
-
-        return enumerated_values
-
-    def _extend_enumerated_values_with_default(
-        self, enumerated_values: list[IEnumeratedValue], default: IEnumeratedValue, lsb: int, msb: int
-    ) -> list[IEnumeratedValue]:
-        covered_values = {value.value for value in enumerated_values if value.value is not None}
-        all_possible_values = set(range(pow(2, msb - lsb + 1)))
-
-        uncovered_values = all_possible_values - covered_values
-
-        for value in uncovered_values:
-            enumerated_values.append(
-                IEnumeratedValue(
-                    name=f"{default.name}_{value}",
-                    description=default.description,
-                    value=value,
-                    is_default=False,
-                    parsed=default.parsed,
-                )
-            )
+            return None
 
-        return [value for value in enumerated_values if not value.is_default]
+        # values with 'x' bits are kept as value and mask, instead of one enumerated value per value
+        return IEnumeratedValue(
+            name=parsed_value.name,
+            description=parsed_value.description,
+            value=value,
+            is_default=parsed_value.is_default or False,
+            dont_care_mask=dont_care_mask,
+            parsed=parsed_value,
+        )
 
-    def _convert_enumerated_value(self, input_str: str) -> list[int]:
+    def _convert_enumerated_value(self, input_str: str) -> tuple[int, int]:
         # transfer binary value to a string int function can handle
         input_str = input_str.lower().replace("#", "0b")
 
@@ -1277,57 +1649,75 @@ class _ProcessEnumeratedValueContainer:
             if input_str.startswith("0b"):
                 return self._process_binary_value_with_wildcard(input_str[2:])
             elif input_str.startswith("0x"):
-                return [int(input_str, 16)]
+                return (int(input_str, 16), 0)
             elif input_str.isdigit():
-                return [int(input_str)]
+                return (int(input_str), 0)
             else:
                 raise ProcessException(f"Unrecognized format for input: '{input_str}'")
         except ValueError as exc:
             raise ProcessException(f"Error processing input '{input_str}': {exc}") from exc
 
-    def _process_binary_value_with_wildcard(self, binary_str: str) -> list[int]:
-        if "x" in binary_str.lower():
-            return [int(b, 2) for b in self._replace_x_combinations(binary_str.lower())]
-        return [int(binary_str, 2)]
+    def _process_binary_value_with_wildcard(self, binary_str: str) -> tuple[int, int]:
+        # value with the 'x' bits set to 0 and the mask of the 'x' bits
+        value = int(binary_str.replace("x", "0"), 2)
+        dont_care_mask = int(binary_str.translate(str.maketrans("01x", "001")), 2)
 
-    def _replace_x_combinations(self, binary_str: str) -> list[str]:
-        x_count = binary_str.count("x")
-        combinations = itertools.product("01", repeat=x_count)
-        return [self._replace_x_with_combination(binary_str, combination) for combination in combinations]
-
-    def _replace_x_with_combination(self, binary_str: str, combination: tuple[str, ...]) -> str:
-        temp_str = binary_str
-        for bit in combination:
-            temp_str = temp_str.replace("x", bit, 1)
-        return temp_str
+        return (value, dont_care_mask)
 
 
 class _EnumeratedValueValidator:
-    def __init__(self):
+    def __init__(self, diagnostics: DiagnosticsSink):
+        self._diagnostics = diagnostics
         self._seen_names: set[str] = set()
         self._seen_values: dict[int, str] = {}
+        # values with do not care bits stand for the values `<name>_<value>`, which are checked against their masks
+        self._seen_dont_care_values: list[tuple[str, int, int]] = []
+        self._seen_dont_care_values_by_name: dict[str, list[tuple[int, int]]] = {}
+        self._seen_name_suffixes: dict[str, set[int]] = {}
         self._seen_default = None
 
+    def get_valid_values(self, value: IEnumeratedValue) -> list[IEnumeratedValue]:
+        if not value.dont_care_mask:
+            return [value] if self.is_value_valid(value) else []
+
+        if value.value is not None and not value.is_default and self._is_dont_care_value_distinct(value):
+            self._seen_dont_care_values.append((value.name, value.value, value.dont_care_mask))
+            self._seen_dont_care_values_by_name.setdefault(value.name, []).append((value.value, value.dont_care_mask))
+            return [value]
+
+        # validate each value on its own, if the value overlaps with another one or is the default
+        return [expanded for expanded in _expand_dont_care_value(value) if self.is_value_valid(expanded)]
+
     def is_value_valid(self, value: IEnumeratedValue) -> bool:
         # Ensure enumerated value names and values are unique
-        if value.name in self._seen_names:
-            warnings.warn(f"Duplicate enumerated value name found: {value.name}. Ignoring value.", ProcessWarning)
+        if value.name in self._seen_names or self._is_name_of_dont_care_value(value.name):
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.DUPLICATE_ENUMERATED_VALUE_NAME,
+                    f"Duplicate enumerated value name found: {value.name}. Ignoring value.",
+                    _svd_path(value.parsed),
+                )
             return False
-        if value.value in self._seen_values:
-            warnings.warn(
-                f"Duplicate enumerated value value found for enumerated value with name "
-                f"'{value.name}' and value '{value.value}'. "
-                f"Enumerated value '{self._seen_values[value.value]}' has the same value."
-                f"Ignoring enumerated value with name '{value.name}' and value '{value.value}'.",
-                ProcessWarning,
-            )
+        if value.value is not None and (seen_name := self._get_seen_name_of_value(value.value)) is not None:
+            if self._diagnostics.enabled:
+                self._diagnostics.report(
+                    DiagnosticCode.DUPLICATE_ENUMERATED_VALUE_VALUE,
+                    f"Duplicate enumerated value value found for enumerated value with name "
+                    f"'{value.name}' and value '{value.value}'. "
+                    f"Enumerated value '{seen_name}' has the same value."
+                    f"Ignoring enumerated value with name '{value.name}' and value '{value.value}'.",
+                    _svd_path(value.parsed),
+                )
             return False
         if value.is_default:
             if value.value is not None:
-                warnings.warn(
-                    f"Default value '{value.name}' has a value '{value.value}'. " f"Ignoring value for default value.",
-                    ProcessWarning,
-                )
+                if self._diagnostics.enabled:
+                    self._diagnostics.report(
+                        DiagnosticCode.DEFAULT_ENUMERATED_VALUE_WITH_VALUE,
+                        f"Default value '{value.name}' has a value '{value.value}'. "
+                        f"Ignoring value for default value.",
+                        _svd_path(value.parsed),
+                    )
                 value.value = None
             if self._seen_default:
                 raise ProcessException("Multiple default values found")
@@ -1335,10 +1725,69 @@ class _EnumeratedValueValidator:
 
         # Add to seen names and values
         self._seen_names.add(value.name)
+        prefix, _, suffix = value.name.rpartition("_")
+        if _is_decimal_suffix(suffix):
+            self._seen_name_suffixes.setdefault(prefix, set()).add(int(suffix))
         if value.value is not None:
             self._seen_values[value.value] = value.name
 
         return True
 
+    def _is_dont_care_value_distinct(self, value: IEnumeratedValue) -> bool:
+        # no value and no name `<name>_<value>` of the do not care value is taken yet
+        dont_care_value, mask = value.value or 0, value.dont_care_mask
+        if any(_matches_dont_care_value(dont_care_value, mask, seen_value) for seen_value in self._seen_values):
+            return False
+        if any(
+            (dont_care_value ^ seen_value) & ~(mask | seen_mask) == 0
+            for _, seen_value, seen_mask in self._seen_dont_care_values
+        ):
+            return False
+        return not any(
+            _matches_dont_care_value(dont_care_value, mask, suffix)
+            for suffix in self._seen_name_suffixes.get(value.name, ())
+        )
+
+    def _is_name_of_dont_care_value(self, name: str) -> bool:
+        prefix, _, suffix = name.rpartition("_")
+        if not _is_decimal_suffix(suffix):
+            return False
+        return any(
+            _matches_dont_care_value(seen_value, seen_mask, int(suffix))
+            for seen_value, seen_mask in self._seen_dont_care_values_by_name.get(prefix, ())
+        )
+
+    def _get_seen_name_of_value(self, value: int) -> None | str:
+        if value in self._seen_values:
+            return self._seen_values[value]
+        for seen_name, seen_value, seen_mask in self._seen_dont_care_values:
+            if _matches_dont_care_value(seen_value, seen_mask, value):
+                return f"{seen_name}_{value}"
+        return None
+
     def get_default(self) -> None | IEnumeratedValue:
         return self._seen_default
+
+
+def _is_decimal_suffix(suffix: str) -> bool:
+    return suffix.isdigit() and str(int(suffix)) == suffix
+
+
+def _matches_dont_care_value(dont_care_value: int, dont_care_mask: int, value: int) -> bool:
+    return value & ~dont_care_mask == dont_care_value
+
+
+def _exceeds_dont_care_value(value: IEnumeratedValue, max_value: int) -> bool:
+    return value.dont_care_mask != 0 and (value.value or 0) | value.dont_care_mask > max_value
+
+
+def _expand_dont_care_value(value: IEnumeratedValue) -> Iterator[IEnumeratedValue]:
+    # one enumerated value per value, named `<name>_<value>`, sorted by value
+    for expanded_value in iter_dont_care_values(value.value or 0, value.dont_care_mask):
+        yield IEnumeratedValue(
+            name=f"{value.name}_{expanded_value}",
+            description=value.description,
+            value=expanded_value,
+            is_default=value.is_default,
+            parsed=value.parsed,
+        )
@@ -1,10 +1,15 @@
 from collections import defaultdict, deque
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import cast, Callable, DefaultDict, Deque
 import tempfile
 import copy
+import heapq
+import itertools
 import rustworkx as rx
 from rustworkx.visualization import graphviz_draw  # pyright: ignore[reportUnknownVariableType]
 
+from svdsuite.model.type_alias import IntermediateDimablePeripheralTypes
 from svdsuite.resolve.graph_elements import (
     ResolverNode,
     ElementNode,
@@ -16,42 +21,95 @@ from svdsuite.resolve.graph_elements import (
 from svdsuite.resolve.exception import ResolverGraphException
 
 
+type _NameIndex = dict[tuple[ElementNode, None | str, ElementLevel], list[ElementNode]]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _SharedDescendants:
+    target_node: ElementNode
+    source_node: ElementNode
+    descendants: list[int]  # rx indices of the descendants of source_node, in replication order
+    orders: Sequence[int]  # orders of the replicas of descendants
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _DimInstances:
+    template_node: ElementNode
+    parents: list[ElementNode]
+    children: list[ElementNode]  # of template_node, each instance has the same children
+    processed_elements: list[IntermediateDimablePeripheralTypes]
+    names: frozenset[None | str]  # of processed_elements
+    orders: Sequence[int]  # orders of the instances, for each parent and processed element
+
+
+type _PendingAppend = _SharedDescendants | _DimInstances
+
+
 class ResolverGraph:
     def __init__(self):
         self._graph: rx.PyDiGraph[ResolverNode, EdgeType] = rx.PyDiGraph(check_cycle=True)  # pylint: disable=no-member
         self._node_to_rx_index: dict[ResolverNode, int] = {}
-        self._placeholders: list[PlaceholderNode] = []
-        self._unprocessed_rx_indicies: list[int] = []
+        # placeholders with their insertion number, dict instead of list for O(1) removal
+        self._placeholders: dict[PlaceholderNode, int] = {}
+        self._placeholder_counter = itertools.count()
+
+        # the scheduling state of the resolver, kept up to date with every added node, changed edge and processed node,
+        # so that a round of the resolver only visits the nodes and placeholders that may have become processable
+        self._unprocessed_nodes: set[ElementNode] = set()
+        self._root_node_candidates: dict[ElementNode, None] = {}  # may have got an incoming CHILD_RESOLVED edge
+        self._ready_placeholders: set[PlaceholderNode] = set()  # parent is processed
+
+        # The order of a node is the rx index it would have if all replicated descendants were copied immediately.
+        # rustworkx reuses the index of the last removed node first, which is replayed here. The processing and
+        # finalization order is based on it, so it doesn't depend on when shared descendants are materialized.
+        self._order: dict[ResolverNode, int] = {}
+        self._free_orders: list[int] = []
+        self._next_order = 0
+
+        # Children which are not yet added to the graph, i.e. the replicated descendants of derived nodes, which are
+        # still the ones of their base node (copy-on-write), and the instances of dim nodes, which are kept as a single
+        # template node. They are added on the first access of the children of their parents (or the parents of their
+        # children), in the order they were appended, otherwise they are instantiated for finalization.
+        self._pending_appends: dict[ElementNode, list[_PendingAppend]] = {}
+        self._pending_dim_parents: dict[ElementNode, _DimInstances] = {}  # children of the dim templates
+        self._frozen_descendants: dict[ElementNode, list[int]] = {}  # of processed subtrees, which don't change anymore
+        self._finalization_parents: dict[ElementNode, list[ElementNode]] = {}  # of instantiated nodes and dim children
+
+        # element nodes by (parent, name, level), kept up to date with every added and removed edge, so that a
+        # derivedFrom path is resolved without scanning all children of each path segment
+        self._children_by_name: _NameIndex = {}  # CHILD_UNRESOLVED and CHILD_RESOLVED edges
+        self._derived_by_name: _NameIndex = {}  # DERIVE edges
 
     def add_root(self, root: ElementNode):
-        rx_index = self._graph.add_node(root)
-        self._node_to_rx_index[root] = rx_index
+        self._add_node(root)
 
     def add_element_child(self, parent: ElementNode, child: ElementNode, edge_type: EdgeType):
-        parent_rx_index = self._node_to_rx_index[parent]
-        child_rx_index = self._graph.add_node(child)
-        self._graph.add_edge(parent_rx_index, child_rx_index, edge_type)
+        self._materialize_children(parent)
 
-        self._node_to_rx_index[child] = child_rx_index
+        parent_rx_index = self._node_to_rx_index[parent]
+        child_rx_index = self._add_node(child)
+        self._add_edge(parent_rx_index, child_rx_index, edge_type)
 
     def add_edge(self, parent: ElementNode, child: ElementNode | PlaceholderNode, edge_type: EdgeType):
+        self._materialize_children(parent)
+
         try:
-            self._graph.add_edge(self._node_to_rx_index[parent], self._node_to_rx_index[child], edge_type)
+            self._add_edge(self._node_to_rx_index[parent], self._node_to_rx_index[child], edge_type)
         except rx.DAGWouldCycle as exc:  # pylint: disable=no-member
             message = f"Inheritance cycle detected for parent node '{parent}' and child node {child}"
             raise ResolverGraphException(message) from exc
 
     def add_placeholder(self, placeholder: PlaceholderNode, derivation_node: ElementNode):
         derivation_node_rx_index = self._node_to_rx_index[derivation_node]
-        placeholder_rx_index = self._graph.add_node(placeholder)
+        placeholder_rx_index = self._add_node(placeholder)
         self._graph.add_edge(placeholder_rx_index, derivation_node_rx_index, EdgeType.PLACEHOLDER)
 
-        self._node_to_rx_index[placeholder] = placeholder_rx_index
-
-        self._placeholders.append(placeholder)
-
     def get_placeholders(self) -> list[PlaceholderNode]:
-        return self._placeholders
+        return list(self._placeholders)
+
+    def get_ready_placeholders(self) -> list[PlaceholderNode]:
+        # placeholders whose parent is processed, in the order of `get_placeholders`
+        return sorted(self._ready_placeholders, key=self._placeholders.__getitem__)
 
     def get_placeholder_co_parent(self, placeholder: PlaceholderNode) -> None | ElementNode:
         children = self._graph.successors(self._node_to_rx_index[placeholder])
@@ -76,6 +134,12 @@ class ResolverGraph:
         return parents[0]
 
     def get_element_parents(self, node: ElementNode) -> list[ElementNode]:
+        if node in self._finalization_parents:
+            return self._finalization_parents[node]
+
+        if node in self._pending_dim_parents:
+            self._materialize(self._pending_dim_parents[node])
+
         incoming_edges = self._graph.in_edges(self._node_to_rx_index[node])
 
         parents = [
@@ -88,6 +152,8 @@ class ResolverGraph:
         return cast(list[ElementNode], parents)
 
     def get_element_childrens(self, node: ElementNode) -> list[ElementNode]:
+        self._materialize_children(node)
+
         outgoing_edges = self._graph.out_edges(self._node_to_rx_index[node])
 
         children = [
@@ -99,6 +165,26 @@ class ResolverGraph:
 
         return cast(list[ElementNode], children)
 
+    def get_element_children_by_name(self, node: ElementNode, name: str, level: ElementLevel) -> list[ElementNode]:
+        # same nodes as in `get_element_childrens`, filtered by name and level
+        self._materialize_children_by_name(node, name, level)
+
+        return self._children_by_name.get((node, name, level), [])
+
+    def get_element_siblings_by_name(self, node: ElementNode, name: str, level: ElementLevel) -> list[ElementNode]:
+        # same nodes as in `get_element_siblings`, filtered by name and level
+        parents = self.get_element_parents(node)
+
+        if not parents:
+            return []
+
+        self._materialize_children_by_name(parents[0], name, level)
+
+        key = (parents[0], name, level)
+        siblings = self._children_by_name.get(key, []) + self._derived_by_name.get(key, [])
+
+        return [sibling for sibling in siblings if sibling is not node]
+
     def get_element_siblings(self, node: ElementNode) -> list[ElementNode]:
         parents = self.get_element_parents(node)
 
@@ -108,6 +194,7 @@ class ResolverGraph:
         # _ElementNode has one parent, except resolved dim nodes, which may have multiple with the same children
         # hence, the first parent suffices to find siblings
         parent = parents[0]
+        self._materialize_children(parent)
 
         siblings: list[ElementNode] = []
         for child in self._graph.successors(self._node_to_rx_index[parent]):
@@ -122,17 +209,31 @@ class ResolverGraph:
         return siblings
 
     def remove_placeholder(self, placeholder: PlaceholderNode):
+        # the child of the placeholder is no longer blocked by it
+        for _, child_rx_index, _ in self._graph.out_edges(self._node_to_rx_index[placeholder]):
+            self._add_root_node_candidate(child_rx_index)
+
         self._remove_node(placeholder)
-        self._placeholders.remove(placeholder)
+        del self._placeholders[placeholder]
+        self._ready_placeholders.discard(placeholder)
 
     def remove_node(self, node: ElementNode):
         self._remove_node(node)
 
     def _remove_node(self, node: ElementNode | PlaceholderNode):
         rx_index = self._node_to_rx_index[node]
+
+        for parent_rx_index, child_rx_index, edge_type in self._graph.in_edges(rx_index):
+            self._update_name_index(parent_rx_index, child_rx_index, edge_type, add=False)
+        for parent_rx_index, child_rx_index, edge_type in self._graph.out_edges(rx_index):
+            self._update_name_index(parent_rx_index, child_rx_index, edge_type, add=False)
+
         self._graph.remove_node(rx_index)
 
         del self._node_to_rx_index[node]
+        self._free_orders.append(self._order.pop(node))
+        if isinstance(node, ElementNode):
+            self._unprocessed_nodes.discard(node)
 
     def has_incoming_edge_of_types(self, node: ElementNode, edge_types_to_find: set[EdgeType]) -> bool:
         rx_index = self._node_to_rx_index[node]
@@ -142,28 +243,42 @@ class ResolverGraph:
         return False
 
     def get_topological_sorted_nodes(self, nodes: list[ElementNode]) -> list[ElementNode]:
-        def sort_key(node: ResolverNode) -> str:
-            # correct type of node for static type checking
-            node = cast(ElementNode, node)
+        # Lexicographical topological sort of the unprocessed nodes by (key, order), i.e. the order of
+        # `rx.lexicographical_topological_sort` on the subgraph of the nodes. Unlike building the subgraph, only the
+        # edges of the given nodes are visited.
+        def sort_key(rx_index: int) -> tuple[str, int, int]:
+            order = self._order[self._graph[rx_index]]
 
             # derived nodes should be processed as late as possible
-            if self.has_incoming_edge_of_types(node, {EdgeType.DERIVE}):
-                return "B"
+            for _, _, edge_type in self._graph.in_edges(rx_index):
+                if edge_type == EdgeType.DERIVE:
+                    return ("B", order, rx_index)
 
-            return "A"
+            return ("A", order, rx_index)
 
-        subgraph = self._graph.subgraph(
-            [self._node_to_rx_index[node] for node in nodes if node.status == NodeStatus.UNPROCESSED]
-        )
+        in_degrees = {self._node_to_rx_index[node]: 0 for node in nodes if node.status == NodeStatus.UNPROCESSED}
+        for rx_index in in_degrees:
+            for _, child_rx_index, _ in self._graph.out_edges(rx_index):
+                if child_rx_index in in_degrees:
+                    in_degrees[child_rx_index] += 1
 
-        topological_sorted_nodes = rx.lexicographical_topological_sort(  # pylint: disable=no-member
-            subgraph, key=sort_key
-        )
+        heap = [sort_key(rx_index) for rx_index, in_degree in in_degrees.items() if in_degree == 0]
+        heapq.heapify(heap)
 
-        del subgraph
+        topological_sorted_nodes: list[ElementNode] = []
+        while heap:
+            _, _, rx_index = heapq.heappop(heap)
+            topological_sorted_nodes.append(cast(ElementNode, self._graph[rx_index]))
 
-        # correct type of topological_sorted_nodes for static type checking
-        return cast(list[ElementNode], topological_sorted_nodes)
+            for _, child_rx_index, _ in self._graph.out_edges(rx_index):
+                if child_rx_index not in in_degrees:
+                    continue
+
+                in_degrees[child_rx_index] -= 1
+                if in_degrees[child_rx_index] == 0:
+                    heapq.heappush(heap, sort_key(child_rx_index))
+
+        return topological_sorted_nodes
 
     def get_base_element_node(self, derive_node: ElementNode) -> None | ElementNode:
         for parent_rx_index, _, edge_type in self._graph.in_edges(self._node_to_rx_index[derive_node]):
@@ -176,14 +291,37 @@ class ResolverGraph:
         parent_rx_index = self._node_to_rx_index[parent]
         child_rx_index = self._node_to_rx_index[child]
 
+        edge_type = self._graph.get_edge_data(parent_rx_index, child_rx_index)
         self._graph.remove_edge(parent_rx_index, child_rx_index)
+        self._update_name_index(parent_rx_index, child_rx_index, edge_type, add=False)
 
     def update_edge(self, parent: ElementNode, child: ElementNode, edge_type: EdgeType):
         parent_rx_index = self._node_to_rx_index[parent]
         child_rx_index = self._node_to_rx_index[child]
 
+        self._update_edge(parent_rx_index, child_rx_index, edge_type)
+
+    def resolve_child_edges(self, node: ElementNode):
+        # updates the edges to the children of node to CHILD_RESOLVED, shared descendants are attached with this type
+        rx_index = self._node_to_rx_index[node]
+
+        for _, child_rx_index, edge_type in self._graph.out_edges(rx_index):
+            if edge_type in (EdgeType.CHILD_UNRESOLVED, EdgeType.CHILD_RESOLVED) and isinstance(
+                self._graph[child_rx_index], ElementNode
+            ):
+                self._update_edge(rx_index, child_rx_index, EdgeType.CHILD_RESOLVED)
+
+    def _update_edge(self, parent_rx_index: int, child_rx_index: int, edge_type: EdgeType):
+        previous_edge_type = self._graph.get_edge_data(parent_rx_index, child_rx_index)
         self._graph.update_edge(parent_rx_index, child_rx_index, edge_type)
 
+        if edge_type == EdgeType.CHILD_RESOLVED:
+            self._add_root_node_candidate(child_rx_index)
+
+        if self._get_name_index(previous_edge_type) is not self._get_name_index(edge_type):
+            self._update_name_index(parent_rx_index, child_rx_index, previous_edge_type, add=False)
+            self._update_name_index(parent_rx_index, child_rx_index, edge_type, add=True)
+
     def get_placeholder_child(self, placeholder: PlaceholderNode) -> ElementNode:
         outgoing_edges = self._graph.out_edges(self._node_to_rx_index[placeholder])
 
@@ -219,12 +357,31 @@ class ResolverGraph:
         return cast(ElementNode, parents[0])
 
     def replicate_descendants(self, source_node: ElementNode, target_node: ElementNode):
-        source_rx_index = self._node_to_rx_index[source_node]
+        self._materialize_children(target_node)
+
+        descendants, frozen = self._get_descendants(source_node)
+        orders = self._allocate_orders(len(descendants))
+
+        # Copy-on-write: the descendants of a processed subtree without placeholders don't change anymore, so they are
+        # only copied if the children of target_node are accessed. Otherwise, they are instantiated for finalization.
+        if frozen and descendants:
+            shared = _SharedDescendants(target_node, source_node, descendants, orders)
+            self._pending_appends.setdefault(target_node, []).append(shared)
+            return
+
+        self._replicate(source_node, target_node, descendants, orders)
+
+    def _get_descendants(self, source_node: ElementNode) -> tuple[list[int], bool]:
+        if source_node in self._frozen_descendants:
+            return self._frozen_descendants[source_node], True
 
         # get rx_index for all descendants of source_node, excluding edges of type _EdgeType.DERIVE
-        rx_indices_to_replicate: set[int] = set()
+        # the set of their orders gives the replication order of the rx indices, as if the orders were the rx indices
+        orders_to_replicate: set[int] = set()
+        order_to_rx_index: dict[int, int] = {}
+        frozen = source_node.status == NodeStatus.PROCESSED
         visited: set[int] = set()
-        stack: list[int] = [source_rx_index]
+        stack: list[int] = [self._node_to_rx_index[source_node]]
 
         while stack:
             current_rx_index = stack.pop()
@@ -232,45 +389,59 @@ class ResolverGraph:
                 continue
             visited.add(current_rx_index)
 
+            # pending appends of the subtree are added before
+            self._materialize_children(self._graph[current_rx_index])
+
             # get outgoing edges
             for _, child_rx_index, edge_type in self._graph.out_edges(current_rx_index):
                 if edge_type == EdgeType.DERIVE:
                     continue
-                rx_indices_to_replicate.add(child_rx_index)
+
+                child = self._graph[child_rx_index]
+                orders_to_replicate.add(self._order[child])
+                order_to_rx_index[self._order[child]] = child_rx_index
                 stack.append(child_rx_index)
 
-        # replicate the nodes and map the indicies
-        replica_mapping: dict[int, int] = {}
-        for rx_index in rx_indices_to_replicate:
-            existing_node = self._graph[rx_index]
-            new_node = self._create_replicated_node(existing_node)
-            new_node_rx_index = self._graph.add_node(new_node)
-            replica_mapping[rx_index] = new_node_rx_index
+                if not isinstance(child, ElementNode) or child.status != NodeStatus.PROCESSED:
+                    frozen = False
+
+        descendants = [order_to_rx_index[order] for order in orders_to_replicate]
+
+        if frozen:
+            self._frozen_descendants[source_node] = descendants
 
-            self._node_to_rx_index[new_node] = new_node_rx_index
+        return descendants, frozen
 
-            if isinstance(new_node, PlaceholderNode):
-                self._placeholders.append(new_node)
+    def _replicate(
+        self, source_node: ElementNode, target_node: ElementNode, descendants: list[int], orders: Sequence[int]
+    ):
+        source_rx_index = self._node_to_rx_index[source_node]
+
+        # replicate the nodes and map the indicies
+        replica_mapping: dict[int, int] = {}
+        for rx_index, order in zip(descendants, orders):
+            new_node = self._create_replicated_node(self._graph[rx_index])
+            replica_mapping[rx_index] = self._add_node(new_node, order)
 
         # replicate the edges
-        for rx_index in rx_indices_to_replicate:
+        for rx_index in descendants:
             # replicate outgoing _EdgeType.PROCESSED and _EdgeType.UNPROCESSED edges
             for _, child_rx_index, edge_type in self._graph.out_edges(rx_index):
-                if child_rx_index not in rx_indices_to_replicate:
+                if child_rx_index not in replica_mapping:
                     continue
 
-                self._graph.add_edge(replica_mapping[rx_index], replica_mapping[child_rx_index], edge_type)
+                self._add_edge(replica_mapping[rx_index], replica_mapping[child_rx_index], edge_type)
 
             # replicate incoming _EdgeType.DERIVE edges
             for parent_rx_index, _, edge_type in self._graph.in_edges(rx_index):
                 if edge_type == EdgeType.DERIVE:
-                    self._graph.add_edge(parent_rx_index, replica_mapping[rx_index], edge_type)
+                    self._add_edge(parent_rx_index, replica_mapping[rx_index], edge_type)
 
         # find immediate children of source_node that are part of the replication
         immediate_children = [
             child_rx_index
             for _, child_rx_index, _ in self._graph.out_edges(source_rx_index)
-            if child_rx_index in rx_indices_to_replicate
+            if child_rx_index in replica_mapping
         ]
 
         # attach the replicated subgraph to target_node
@@ -278,9 +449,9 @@ class ResolverGraph:
         for child_rx_index in immediate_children:
             replicated_child_rx_index = replica_mapping[child_rx_index]
             if isinstance(self._graph[replicated_child_rx_index], PlaceholderNode):
-                self._graph.add_edge(target_rx_index, replicated_child_rx_index, EdgeType.PLACEHOLDER)
+                self._add_edge(target_rx_index, replicated_child_rx_index, EdgeType.PLACEHOLDER)
             else:
-                self._graph.add_edge(
+                self._add_edge(
                     target_rx_index,
                     replicated_child_rx_index,
                     (
@@ -290,24 +461,191 @@ class ResolverGraph:
                     ),
                 )
 
-    def get_unprocessed_root_nodes(self) -> list[ElementNode]:
-        def filter_function(node: ResolverNode) -> bool:
-            return isinstance(node, ElementNode) and node.status == NodeStatus.UNPROCESSED
+    def add_dim_instances(
+        self, template_node: ElementNode, processed_elements: list[IntermediateDimablePeripheralTypes]
+    ):
+        # Each parent of template_node gets a processed node for each processed element, with the children of
+        # template_node as children. They are pending appends until they are accessed, so that the graph grows with the
+        # number of dim nodes instead of the number of their instances.
+        parents = self.get_element_parents(template_node)
+        children = self.get_element_childrens(template_node)
+
+        dim_instances = _DimInstances(
+            template_node,
+            parents,
+            children,
+            processed_elements,
+            frozenset(processed_element.name for processed_element in processed_elements),
+            self._allocate_orders(len(parents) * len(processed_elements)),
+        )
 
-        rx_indices = self._graph.filter_nodes(filter_function)
-        self._unprocessed_rx_indicies = list(rx_indices)
+        for parent in parents:
+            self._pending_appends.setdefault(parent, []).append(dim_instances)
+        for child in children:
+            self._pending_dim_parents[child] = dim_instances
+
+    def _materialize_children(self, node: ResolverNode):
+        # must be called before the children of node are accessed or extended, to keep the order of the edges
+        if isinstance(node, ElementNode) and node in self._pending_appends:
+            self._materialize(self._pending_appends[node][-1])
+
+    def _materialize_children_by_name(self, node: ElementNode, name: str, level: ElementLevel):
+        # like `_materialize_children`, but dim instances are only added if one of them has the name
+        matches = [
+            pending
+            for pending in self._pending_appends.get(node, [])
+            if isinstance(pending, _SharedDescendants)
+            or (pending.template_node.level == level and name in pending.names)
+        ]
+
+        if matches:
+            self._materialize(matches[-1])
+
+    def _materialize(self, pending: _PendingAppend):
+        parents = [pending.target_node] if isinstance(pending, _SharedDescendants) else pending.parents
+
+        # the pending appends to the same parents, which were appended before, are added first
+        for parent in parents:
+            while self._pending_appends[parent][0] is not pending:
+                self._materialize(self._pending_appends[parent][0])
+
+        for parent in parents:
+            self._pending_appends[parent].pop(0)
+            if not self._pending_appends[parent]:
+                del self._pending_appends[parent]
+
+        if isinstance(pending, _SharedDescendants):
+            self._replicate(pending.source_node, pending.target_node, pending.descendants, pending.orders)
+            return
+
+        for child in pending.children:
+            del self._pending_dim_parents[child]
+
+        instance_rx_indices: list[int] = []
+        orders = iter(pending.orders)
+        for parent in pending.parents:
+            parent_rx_index = self._node_to_rx_index[parent]
+            for instance in self._create_dim_instances(pending):
+                instance_rx_index = self._add_node(instance, next(orders))
+                self._add_edge(parent_rx_index, instance_rx_index, EdgeType.CHILD_RESOLVED)
+                instance_rx_indices.append(instance_rx_index)
+
+        for instance_rx_index in instance_rx_indices:
+            for child in pending.children:
+                self._add_edge(instance_rx_index, self._node_to_rx_index[child], EdgeType.CHILD_RESOLVED)
+
+    def _create_dim_instances(self, dim_instances: _DimInstances) -> list[ElementNode]:
+        # the processed elements are shared by the instances of all parents
+        return [
+            ElementNode(
+                name=processed_element.name,
+                level=dim_instances.template_node.level,
+                status=NodeStatus.PROCESSED,
+                parsed=dim_instances.template_node.parsed,
+                processed=processed_element,
+            )
+            for processed_element in dim_instances.processed_elements
+        ]
+
+    def _instantiate_pending_appends(self, successors: dict[ElementNode, list[ElementNode]]):
+        # Instantiates the pending appends without adding them to the graph, for the finalization. The appended children
+        # of each parent are listed before its children in the graph, as by rustworkx, which starts with the last added
+        # edge.
+        appended_children: dict[_PendingAppend, dict[ElementNode, list[ElementNode]]] = {}
+        for pendings in self._pending_appends.values():
+            for pending in pendings:
+                if pending in appended_children:
+                    continue
 
-        unprocessed_root_nodes: list[ElementNode] = []
-        for rx_index in rx_indices:
-            for _, _, edge_data in self._graph.in_edges(rx_index):
-                if edge_data == EdgeType.CHILD_RESOLVED:
-                    unprocessed_root_nodes.append(cast(ElementNode, self._graph[rx_index]))
-                    break
+                if isinstance(pending, _SharedDescendants):
+                    appended_children[pending] = {
+                        pending.target_node: self._instantiate_shared_descendants(pending, successors)
+                    }
+                else:
+                    appended_children[pending] = self._instantiate_dim_instances(pending, successors)
+
+        for parent, pendings in self._pending_appends.items():
+            children = [child for pending in pendings for child in appended_children[pending][parent]]
+            successors[parent] = children[::-1] + successors[parent]
+
+        self._pending_appends.clear()
+
+    def _instantiate_dim_instances(
+        self, dim_instances: _DimInstances, successors: dict[ElementNode, list[ElementNode]]
+    ) -> dict[ElementNode, list[ElementNode]]:
+        # Returns the instances of each parent. The children of the template get the instances as parents, the last
+        # created one first.
+        instances_of_parent: dict[ElementNode, list[ElementNode]] = {}
+        orders = iter(dim_instances.orders)
+        for parent in dim_instances.parents:
+            instances_of_parent[parent] = self._create_dim_instances(dim_instances)
+            for instance in instances_of_parent[parent]:
+                self._order[instance] = next(orders)
+                successors[instance] = dim_instances.children[::-1]
+                self._finalization_parents[instance] = [parent]
+
+        instances = [instance for instances in instances_of_parent.values() for instance in instances]
+        for child in dim_instances.children:
+            del self._pending_dim_parents[child]
+            self._finalization_parents[child] = instances[::-1] + self.get_element_parents(child)
+
+        return instances_of_parent
+
+    def _instantiate_shared_descendants(
+        self, shared: _SharedDescendants, successors: dict[ElementNode, list[ElementNode]]
+    ) -> list[ElementNode]:
+        # Copies the shared descendants without adding them to the graph. Their successors and parents are listed as
+        # by rustworkx, which starts with the last added edge. Returns the replicated immediate children, in the order
+        # they are attached to the target node.
+        instances: dict[int, ElementNode] = {}
+        for rx_index, order in zip(shared.descendants, shared.orders):
+            instance = cast(ElementNode, self._create_replicated_node(self._graph[rx_index]))
+            instances[rx_index] = instance
+            self._order[instance] = order
+            successors[instance] = []
+            self._finalization_parents[instance] = []
+
+        for rx_index in shared.descendants:
+            for _, child_rx_index, _ in self._graph.out_edges(rx_index):
+                if child_rx_index in instances:
+                    successors[instances[rx_index]].append(instances[child_rx_index])
+                    self._finalization_parents[instances[child_rx_index]].append(instances[rx_index])
+
+        immediate_children: list[ElementNode] = []
+        for _, child_rx_index, _ in self._graph.out_edges(self._node_to_rx_index[shared.source_node]):
+            if child_rx_index in instances:
+                immediate_children.append(instances[child_rx_index])
+                self._finalization_parents[instances[child_rx_index]].append(shared.target_node)
+
+        for instance in instances.values():
+            successors[instance] = list(dict.fromkeys(reversed(successors[instance])))
+            self._finalization_parents[instance].reverse()
+
+        return immediate_children
+
+    def set_node_processed(self, node: ElementNode):
+        node.status = NodeStatus.PROCESSED
+        self._unprocessed_nodes.discard(node)
+
+        # placeholders of the children of node can be resolved from now on
+        for _, child_rx_index, edge_type in self._graph.out_edges(self._node_to_rx_index[node]):
+            if edge_type == EdgeType.PLACEHOLDER:
+                self._ready_placeholders.add(cast(PlaceholderNode, self._graph[child_rx_index]))
+
+    def pop_unprocessed_root_nodes(self) -> list[ElementNode]:
+        # Unprocessed nodes with an incoming CHILD_RESOLVED edge, which got this edge or lost a placeholder since the
+        # last call. Other root nodes are still blocked by a placeholder, because unblocked ones were processed.
+        unprocessed_root_nodes = [
+            node
+            for node in self._root_node_candidates
+            if node in self._unprocessed_nodes and self.has_incoming_edge_of_types(node, {EdgeType.CHILD_RESOLVED})
+        ]
+        self._root_node_candidates.clear()
 
         return unprocessed_root_nodes
 
     def get_unprocessed_nodes(self) -> set[ElementNode]:
-        return {cast(ElementNode, self._graph[rx_index]) for rx_index in self._unprocessed_rx_indicies}
+        return set(self._unprocessed_nodes)
 
     def bottom_up_node_traversal(self, finalize_node_cb: Callable[[ElementNode, list[ElementNode]], None]):
         # Step 1: Build data structures
@@ -315,12 +653,16 @@ class ResolverGraph:
         children_of_node: DefaultDict[ElementNode, list[ElementNode]] = defaultdict(list)
         parents_of_node: DefaultDict[ElementNode, list[ElementNode]] = defaultdict(list)
 
-        # Get all nodes
-        all_nodes_rx_indices = self._graph.node_indices()
-        for rx_index in all_nodes_rx_indices:
-            node = cast(ElementNode, self._graph[rx_index])
+        # Get all nodes, including the instantiated pending appends
+        successors = {
+            cast(ElementNode, self._graph[rx_index]): cast(list[ElementNode], self._graph.successors(rx_index))
+            for rx_index in self._graph.node_indices()
+        }
+        self._instantiate_pending_appends(successors)
+
+        for node in sorted(successors, key=self._order.__getitem__):
             # Get children
-            children = cast(list[ElementNode], self._graph.successors(rx_index))
+            children = successors[node]
             children_of_node[node].extend(children)
             # Set pending_children[node] = number of children
             pending_children[node] = len(children)
@@ -350,6 +692,9 @@ class ResolverGraph:
                     queue.append(parent)
 
     def get_svg(self) -> str:
+        while self._pending_appends:
+            self._materialize_children(next(iter(self._pending_appends)))
+
         def node_attr_fn(node: ResolverNode) -> dict[str, str]:
             if isinstance(node, ElementNode):
                 if node.level == ElementLevel.DEVICE:
@@ -398,6 +743,70 @@ class ResolverGraph:
 
         return svg_content
 
+    def _add_node(self, node: ResolverNode, order: None | int = None) -> int:
+        rx_index = self._graph.add_node(node)
+        self._node_to_rx_index[node] = rx_index
+        self._order[node] = self._allocate_orders(1)[0] if order is None else order
+
+        if isinstance(node, PlaceholderNode):
+            self._placeholders[node] = next(self._placeholder_counter)
+        elif isinstance(node, ElementNode) and node.status == NodeStatus.UNPROCESSED:
+            self._unprocessed_nodes.add(node)
+
+        return rx_index
+
+    def _add_edge(self, parent_rx_index: int, child_rx_index: int, edge_type: EdgeType):
+        self._graph.add_edge(parent_rx_index, child_rx_index, edge_type)
+        self._update_name_index(parent_rx_index, child_rx_index, edge_type, add=True)
+
+        if edge_type == EdgeType.CHILD_RESOLVED:
+            self._add_root_node_candidate(child_rx_index)
+        elif edge_type == EdgeType.PLACEHOLDER:
+            parent = self._graph[parent_rx_index]
+            child = self._graph[child_rx_index]
+            if isinstance(parent, ElementNode) and parent.status == NodeStatus.PROCESSED:
+                if isinstance(child, PlaceholderNode):
+                    self._ready_placeholders.add(child)
+
+    def _allocate_orders(self, count: int) -> Sequence[int]:
+        # like rustworkx, the last freed order is reused first
+        reused_orders = [self._free_orders.pop() for _ in range(min(count, len(self._free_orders)))]
+        new_orders = range(self._next_order, self._next_order + count - len(reused_orders))
+        self._next_order = new_orders.stop
+
+        return reused_orders + list(new_orders) if reused_orders else new_orders
+
+    def _add_root_node_candidate(self, rx_index: int):
+        node = self._graph[rx_index]
+
+        if isinstance(node, ElementNode) and node.status == NodeStatus.UNPROCESSED:
+            self._root_node_candidates[node] = None
+
+    def _get_name_index(self, edge_type: EdgeType) -> None | _NameIndex:
+        if edge_type in (EdgeType.CHILD_UNRESOLVED, EdgeType.CHILD_RESOLVED):
+            return self._children_by_name
+        if edge_type == EdgeType.DERIVE:
+            return self._derived_by_name
+        return None
+
+    def _update_name_index(self, parent_rx_index: int, child_rx_index: int, edge_type: EdgeType, add: bool):
+        name_index = self._get_name_index(edge_type)
+        parent = self._graph[parent_rx_index]
+        child = self._graph[child_rx_index]
+
+        if name_index is None or not isinstance(parent, ElementNode) or not isinstance(child, ElementNode):
+            return
+
+        key = (parent, child.name, child.level)
+        if add:
+            name_index.setdefault(key, []).append(child)
+            return
+
+        nodes = name_index[key]
+        nodes.remove(child)
+        if not nodes:
+            del name_index[key]
+
     def _create_replicated_node(self, existing_node: ResolverNode) -> ResolverNode:
         if isinstance(existing_node, ElementNode):
             return ElementNode(
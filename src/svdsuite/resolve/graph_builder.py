@@ -14,7 +14,10 @@ class GraphBuilder:
     def __init__(self, resolver_graph: ResolverGraph):
         self._resolver_graph = resolver_graph
 
-    def construct_directed_graph(self, parsed_device: SVDDevice) -> ElementNode:
+    def construct_directed_graph(
+        self, parsed_device: SVDDevice, parsed_peripherals: None | list[SVDPeripheral] = None
+    ) -> ElementNode:
+        # with `parsed_peripherals`, the graph only holds these peripherals of the device
         root_node = ElementNode(
             name="Device",
             level=ElementLevel.DEVICE,
@@ -22,7 +25,9 @@ class GraphBuilder:
             parsed=parsed_device,
         )
         self._resolver_graph.add_root(root_node)
-        self._constr_graph_peripherals(parsed_device.peripherals, root_node)
+        self._constr_graph_peripherals(
+            parsed_device.peripherals if parsed_peripherals is None else parsed_peripherals, root_node
+        )
 
         return root_node
 
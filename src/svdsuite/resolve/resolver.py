@@ -1,4 +1,5 @@
-from typing import cast, TYPE_CHECKING
+from typing import cast, Callable, TYPE_CHECKING
+from functools import partial
 import copy
 
 from svdsuite.resolve.graph import ResolverGraph
@@ -39,6 +40,9 @@ from svdsuite.model.types import EnumUsageType
 if TYPE_CHECKING:
     from svdsuite.process import Process
 
+# levels of the path parts in front of the last one of a derivedFrom path
+_PATH_LEVELS = tuple(level for level in ElementLevel if level != ElementLevel.DEVICE)
+
 
 class Resolver:
     def __init__(self, process: "Process", resolver_logging_file_path: None | str):
@@ -55,8 +59,10 @@ class Resolver:
 
         return self._root_node_
 
-    def resolve_peripherals(self, parsed_device: SVDDevice) -> list[IPeripheral]:
-        self._initialization(parsed_device)
+    def resolve_peripherals(
+        self, parsed_device: SVDDevice, parsed_peripherals: None | list[SVDPeripheral] = None
+    ) -> list[IPeripheral]:
+        self._initialization(parsed_device, parsed_peripherals)
 
         self._logger.log_repeating_steps_start()
         previous_nodes: list[ElementNode] = []
@@ -94,16 +100,17 @@ class Resolver:
 
         return self._peripherals_resolved
 
-    def _initialization(self, parsed_device: SVDDevice):
+    def _initialization(self, parsed_device: SVDDevice, parsed_peripherals: None | list[SVDPeripheral]):
         graph_builder = GraphBuilder(self._resolver_graph)
-        self._root_node_ = graph_builder.construct_directed_graph(parsed_device)
+        self._root_node_ = graph_builder.construct_directed_graph(parsed_device, parsed_peripherals)
         self._logger.log_init_constructed_graph()
 
         self._ensure_accurate_parent_child_relationships_for_placeholders()
         self._logger.log_parent_child_relationships_for_placeholders()
 
     def _resolve_placeholders(self):
-        for placeholder in list(self._resolver_graph.get_placeholders()):  # copy to avoid modifying list while iter.
+        # only placeholders with a processed parent can be resolved, the list is a copy of the ready ones
+        for placeholder in self._resolver_graph.get_ready_placeholders():
             self._resolve_placeholder(placeholder)
 
         self._logger.log_resolve_placeholder_finished()
@@ -155,7 +162,7 @@ class Resolver:
             self._resolver_graph.replicate_descendants(base_node, node)
 
         # update node
-        node.status = NodeStatus.PROCESSED
+        self._resolver_graph.set_node_processed(node)
 
     def _update_node(
         self,
@@ -173,14 +180,13 @@ class Resolver:
             self._resolver_graph.replicate_descendants(base_node, node)
 
         # update node
-        node.status = NodeStatus.PROCESSED
+        self._resolver_graph.set_node_processed(node)
         node.processed = processed
         if is_dim_template:
             node.is_dim_template = True
 
         # update outgoing CHILD_UNRESOLVED edges to CHILD_RESOLVED
-        for child in self._resolver_graph.get_element_childrens(node):
-            self._resolver_graph.update_edge(node, child, EdgeType.CHILD_RESOLVED)
+        self._resolver_graph.resolve_child_edges(node)
 
     def _update_dim_node(
         self,
@@ -192,27 +198,9 @@ class Resolver:
         # update dim element itself (must be called before the new nodes are created in the next step)
         self._update_node(node, base_node, processed_dim_element, is_dim_template=True)
 
-        # _ElementNode has one parent, except parents are also dim nodes
-        parents = self._resolver_graph.get_element_parents(node)
-
-        # create new nodes
-        new_nodes: list[ElementNode] = []
-        for parent in parents:
-            for processed_element in processed_elements:
-                new_node = ElementNode(
-                    name=processed_element.name,
-                    level=node.level,
-                    status=NodeStatus.PROCESSED,
-                    parsed=node.parsed,
-                    processed=processed_element,
-                )
-                self._resolver_graph.add_element_child(parent, new_node, EdgeType.CHILD_RESOLVED)
-                new_nodes.append(new_node)
-
-        # create edges to childs
-        for new_node in new_nodes:
-            for child in self._resolver_graph.get_element_childrens(node):
-                self._resolver_graph.add_edge(new_node, child, EdgeType.CHILD_RESOLVED)
+        # each parent gets a node per processed element, which shares the children of the dim element, the nodes are
+        # kept in the dim element until they are accessed
+        self._resolver_graph.add_dim_instances(node, processed_elements)
 
     def _find_processable_nodes(self) -> list[ElementNode]:
         not_allowed_edge_types = {
@@ -223,7 +211,7 @@ class Resolver:
         visited: set[ElementNode] = set()
         stack: list[ElementNode] = []
 
-        for node in self._resolver_graph.get_unprocessed_root_nodes():
+        for node in self._resolver_graph.pop_unprocessed_root_nodes():
             stack.append(node)
 
         # iterative depth search
@@ -267,58 +255,98 @@ class Resolver:
 
     def _derived_from_path_resolving(self, derived_node: ElementNode, derive_path: str) -> None | ElementNode:
         derive_path_parts = derive_path.split(".")
-        level = derived_node.level
-
-        def search_nodes(
-            nodes: list[ElementNode], path_parts: list[str], exclude_node: ElementNode, target_level: ElementLevel
-        ) -> list[ElementNode]:
-            matches: list[ElementNode] = []
-            for node in nodes:
-                if node == exclude_node:
-                    continue
-                if node.name != path_parts[0]:
-                    continue
-
-                if len(path_parts) == 1:
-                    # If we've matched the final part, check the level
-                    if node.level == target_level:
-                        matches.append(node)
-                else:
-                    # Recurse into children
-                    child_matches = search_nodes(
-                        self._resolver_graph.get_element_childrens(node), path_parts[1:], exclude_node, target_level
-                    )
-                    matches.extend(child_matches)
-
-                if len(matches) > 1:
-                    filtered_matches = [
-                        match
-                        for match in matches
-                        if isinstance(match.processed, IRegister) and match.processed.alternate_group is None
-                    ]
-                    if len(filtered_matches) == 1:
-                        return filtered_matches
-
-                    # More than one match found – raise exception immediately
-                    raise ResolveException(f"Multiple base nodes found for derive path '{'.'.join(path_parts)}'")
-
-            return matches
 
         # Search in same scope
-        siblings = self._resolver_graph.get_element_siblings(derived_node)
-        matches = search_nodes(siblings, derive_path_parts, derived_node, level)
+        matches = self._find_nodes_by_path(
+            partial(self._resolver_graph.get_element_siblings_by_name, derived_node), derive_path_parts, derived_node
+        )
+        if len(matches) > 1:
+            matches = self._search_nodes(
+                self._resolver_graph.get_element_siblings(derived_node), derive_path_parts, derived_node
+            )
         if len(matches) == 1:
             return matches[0]
 
         # If not found, search over all peripherals
-        peripherals = self._resolver_graph.get_element_childrens(self._root_node)
-        matches = search_nodes(peripherals, derive_path_parts, derived_node, level)
+        matches = self._find_nodes_by_path(
+            partial(self._resolver_graph.get_element_children_by_name, self._root_node), derive_path_parts, derived_node
+        )
+        if len(matches) > 1:
+            matches = self._search_nodes(
+                self._resolver_graph.get_element_childrens(self._root_node), derive_path_parts, derived_node
+            )
         if len(matches) == 1:
             return matches[0]
 
         # No matches found
         return None
 
+    def _find_nodes_by_path(
+        self,
+        get_first_nodes: Callable[[str, ElementLevel], list[ElementNode]],
+        path_parts: list[str],
+        derived_node: ElementNode,
+    ) -> list[ElementNode]:
+        # Looks up all nodes matching the path in the name index of the graph, i.e. with one lookup per path part and
+        # level. As long as at most one node matches, this is the result of `_search_nodes`. For more matches, the
+        # ambiguity rules of `_search_nodes` apply.
+        nodes: list[ElementNode] = []
+        for index, path_part in enumerate(path_parts):
+            # only the last part has to match the level of the derived node
+            levels = (derived_node.level,) if index == len(path_parts) - 1 else _PATH_LEVELS
+
+            if index == 0:
+                candidates = [node for level in levels for node in get_first_nodes(path_part, level)]
+            else:
+                candidates = [
+                    child
+                    for node in nodes
+                    for level in levels
+                    for child in self._resolver_graph.get_element_children_by_name(node, path_part, level)
+                ]
+
+            nodes = [node for node in candidates if node is not derived_node]
+            if not nodes:
+                break
+
+        return nodes
+
+    def _search_nodes(
+        self, nodes: list[ElementNode], path_parts: list[str], exclude_node: ElementNode
+    ) -> list[ElementNode]:
+        # linear search through the children of each path part, which decides between multiple matching nodes
+        matches: list[ElementNode] = []
+        for node in nodes:
+            if node == exclude_node:
+                continue
+            if node.name != path_parts[0]:
+                continue
+
+            if len(path_parts) == 1:
+                # If we've matched the final part, check the level
+                if node.level == exclude_node.level:
+                    matches.append(node)
+            else:
+                # Recurse into children
+                child_matches = self._search_nodes(
+                    self._resolver_graph.get_element_childrens(node), path_parts[1:], exclude_node
+                )
+                matches.extend(child_matches)
+
+            if len(matches) > 1:
+                filtered_matches = [
+                    match
+                    for match in matches
+                    if isinstance(match.processed, IRegister) and match.processed.alternate_group is None
+                ]
+                if len(filtered_matches) == 1:
+                    return filtered_matches
+
+                # More than one match found – raise exception immediately
+                raise ResolveException(f"Multiple base nodes found for derive path '{'.'.join(path_parts)}'")
+
+        return matches
+
     def _is_placeholder_parent_resolved(self, placeholder: PlaceholderNode) -> bool:
         parent = self._resolver_graph.get_placeholder_parent(placeholder)
 
@@ -379,7 +407,7 @@ class Resolver:
 
         containers = [
             self._process._process_enumerated_value_container(  # pylint: disable=W0212 #pyright: ignore[reportPrivateUsage]
-                cast(SVDEnumeratedValueContainer, child.parsed), field.lsb, field.msb
+                cast(SVDEnumeratedValueContainer, child.parsed)
             )
             for child in children_nodes
         ]
@@ -22,6 +22,7 @@ from svdsuite.model.process import (
     DimArrayIndex,
     EnumeratedValueContainer,
     EnumeratedValue,
+    DefaultEnumeratedValue,
     Field,
     Interrupt,
     Peripheral,
@@ -95,12 +96,24 @@ def process_parse_convert_enumerated_value(value: EnumeratedValue) -> SVDEnumera
     return SVDEnumeratedValue(
         name=value.name,
         description=value.description,
-        value=str(value.value),
+        value=_convert_enumerated_value_value(value),
         is_default=False,
         parent=None,  # set by parent enumerated value or dim array index
     )
 
 
+def _convert_enumerated_value_value(value: EnumeratedValue) -> str:
+    if not value.dont_care_mask:
+        return str(value.value)
+
+    # binary value with 'x' for the do not care bits
+    width = max((value.value | value.dont_care_mask).bit_length(), 1)
+    bits = "".join(
+        "x" if value.dont_care_mask >> bit & 1 else str(value.value >> bit & 1) for bit in reversed(range(width))
+    )
+    return f"0b{bits}"
+
+
 def process_parse_convert_dim_array_index(index: DimArrayIndex) -> SVDDimArrayIndex:
     enumerated_values = [process_parse_convert_enumerated_value(value) for value in index.enumerated_values]
 
@@ -144,8 +157,20 @@ def process_parse_convert_write_constraint(constraint: WriteConstraint) -> SVDWr
     )
 
 
+def process_parse_convert_default_enumerated_value(value: DefaultEnumeratedValue) -> SVDEnumeratedValue:
+    return SVDEnumeratedValue(
+        name=value.name,
+        description=value.description,
+        value=None,
+        is_default=True,
+        parent=None,  # set by parent enumerated value
+    )
+
+
 def process_parse_convert_enumerated_value_container(value: EnumeratedValueContainer) -> SVDEnumeratedValueContainer:
     enumerated_values = [process_parse_convert_enumerated_value(value) for value in value.enumerated_values]
+    if value.default is not None:
+        enumerated_values.append(process_parse_convert_default_enumerated_value(value.default))
 
     svd_value = SVDEnumeratedValueContainer(
         name=value.name,
@@ -1,4 +1,7 @@
-from typing import BinaryIO
+from collections.abc import Buffer
+from typing import BinaryIO, Iterable, Iterator
+import codecs
+import re
 import warnings
 from lxml import etree
 
@@ -6,83 +9,260 @@ from svdsuite.util.parser_exception_warning import ParserWarning, custom_warning
 
 warnings.formatwarning = custom_warning_format
 
-# Define the five most common encodings to try.
-_COMMON_ENCODINGS = ["utf-8", "windows-1252", "iso-8859-1", "utf-16", "ascii"]
+# Byte order marks recognized by libxml2. UTF-32 must be checked before UTF-16, since the UTF-32 LE BOM starts with the
+# UTF-16 LE BOM.
+_BOMS: list[tuple[bytes, str]] = [
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+]
 
+# Only the beginning of the document is searched for the XML declaration.
+_DECLARATION_SNIFF_SIZE = 1024
+_XML_DECLARATION_ENCODING = re.compile(rb"""^\s*<\?xml[^>]*?\bencoding\s*=\s*["']([A-Za-z][A-Za-z0-9._:-]*)["']""")
+
+# Bytes which are not defined in windows-1252. If one of them is present, iso-8859-1 is used instead.
+_UNDEFINED_WINDOWS_1252_BYTES = re.compile(rb"[\x81\x8d\x8f\x90\x9d]")
+
+# The content is scanned for its byte statistics in chunks of this size.
+_SCAN_CHUNK_SIZE = 1 << 20
+
+
+def sniff_encoding(content: bytes) -> tuple[str, bool]:
+    """Determines the encoding of an XML document from its BOM, XML declaration and byte statistics.
+
+    Returns the encoding name and whether it is a fallback, i.e. whether it differs from the encoding that the document
+    announces (explicitly or by the UTF-8 default) and has to be forced on the parser.
+    """
+
+    chunks = (content[start : start + _SCAN_CHUNK_SIZE] for start in range(0, len(content), _SCAN_CHUNK_SIZE))
+    return _sniff_encoding(content[:_DECLARATION_SNIFF_SIZE], chunks)
+
+
+def _sniff_file_encoding(file: BinaryIO, sniff_size: None | int = None) -> tuple[str, bool]:
+    # the file is scanned chunk by chunk and rewound afterwards, so it never has to be held in memory as a whole
+    start = file.tell()
+    head = file.read(_DECLARATION_SNIFF_SIZE)
+    file.seek(start)
 
-def safe_parse(path_or_file: str | BinaryIO) -> etree._ElementTree:  # pyright: ignore[reportPrivateUsage]
-    # First attempt: no encoding, recover=False.
     try:
-        parser = etree.XMLParser(recover=False)
-        tree = etree.parse(path_or_file, parser=parser)
-        return tree
-    except etree.XMLSyntaxError as e:
-        original_exception = e
-
-    # Second attempt: try common encodings with recover=False.
-    for enc in _COMMON_ENCODINGS:
+        if sniff_size is None:
+            return _sniff_encoding(head, iter(lambda: file.read(_SCAN_CHUNK_SIZE), b""))
+
+        sniffed = file.read(sniff_size)
+        return _sniff_encoding(head, [sniffed], is_complete=len(sniffed) < sniff_size)
+    finally:
+        file.seek(start)
+
+
+def _sniff_encoding(head: bytes, chunks: Iterable[bytes], is_complete: bool = True) -> tuple[str, bool]:
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, False
+
+    # UTF-16 without BOM, detected by the position of the null bytes around the first '<'
+    if head.startswith(b"<\x00"):
+        return "utf-16-le", not head.startswith(b"<\x00?\x00")
+    if head.startswith(b"\x00<"):
+        return "utf-16-be", not head.startswith(b"\x00<\x00?")
+
+    declared = "utf-8"
+    declared_is_known = True
+    if match := _XML_DECLARATION_ENCODING.match(head):
+        declared = match.group(1).decode("ascii").lower()
         try:
-            parser = etree.XMLParser(encoding=enc, recover=False)
-            tree = etree.parse(path_or_file, parser=parser)
-            warnings.warn(
-                f"XML file parsed using fallback encoding '{enc}' with recover=False.",
-                ParserWarning,
-            )
-            return tree
-        except etree.XMLSyntaxError:
+            declared_is_known = codecs.lookup(declared).name not in {"utf-16", "utf-32"}
+        except LookupError:
+            declared_is_known = False
+
+    # an announced single or multi byte encoding other than UTF-8 is trusted as is
+    # (non-ASCII content in a document that announces ASCII is treated like UTF-8)
+    if declared_is_known and codecs.lookup(declared).name not in {"utf-8", "ascii"}:
+        return declared, False
+
+    is_ascii, is_utf8, has_undefined_windows_1252_bytes = _scan_content(chunks, is_complete)
+
+    if is_ascii:
+        return (declared, False) if declared_is_known else ("utf-8", True)
+
+    if is_utf8:
+        return ("utf-8", not declared_is_known)
+
+    if has_undefined_windows_1252_bytes:
+        return "iso-8859-1", True
+
+    return "windows-1252", True
+
+
+def _scan_content(chunks: Iterable[bytes], is_complete: bool = True) -> tuple[bool, bool, bool]:
+    # UTF-8 validation is done incrementally to avoid holding a decoded copy of the whole document in memory
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    is_ascii = True
+    is_utf8 = True
+    has_undefined_windows_1252_bytes = False
+
+    for chunk in chunks:
+        if is_ascii and chunk.isascii():
             continue
+        is_ascii = False
+
+        if is_utf8:
+            try:
+                decoder.decode(chunk)
+            except UnicodeDecodeError:
+                is_utf8 = False
+
+        if not has_undefined_windows_1252_bytes and _UNDEFINED_WINDOWS_1252_BYTES.search(chunk):
+            has_undefined_windows_1252_bytes = True
+
+        if not is_utf8 and has_undefined_windows_1252_bytes:
+            break
 
-    # Third attempt: try common encodings with recover=True.
-    for enc in _COMMON_ENCODINGS:
+    # a truncated content may end within a multi-byte sequence
+    if is_utf8 and is_complete:
         try:
-            parser = etree.XMLParser(encoding=enc, recover=True)
-            tree = etree.parse(path_or_file, parser=parser)
-            warnings.warn(
-                f"XML file parsed using fallback encoding '{enc}' with recover=True.",
-                ParserWarning,
-            )
-            return tree
-        except etree.XMLSyntaxError:
-            continue
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            is_utf8 = False
+
+    return is_ascii, is_utf8, has_undefined_windows_1252_bytes
+
+
+def _check_parse_result(
+    root: None | etree._Element,  # pyright: ignore[reportPrivateUsage]
+    error_log: etree._ListErrorLog,  # pyright: ignore[reportPrivateUsage]
+    encoding: str,
+    is_fallback: bool,
+    source: str,
+    base_url: None | str,
+):
+    errors = [error for error in error_log if error.level >= etree.ErrorLevels.ERROR]
+
+    if root is None:
+        error = errors[0] if errors else None
+        raise etree.XMLSyntaxError(
+            error.message if error else "Document is empty",
+            error.type if error else 0,
+            error.line if error else 0,
+            error.column if error else 0,
+            base_url,
+        )
+
+    if is_fallback or errors:
+        warnings.warn(
+            f"XML {source} parsed using fallback encoding '{encoding}' with recover={bool(errors)}.",
+            ParserWarning,
+        )
+
+
+def _parse_content(
+    content: bytes, source: str, base_url: None | str = None
+) -> etree._Element:  # pyright: ignore[reportPrivateUsage]
+    encoding, is_fallback = sniff_encoding(content)
 
-    # If all attempts fail, re-raise the original exception.
-    raise original_exception
+    # The document is parsed exactly once. Recovery is always enabled, but only reported if libxml2 had to recover
+    # from an error, so well-formed documents result in the same tree as a strict parse.
+    parser = etree.XMLParser(encoding=encoding if is_fallback else None, recover=True)
+    root = etree.fromstring(content, parser=parser, base_url=base_url)
 
+    _check_parse_result(root, parser.error_log, encoding, is_fallback, source, base_url)
 
-def safe_fromstring(content: bytes) -> etree._Element:  # pyright: ignore[reportPrivateUsage]
-    # First attempt: no encoding, recover=False.
+    return root
+
+
+def safe_parse(path_or_file: str | BinaryIO) -> etree._ElementTree:  # pyright: ignore[reportPrivateUsage]
+    if isinstance(path_or_file, str):
+        with open(path_or_file, "rb") as file:
+            return safe_parse(file)
+
+    name = getattr(path_or_file, "name", None)
+    base_url = name if isinstance(name, str) else None
+
+    if not path_or_file.seekable():
+        return _parse_content(path_or_file.read(), "file", base_url).getroottree()
+
+    # The file is streamed into the parser after sniffing the encoding, so the content is never held in memory as a
+    # whole. This matters for decompressing streams (see svdsuite.archive), which would otherwise be copied in full.
+    encoding, is_fallback = _sniff_file_encoding(path_or_file)
+
+    parser = etree.XMLParser(encoding=encoding if is_fallback else None, recover=True)
     try:
-        parser = etree.XMLParser(recover=False)
-        root = etree.fromstring(content, parser=parser)
-        return root
-    except etree.XMLSyntaxError as e:
-        original_exception = e
-
-    # Second attempt: try common encodings with recover=False.
-    for enc in _COMMON_ENCODINGS:
-        try:
-            parser = etree.XMLParser(encoding=enc, recover=False)
-            root = etree.fromstring(content, parser=parser)
-            warnings.warn(
-                f"XML content parsed using fallback encoding '{enc}' with recover=False.",
-                ParserWarning,
-            )
-            return root
-        except etree.XMLSyntaxError:
-            continue
+        tree = etree.parse(path_or_file, parser=parser, base_url=base_url)
+    except etree.XMLSyntaxError:
+        # an empty document can't be recovered, the error is raised below as for any other unrecoverable document
+        tree = None
 
-    # Third attempt: try common encodings with recover=True.
-    for enc in _COMMON_ENCODINGS:
-        try:
-            parser = etree.XMLParser(encoding=enc, recover=True)
-            root = etree.fromstring(content, parser=parser)
-            warnings.warn(
-                f"XML content parsed using fallback encoding '{enc}' with recover=True.",
-                ParserWarning,
-            )
-            return root
-        except etree.XMLSyntaxError:
-            continue
+    root = tree.getroot() if tree is not None else None
+    _check_parse_result(root, parser.error_log, encoding, is_fallback, "file", base_url)
+
+    return root.getroottree()  # type: ignore[union-attr]
+
+
+def safe_fromstring(
+    content: bytes, base_url: None | str = None
+) -> etree._Element:  # pyright: ignore[reportPrivateUsage]
+    return _parse_content(content, "content" if base_url is None else "file", base_url)
+
+
+def safe_frombuffer(
+    buffer: Buffer, base_url: None | str = None
+) -> etree._Element:  # pyright: ignore[reportPrivateUsage]
+    """Parses the content of a buffer protocol object (e.g. `mmap.mmap`, `memoryview` or `bytearray`) without copying
+    it into a `bytes` object.
+
+    The buffer is sniffed and fed into the parser chunk by chunk, so at most one chunk is copied at a time.
+    """
+
+    view = memoryview(buffer).cast("B")
+
+    def chunks() -> Iterator[bytes]:
+        for start in range(0, len(view), _SCAN_CHUNK_SIZE):
+            yield bytes(view[start : start + _SCAN_CHUNK_SIZE])
+
+    encoding, is_fallback = _sniff_encoding(bytes(view[:_DECLARATION_SNIFF_SIZE]), chunks())
+
+    parser = etree.XMLParser(encoding=encoding if is_fallback else None, recover=True)
+    for chunk in chunks():
+        parser.feed(chunk)
+
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        # an empty document can't be recovered, the error is raised below as for any other unrecoverable document
+        root = None
+
+    source = "content" if base_url is None else "file"
+    _check_parse_result(root, parser.feed_error_log, encoding, is_fallback, source, base_url)
+
+    return root  # type: ignore[return-value]
+
+
+def safe_iterparse(
+    path_or_file: str | BinaryIO, events: tuple[str, ...], tag: tuple[str, ...], sniff_size: None | int = None
+) -> Iterator[tuple[str, etree._Element]]:  # pyright: ignore[reportPrivateUsage]
+    """Incremental counterpart of `safe_parse`, based on `lxml.etree.iterparse`.
+
+    The encoding is sniffed by scanning the file in chunks, so neither the raw content nor the tree has to be held in
+    memory as a whole. If only the beginning of the document is going to be read, `sniff_size` limits the scan to the
+    given number of bytes. Errors and the fallback warning are reported once the document has been read completely.
+    """
+
+    if isinstance(path_or_file, str):
+        with open(path_or_file, "rb") as file:
+            yield from safe_iterparse(file, events, tag, sniff_size)
+        return
+
+    name = getattr(path_or_file, "name", None)
+    base_url = name if isinstance(name, str) else None
+
+    encoding, is_fallback = _sniff_file_encoding(path_or_file, sniff_size)
+
+    context = etree.iterparse(
+        path_or_file, events=events, tag=tag, encoding=encoding if is_fallback else None, recover=True
+    )
+    yield from context
+
+    _check_parse_result(context.root, context.error_log, encoding, is_fallback, "file", base_url)
 
-    # If all attempts fail, re-raise the original exception.
-    raise original_exception
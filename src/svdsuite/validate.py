@@ -1,9 +1,12 @@
 import os
 from enum import Enum
+from collections.abc import Buffer
 from packaging.version import Version
 import lxml.etree
 
-from svdsuite.util.xml_parse import safe_parse, safe_fromstring
+from svdsuite.document import SVDDocument
+from svdsuite.util.xml_parse import safe_parse, safe_fromstring, safe_frombuffer
+from svdsuite.archive import open_svd_file
 
 
 class SVDSchemaVersion(Enum):
@@ -36,9 +39,15 @@ class ValidatorException(Exception):
 class Validator:
     @staticmethod
     def validate_xml_file(
-        path: str, get_exception: bool = True, schema_version: SVDSchemaVersion = SVDSchemaVersion.get_latest()
+        path: str,
+        get_exception: bool = True,
+        schema_version: SVDSchemaVersion = SVDSchemaVersion.get_latest(),
+        member: None | str = None,
     ) -> bool:
-        return Validator._validate(safe_parse(path), get_exception, schema_version)
+        with open_svd_file(path, member) as file:
+            tree = safe_parse(file)
+
+        return Validator._validate(tree, get_exception, schema_version)
 
     @staticmethod
     def validate_xml_content(
@@ -46,12 +55,26 @@ class Validator:
     ) -> bool:
         return Validator._validate(safe_fromstring(content).getroottree(), get_exception, schema_version)
 
+    @staticmethod
+    def validate_xml_buffer(
+        buffer: Buffer, get_exception: bool = True, schema_version: SVDSchemaVersion = SVDSchemaVersion.get_latest()
+    ) -> bool:
+        return Validator._validate(safe_frombuffer(buffer).getroottree(), get_exception, schema_version)
+
     @staticmethod
     def validate_xml_str(
         xml_str: str, get_exception: bool = True, schema_version: SVDSchemaVersion = SVDSchemaVersion.get_latest()
     ) -> bool:
         return Validator.validate_xml_content(xml_str.encode(), get_exception, schema_version)
 
+    @staticmethod
+    def validate_document(
+        document: SVDDocument,
+        get_exception: bool = True,
+        schema_version: SVDSchemaVersion = SVDSchemaVersion.get_latest(),
+    ) -> bool:
+        return Validator._validate(document.tree, get_exception, schema_version)
+
     @staticmethod
     def _validate(
         tree: lxml.etree._ElementTree,  # pyright: ignore[reportPrivateUsage]
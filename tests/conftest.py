@@ -1,3 +1,4 @@
+import copy
 import os
 from typing import Callable
 import lxml.etree
@@ -94,6 +95,29 @@ def modify_test_svd_file_and_get_content(
     return _
 
 
+@pytest.fixture(name="large_test_svd_file_path", scope="session")
+def fixture_large_test_svd_file_path(
+    tmp_path_factory: pytest.TempPathFactory, get_test_svd_file_content: Callable[[str], bytes]
+) -> str:
+    # the register of the fixture file is repeated, so the file takes a while to process and needs some memory
+    tree = safe_fromstring(get_test_svd_file_content("batch/single_register_peripheral.svd"))
+    registers = tree.find("peripherals/peripheral/registers")
+    if registers is None:
+        raise ValueError("can't find the registers of the peripheral")
+
+    template = registers[0]
+    for index in range(1, 5000):
+        register = copy.deepcopy(template)
+        register.find("name").text = f"Register{index}"  # type: ignore[union-attr]
+        register.find("addressOffset").text = hex(index * 4)  # type: ignore[union-attr]
+        registers.append(register)
+
+    path = tmp_path_factory.mktemp("svd") / "large.svd"
+    path.write_bytes(lxml.etree.tostring(tree, encoding="utf8"))
+
+    return str(path)
+
+
 @pytest.fixture(name="create_sau_region", scope="function")
 def fixture_create_sau_region():
     def _(
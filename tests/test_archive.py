@@ -0,0 +1,66 @@
+from typing import Any, Callable
+import gzip
+import lzma
+import pathlib
+import zipfile
+import pytest
+
+from svdsuite.archive import ArchiveException, list_pack_svd_files, open_svd_file
+from svdsuite.parse import Parser
+from svdsuite.process import Process
+from svdsuite.validate import Validator
+
+
+@pytest.fixture(name="svd_content", scope="module")
+def fixture_svd_content(get_test_svd_file_content: Callable[[str], bytes]) -> bytes:
+    return get_test_svd_file_content("enumerated_values/simple_read_write.svd")
+
+
+@pytest.fixture(name="pack_path")
+def fixture_pack_path(tmp_path: pathlib.Path, svd_content: bytes) -> str:
+    path = str(tmp_path / "Vendor.Device_DFP.1.0.0.pack")
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as pack:
+        pack.writestr("Vendor.Device_DFP.pdsc", b"<package/>")
+        pack.writestr("SVD/", b"")
+        pack.writestr("SVD/DeviceA.svd", svd_content)
+        pack.writestr("SVD/DeviceB.SVD", svd_content)
+
+    return path
+
+
+class TestListPackSVDFiles:
+    def test_list_pack_svd_files(self, pack_path: str):
+        assert list_pack_svd_files(pack_path) == ["SVD/DeviceA.svd", "SVD/DeviceB.SVD"]
+
+
+class TestOpenSVDFile:
+    @pytest.mark.parametrize("suffix,open_function", [(".svd.gz", gzip.open), (".svd.xz", lzma.open)])
+    def test_compressed(
+        self, tmp_path: pathlib.Path, svd_content: bytes, suffix: str, open_function: Callable[..., Any]
+    ):
+        path = str(tmp_path / f"device{suffix}")
+        with open_function(path, "wb") as file:
+            file.write(svd_content)
+
+        with open_svd_file(path) as file:
+            assert file.read() == svd_content
+
+        assert Parser.from_svd_file(path).get_parsed_device().name == "simple_read_write"
+
+    def test_pack_member(self, pack_path: str):
+        device = Process.from_svd_file(pack_path, member="SVD/DeviceB.SVD").get_processed_device()
+
+        assert device.name == "simple_read_write"
+        assert Validator.validate_xml_file(pack_path, member="SVD/DeviceA.svd") is True
+
+    @pytest.mark.xfail(strict=True, raises=ArchiveException)
+    def test_pack_ambiguous_member(self, pack_path: str):
+        Parser.from_svd_file(pack_path)
+
+    @pytest.mark.xfail(strict=True, raises=ArchiveException)
+    def test_pack_missing_member(self, pack_path: str):
+        Parser.from_svd_file(pack_path, member="SVD/DeviceC.svd")
+
+    @pytest.mark.xfail(strict=True, raises=ArchiveException)
+    def test_member_for_plain_file(self, get_test_svd_file_path: Callable[[str], str]):
+        Parser.from_svd_file(get_test_svd_file_path("parser_testfile.svd"), member="parser_testfile.svd")
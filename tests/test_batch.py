@@ -0,0 +1,98 @@
+from typing import Callable
+import pathlib
+import shutil
+import pytest
+
+from svdsuite.batch import BatchException, collect_svd_files, main, process_svd_files
+from svdsuite.diagnostics import DiagnosticCode
+
+_OVERLAP = "logical_integrity/overlap_register_addresses_in_peripheral.svd"
+_SAME_NAMES = "logical_integrity/same_register_names_in_peripheral.svd"
+
+
+class TestCollectSVDFiles:
+    def test_directory(self, tmp_path: pathlib.Path):
+        (tmp_path / "sub").mkdir()
+        for name in ["b.svd", "sub/a.SVD", "sub/c.svd.xz", "d.svd.gz", "e.txt"]:
+            (tmp_path / name).touch()
+
+        assert collect_svd_files([str(tmp_path)]) == [
+            str(tmp_path / name) for name in ["b.svd", "d.svd.gz", "sub/a.SVD", "sub/c.svd.xz"]
+        ]
+
+    def test_glob_and_file(self, tmp_path: pathlib.Path):
+        for name in ["a.svd", "b.svd", "c.xml"]:
+            (tmp_path / name).touch()
+
+        assert collect_svd_files([str(tmp_path / "*.svd"), str(tmp_path / "c.xml"), str(tmp_path / "a.svd")]) == [
+            str(tmp_path / name) for name in ["a.svd", "b.svd", "c.xml"]
+        ]
+
+    @pytest.mark.xfail(strict=True, raises=BatchException)
+    def test_missing_source(self, tmp_path: pathlib.Path):
+        collect_svd_files([str(tmp_path / "missing.svd")])
+
+
+class TestProcessSVDFiles:
+    def test_results(self, get_test_svd_file_path: Callable[[str], str]):
+        paths = [get_test_svd_file_path(_OVERLAP), get_test_svd_file_path(_SAME_NAMES)]
+
+        results = sorted(process_svd_files(paths, workers=2), key=lambda result: result.path)
+
+        assert [result.path for result in results] == paths
+        assert results[0].ok
+        assert results[0].device is None
+        assert [record.code for record in results[0].diagnostics] == [DiagnosticCode.REGISTER_OVERLAP]
+        assert not results[1].ok
+        assert results[1].error is not None and results[1].error.startswith("ProcessException: ")
+
+    def test_keep_devices(self, get_test_svd_file_path: Callable[[str], str]):
+        (result,) = process_svd_files([get_test_svd_file_path(_OVERLAP)], workers=1, keep_devices=True)
+
+        assert result.device is not None
+        assert [register.name for register in result.device.peripherals[0].registers_clusters] == [
+            "RegisterA",
+            "RegisterB",
+        ]
+
+    def test_timeout(self, large_test_svd_file_path: str, get_test_svd_file_path: Callable[[str], str]):
+        paths = [large_test_svd_file_path, get_test_svd_file_path(_OVERLAP)]
+
+        # the worker of the timed out file is replaced for the next file
+        results = list(process_svd_files(paths, workers=1, timeout=0.05))
+
+        assert [(result.path, result.error) for result in results] == [
+            (paths[0], "Timeout after 0.05 s"),
+            (paths[1], None),
+        ]
+
+    def test_memory_limit(self, large_test_svd_file_path: str):
+        pytest.importorskip("resource")
+
+        (result,) = process_svd_files([large_test_svd_file_path], workers=1, memory_limit=64 * 1024 * 1024)
+
+        assert not result.ok
+
+    @pytest.mark.xfail(strict=True, raises=BatchException)
+    def test_no_workers(self, get_test_svd_file_path: Callable[[str], str]):
+        list(process_svd_files([get_test_svd_file_path(_OVERLAP)], workers=0))
+
+
+class TestMain:
+    def test_output(
+        self, tmp_path: pathlib.Path, get_test_svd_file_path: Callable[[str], str], capsys: pytest.CaptureFixture[str]
+    ):
+        shutil.copy(get_test_svd_file_path(_OVERLAP), tmp_path / "a.svd")
+        shutil.copy(get_test_svd_file_path(_SAME_NAMES), tmp_path / "b.svd")
+
+        return_code = main([str(tmp_path), "--workers", "1"])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert return_code == 1
+        assert lines[0].startswith(f"{tmp_path / 'a.svd'}: ok, 1 diagnostics, ")
+        assert lines[1].startswith(f"{tmp_path / 'b.svd'}: failed (ProcessException: ")
+        assert lines[2] == "2 files, 1 failed"
+
+    def test_missing_source(self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+        assert main([str(tmp_path / "missing.svd")]) == 2
+        assert "doesn't exist" in capsys.readouterr().err
@@ -0,0 +1,154 @@
+from typing import Callable
+import pathlib
+import struct
+import pytest
+
+from svdsuite.binary import BinaryFormatException, open_device_binary, write_device_binary
+from svdsuite.diagnostics import NullDiagnostics
+from svdsuite.model.process import Device
+from svdsuite.model.types import AccessType, EnumUsageType
+from svdsuite.process import Process
+
+_WIDE_REGISTERS = (
+    "peripheral_inheritance_via_derivedfrom/multiple_inheritance_backward_and_forward_reference_with_value_override.svd"
+)
+
+
+@pytest.fixture(name="write_binary")
+def fixture_write_binary(
+    tmp_path: pathlib.Path, get_test_svd_file_path: Callable[[str], str]
+) -> Callable[[str], tuple[Device, str]]:
+    def _(file_name: str) -> tuple[Device, str]:
+        device = Process.from_svd_file(
+            get_test_svd_file_path(file_name), diagnostics=NullDiagnostics()
+        ).get_processed_device()
+        path = str(tmp_path / "device.svdb")
+        write_device_binary(device, path)
+        return device, path
+
+    return _
+
+
+class TestBinaryDevice:
+    def test_device_and_registers(self, write_binary: Callable[[str], tuple[Device, str]]):
+        device, path = write_binary("logical_integrity/overlap_register_addresses_in_peripheral.svd")
+
+        with open_device_binary(path) as binary_device:
+            assert (binary_device.name, binary_device.version, binary_device.vendor) == (
+                device.name,
+                device.version,
+                device.vendor,
+            )
+            assert (binary_device.size, binary_device.access, binary_device.reset_mask) == (
+                32,
+                AccessType.READ_WRITE,
+                0xFFFFFFFF,
+            )
+            assert len(binary_device.peripherals) == 1
+
+            peripheral = binary_device.peripherals[0]
+            assert (peripheral.name, peripheral.base_address, peripheral.end_address) == (
+                device.peripherals[0].name,
+                device.peripherals[0].base_address,
+                device.peripherals[0].end_address,
+            )
+            assert [(r.name, r.base_address, r.address_offset, r.read_mask) for r in peripheral.registers] == [
+                (r.name, r.base_address, r.address_offset, r.read_mask) for r in device.peripherals[0].registers
+            ]
+
+    def test_fields_and_enumerated_values(self, write_binary: Callable[[str], tuple[Device, str]]):
+        device, path = write_binary("enumerated_values/default_extension.svd")
+        field = device.peripherals[0].registers[0].fields[0]
+
+        with open_device_binary(path) as binary_device:
+            binary_field = binary_device.peripherals[0].registers[0].fields[0]
+            assert (binary_field.name, binary_field.lsb, binary_field.msb, binary_field.mask) == (
+                field.name,
+                field.lsb,
+                field.msb,
+                field.mask,
+            )
+            assert (binary_field.bit_width, binary_field.bit_range) == (field.bit_width, field.bit_range)
+
+            container = binary_field.enumerated_value_containers[0]
+            assert container.usage is EnumUsageType.READ_WRITE
+            assert [(v.name, v.description, v.value) for v in container.enumerated_values] == [
+                ("0b10", "Description for 0b10", 2)
+            ]
+            assert container.default is not None
+            assert container.default.name == "default"
+            assert [value.name for value in container.default] == ["default_0", "default_1", "default_3"]
+
+    def test_shared_containers(self, write_binary: Callable[[str], tuple[Device, str]]):
+        _, path = write_binary("enumerated_values/value_name_already_defined_field_array.svd")
+
+        with open_device_binary(path) as binary_device:
+            fields = binary_device.peripherals[0].registers[0].fields
+
+            assert [field.name for field in fields] == ["Field0", "Field1", "Field2"]
+            for field in fields:
+                assert [v.name for v in field.enumerated_value_containers[0].enumerated_values] == ["0b00", "0b01"]
+
+        # the equal containers of the fields and their values are stored once
+        with open(path, "rb") as file:
+            *_, container_count, _, value_count = struct.unpack_from("<4sHH16Q", file.read())
+        assert (container_count, value_count) == (1, 2)
+
+    def test_wide_integers(self, write_binary: Callable[[str], tuple[Device, str]]):
+        device, path = write_binary(_WIDE_REGISTERS)
+
+        with open_device_binary(path) as binary_device:
+            assert [
+                (r.size, r.read_mask, r.write_mask) for p in binary_device.peripherals for r in p.registers
+            ] == [(r.size, r.read_mask, r.write_mask) for p in device.peripherals for r in p.registers]
+            assert binary_device.peripherals[1].registers[0].read_mask == (1 << 128) - 1
+
+    def test_sequence(self, write_binary: Callable[[str], tuple[Device, str]]):
+        _, path = write_binary(_WIDE_REGISTERS)
+
+        with open_device_binary(path) as binary_device:
+            peripherals = binary_device.peripherals
+
+            assert peripherals[-1] == peripherals[2]
+            assert [p.name for p in peripherals[1:]] == ["PeripheralB", "PeripheralC"]
+            assert peripherals.index(peripherals[1]) == 1
+            with pytest.raises(IndexError):
+                _ = peripherals[3]
+
+    def test_closed(self, write_binary: Callable[[str], tuple[Device, str]]):
+        _, path = write_binary(_WIDE_REGISTERS)
+
+        binary_device = open_device_binary(path)
+        binary_device.close()
+
+        with pytest.raises(ValueError):
+            _ = binary_device.peripherals[0]
+
+
+class TestInvalidBinaryFile:
+    @pytest.mark.xfail(strict=True, raises=BinaryFormatException)
+    def test_svd_file(self, get_test_svd_file_path: Callable[[str], str]):
+        open_device_binary(get_test_svd_file_path(_WIDE_REGISTERS))
+
+    @pytest.mark.xfail(strict=True, raises=BinaryFormatException)
+    def test_empty_file(self, tmp_path: pathlib.Path):
+        (tmp_path / "device.svdb").touch()
+
+        open_device_binary(str(tmp_path / "device.svdb"))
+
+    @pytest.mark.xfail(strict=True, raises=BinaryFormatException)
+    def test_other_version(self, write_binary: Callable[[str], tuple[Device, str]]):
+        _, path = write_binary(_WIDE_REGISTERS)
+        with open(path, "r+b") as file:
+            file.seek(4)
+            file.write(struct.pack("<H", 0xFFFF))
+
+        open_device_binary(path)
+
+    @pytest.mark.xfail(strict=True, raises=BinaryFormatException)
+    def test_truncated_file(self, write_binary: Callable[[str], tuple[Device, str]]):
+        _, path = write_binary(_WIDE_REGISTERS)
+        with open(path, "r+b") as file:
+            file.truncate(300)
+
+        open_device_binary(path)
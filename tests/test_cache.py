@@ -0,0 +1,217 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+import os
+import pathlib
+import pytest
+
+from svdsuite.cache import DeviceCache
+from svdsuite.diagnostics import DiagnosticCode, Diagnostics, NullDiagnostics
+from svdsuite.map import PeripheralRegisterMap
+from svdsuite.process import Process, ProcessWarning
+from svdsuite.util.parser_exception_warning import ParserWarning
+
+_OVERLAP = "logical_integrity/overlap_register_addresses_in_peripheral.svd"
+_DERIVED_PERIPHERAL = "device_cache/derived_peripheral.svd"
+
+
+@pytest.fixture(name="get_device_content")
+def fixture_get_device_content(
+    modify_test_svd_file_and_get_content: Callable[[str, str, None | str, None | str], bytes],
+) -> Callable[[str], bytes]:
+    def _(name: str) -> bytes:
+        return modify_test_svd_file_and_get_content(_DERIVED_PERIPHERAL, "/device/name", None, name)
+
+    return _
+
+
+def _entry_paths(cache: DeviceCache) -> list[str]:
+    return sorted(os.path.join(cache.directory, name) for name in os.listdir(cache.directory))
+
+
+def _fail_processing(*_: Any, **__: Any):
+    raise AssertionError("processed instead of loaded from the cache")
+
+
+def _process_cached(directory: str, content: bytes) -> str:
+    return DeviceCache(directory).process_xml_content(content).name
+
+
+class TestDeviceCache:
+    def test_hit(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, get_device_content: Callable[[str], bytes]
+    ):
+        cache = DeviceCache(str(tmp_path))
+        device = cache.process_xml_content(get_device_content("A"))
+
+        monkeypatch.setattr("svdsuite.cache.Process", _fail_processing)
+        cached_device = DeviceCache(str(tmp_path)).process_xml_content(get_device_content("A"))
+
+        assert len(_entry_paths(cache)) == 1
+        assert cached_device == device
+        assert [p.name for p in cached_device.peripherals] == ["PeripheralA", "PeripheralB"]
+
+    def test_same_as_processed(self, tmp_path: pathlib.Path, get_test_svd_file_path: Callable[[str], str]):
+        cache = DeviceCache(str(tmp_path))
+        file_path = get_test_svd_file_path(_OVERLAP)
+
+        processed_device = Process.from_svd_file(file_path, diagnostics=Diagnostics()).get_processed_device()
+        device = cache.process_svd_file(file_path, diagnostics=Diagnostics())
+        cached_device = cache.process_svd_file(file_path, diagnostics=Diagnostics())
+
+        assert cached_device == device
+        register = cached_device.peripherals[0].registers[1]
+        processed_register = processed_device.peripherals[0].registers[1]
+        assert (register.name, register.base_address, register.read_mask) == (
+            processed_register.name,
+            processed_register.base_address,
+            processed_register.read_mask,
+        )
+
+    def test_parsed_dropped(self, tmp_path: pathlib.Path, get_device_content: Callable[[str], bytes]):
+        cache = DeviceCache(str(tmp_path))
+
+        device = cache.process_xml_content(get_device_content("A"))
+        cached_device = cache.process_xml_content(get_device_content("A"))
+
+        for d in (device, cached_device):
+            assert d.parsed is None
+            assert d.peripherals[0].parsed is None
+            assert d.peripherals[0].registers[0].parsed is None
+
+    def test_parsed_kept(self, tmp_path: pathlib.Path, get_device_content: Callable[[str], bytes]):
+        cache = DeviceCache(str(tmp_path), keep_parsed=True)
+        cache.process_xml_content(get_device_content("A"))
+
+        device = cache.process_xml_content(get_device_content("A"))
+
+        assert device.parsed.name == "A"
+        assert device.peripherals[1].parsed.derived_from == "PeripheralA"
+        assert device.peripherals[0].registers[0].parsed.parent is device.peripherals[0].parsed
+
+    def test_diagnostics_reported_on_hit(self, tmp_path: pathlib.Path, get_device_content: Callable[[str], bytes]):
+        cache = DeviceCache(str(tmp_path))
+        diagnostics = Diagnostics()
+        cached_diagnostics = Diagnostics()
+
+        # the whitespace around the name is reported by the parser
+        cache.process_xml_content(get_device_content(" A "), diagnostics)
+        cache.process_xml_content(get_device_content(" A "), cached_diagnostics)
+
+        assert cached_diagnostics.records == diagnostics.records
+        assert [record.code for record in cached_diagnostics.records] == [DiagnosticCode.TEXT_STRIPPED]
+
+    def test_warnings_without_sink(
+        self,
+        tmp_path: pathlib.Path,
+        get_test_svd_file_path: Callable[[str], str],
+        get_device_content: Callable[[str], bytes],
+    ):
+        cache = DeviceCache(str(tmp_path))
+        cache.process_xml_content(get_device_content(" A "), Diagnostics())
+        cache.process_svd_file(get_test_svd_file_path(_OVERLAP), diagnostics=Diagnostics())
+
+        with pytest.warns(ParserWarning):
+            cache.process_xml_content(get_device_content(" A "))
+        with pytest.warns(ProcessWarning):
+            cache.process_svd_file(get_test_svd_file_path(_OVERLAP))
+
+    def test_key_with_options(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, get_device_content: Callable[[str], bytes]
+    ):
+        cache = DeviceCache(str(tmp_path))
+
+        cache.process_xml_content(get_device_content("A"))
+        device = cache.process_xml_content(get_device_content("A"), peripherals=["PeripheralB"])
+        cache.process_xml_content(get_device_content("A"), peripherals=["PeripheralB", "PeripheralB"])
+        DeviceCache(str(tmp_path), keep_parsed=True).process_xml_content(get_device_content("A"))
+        monkeypatch.setattr("svdsuite.cache._SVDSUITE_VERSION", "0.0.0")
+        cache.process_xml_content(get_device_content("A"))
+        monkeypatch.setattr("svdsuite.cache._get_source_hash", lambda: "0")
+        cache.process_xml_content(get_device_content("A"))
+
+        assert [p.name for p in device.peripherals] == ["PeripheralB"]
+        assert len(_entry_paths(cache)) == 5
+
+    def test_new_directory_only_accessible_by_owner(self, tmp_path: pathlib.Path):
+        cache = DeviceCache(str(tmp_path / "cache"))
+
+        assert os.stat(cache.directory).st_mode & 0o077 == 0
+
+    def test_least_recently_used_evicted(self, tmp_path: pathlib.Path, get_device_content: Callable[[str], bytes]):
+        cache = DeviceCache(str(tmp_path))
+        cache.process_xml_content(get_device_content("A"))
+        cache.process_xml_content(get_device_content("B"))
+        path_a, path_b = sorted(_entry_paths(cache), key=os.path.getmtime)
+        size = os.path.getsize(path_a) + os.path.getsize(path_b)
+        os.utime(path_a, (1, 1))
+        os.utime(path_b, (2, 2))
+
+        # A is used again, so B is the least recently used entry
+        limited_cache = DeviceCache(str(tmp_path), max_size=size)
+        limited_cache.process_xml_content(get_device_content("A"))
+        limited_cache.process_xml_content(get_device_content("C"))
+
+        assert os.path.exists(path_a)
+        assert not os.path.exists(path_b)
+        assert len(_entry_paths(cache)) == 2
+
+    def test_corrupted_entry(self, tmp_path: pathlib.Path, get_device_content: Callable[[str], bytes]):
+        cache = DeviceCache(str(tmp_path))
+        cache.process_xml_content(get_device_content("A"))
+        (entry_path,) = _entry_paths(cache)
+        with open(entry_path, "wb") as file:
+            file.write(b"corrupted")
+
+        device = cache.process_xml_content(get_device_content("A"))
+
+        assert device.name == "A"
+        assert cache.process_xml_content(get_device_content("A")) == device
+
+    def test_clear(self, tmp_path: pathlib.Path, get_device_content: Callable[[str], bytes]):
+        cache = DeviceCache(str(tmp_path))
+        cache.process_xml_content(get_device_content("A"))
+
+        cache.clear()
+
+        assert not _entry_paths(cache)
+
+    def test_concurrent_processes(self, tmp_path: pathlib.Path, get_device_content: Callable[[str], bytes]):
+        contents = [get_device_content(name) for name in "ABAB"]
+
+        with ProcessPoolExecutor(2) as executor:
+            names = list(executor.map(_process_cached, [str(tmp_path)] * len(contents), contents))
+
+        assert names == ["A", "B", "A", "B"]
+        assert [name.endswith(".pickle") for name in os.listdir(tmp_path)] == [True, True]
+
+    def test_peripheral_register_map(self, tmp_path: pathlib.Path, get_test_svd_file_path: Callable[[str], str]):
+        cache = DeviceCache(str(tmp_path))
+        file_path = get_test_svd_file_path(_OVERLAP)
+
+        with pytest.warns(ProcessWarning):
+            peripheral_map = PeripheralRegisterMap.from_svd_file(file_path, cache=cache)
+        with pytest.warns(ProcessWarning):
+            cached_peripheral_map = PeripheralRegisterMap.from_svd_file(file_path, cache=cache)
+
+        assert [r.address for r in cached_peripheral_map.peripheral_map[0].registers] == [
+            r.address for r in peripheral_map.peripheral_map[0].registers
+        ]
+        assert len(_entry_paths(cache)) == 1
+
+    def test_peripheral_register_map_with_resolver_log(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, get_test_svd_file_path: Callable[[str], str]
+    ):
+        cache = DeviceCache(str(tmp_path))
+        from_svd_file = Process.from_svd_file
+        log_paths: list[None | str] = []
+
+        def process_with_log(path: str, resolver_logging_file_path: None | str = None, member: None | str = None):
+            # the log itself needs graphviz, only the requested path is recorded
+            log_paths.append(resolver_logging_file_path)
+            return from_svd_file(path, None, member, NullDiagnostics())
+
+        monkeypatch.setattr(Process, "from_svd_file", process_with_log)
+        monkeypatch.setattr(cache, "process_svd_file", _fail_processing)
+        PeripheralRegisterMap.from_svd_file(get_test_svd_file_path(_OVERLAP), "resolver.html", cache=cache)
+
+        assert log_paths == ["resolver.html"]
@@ -0,0 +1,86 @@
+from typing import Callable
+import pytest
+
+from svdsuite.diagnostics import DiagnosticCode, Diagnostics, DiagnosticsSink, NullDiagnostics, Severity
+from svdsuite.model.process import Register
+from svdsuite.parse import Parser
+from svdsuite.process import Process, ProcessException
+
+
+class TestParserDiagnostics:
+    @pytest.mark.filterwarnings("error::svdsuite.util.parser_exception_warning.ParserWarning")
+    def test_collected_instead_of_warned(self, get_test_svd_file_content: Callable[[str], bytes]):
+        diagnostics = Diagnostics()
+        file_content = get_test_svd_file_content("diagnostics/stripped_text.svd")
+
+        device = Parser.from_xml_content(file_content, diagnostics=diagnostics).get_parsed_device()
+
+        assert device.name == "A"
+        assert len(diagnostics.records) == 1
+        assert diagnostics.records[0].code is DiagnosticCode.TEXT_STRIPPED
+        assert diagnostics.records[0].severity is Severity.INFO
+        assert diagnostics.records[0].path == "/device/name"
+        assert diagnostics.records[0].sourceline == 3
+
+
+class TestProcessDiagnostics:
+    @pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+    def test_collected_instead_of_warned(self, get_test_svd_file_path: Callable[[str], str]):
+        diagnostics = Diagnostics()
+        file_path = get_test_svd_file_path("logical_integrity/overlap_register_addresses_in_peripheral.svd")
+
+        Process.from_svd_file(file_path, diagnostics=diagnostics)
+
+        assert [(record.code, record.path) for record in diagnostics.records] == [
+            (DiagnosticCode.REGISTER_OVERLAP, "PeripheralA/RegisterB")
+        ]
+
+    def test_summary_without_records(self, get_test_svd_file_path: Callable[[str], str]):
+        diagnostics = Diagnostics(keep_records=False)
+
+        Process.from_svd_file(
+            get_test_svd_file_path("logical_integrity/overlap_register_addresses_in_peripheral.svd"),
+            diagnostics=diagnostics,
+        )
+        Process.from_svd_file(
+            get_test_svd_file_path("logical_integrity/peripheral_unaligned_address.svd"), diagnostics=diagnostics
+        )
+
+        assert not diagnostics.records
+        assert diagnostics.summary() == {DiagnosticCode.REGISTER_OVERLAP: 1, DiagnosticCode.PERIPHERAL_MISALIGNED: 1}
+        assert diagnostics.count() == 2
+        assert diagnostics.count(Severity.INFO) == 0
+
+    @pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+    @pytest.mark.filterwarnings("error::svdsuite.util.parser_exception_warning.ParserWarning")
+    def test_disabled(self, get_test_svd_file_path: Callable[[str], str]):
+        file_path = get_test_svd_file_path("logical_integrity/overlap_register_addresses_in_peripheral.svd")
+
+        device = Process.from_svd_file(file_path, diagnostics=NullDiagnostics()).get_processed_device()
+
+        assert len(device.peripherals[0].registers_clusters) == 2
+
+    @pytest.mark.parametrize("diagnostics", [NullDiagnostics(), Diagnostics()], ids=["disabled", "enabled"])
+    @pytest.mark.xfail(strict=True, raises=ProcessException)
+    def test_unsupported_register_size(
+        self, get_test_svd_file_path: Callable[[str], str], diagnostics: DiagnosticsSink
+    ):
+        # the validation doesn't depend on whether the diagnostics are enabled
+        file_path = get_test_svd_file_path("diagnostics/register_unsupported_size.svd")
+
+        Process.from_svd_file(file_path, diagnostics=diagnostics)
+
+    def test_reported_for_each_field_of_shared_container(self, get_test_svd_file_path: Callable[[str], str]):
+        # the fields of the array share the processed enumerated value container
+        diagnostics = Diagnostics()
+        file_path = get_test_svd_file_path("enumerated_values/value_name_already_defined_field_array.svd")
+
+        device = Process.from_svd_file(file_path, diagnostics=diagnostics).get_processed_device()
+
+        register = device.peripherals[0].registers_clusters[0]
+        assert isinstance(register, Register)
+        assert [field.name for field in register.fields] == ["Field0", "Field1", "Field2"]
+        for field in register.fields:
+            assert [value.name for value in field.enumerated_value_containers[0].enumerated_values] == ["0b00", "0b01"]
+
+        assert [record.code for record in diagnostics.records] == [DiagnosticCode.DUPLICATE_ENUMERATED_VALUE_NAME] * 3
@@ -0,0 +1,49 @@
+from typing import Callable
+import pytest
+
+from svdsuite.document import SVDDocument, DocumentException
+from svdsuite.parse import Parser
+from svdsuite.process import Process
+from svdsuite.validate import Validator
+from svdsuite.map import PeripheralRegisterMap
+
+
+class TestSVDDocument:
+    def test_tree_is_parsed_once(self, get_test_svd_file_path: Callable[[str], str]):
+        document = SVDDocument.from_svd_file(get_test_svd_file_path("parser_testfile.svd"))
+
+        assert document.tree is document.tree
+
+    def test_validate_then_parse(self, get_test_svd_file_path: Callable[[str], str]):
+        document = SVDDocument.from_svd_file(get_test_svd_file_path("parser_testfile.svd"))
+        tree = document.tree
+
+        assert Validator.validate_document(document, get_exception=False) is False
+
+        parser = Parser.from_document(document)
+
+        assert parser.get_parsed_device().name == "parser"
+        assert document.tree is tree
+
+    def test_content_released_after_parsing(self, get_test_svd_file_content: Callable[[str], bytes]):
+        document = SVDDocument.from_xml_content(get_test_svd_file_content("parser_testfile.svd"))
+
+        Parser.from_document(document)
+
+        assert document.is_content_released is True
+        with pytest.raises(DocumentException):
+            _ = document.content
+
+    def test_process(self, get_test_svd_file_content: Callable[[str], bytes]):
+        document = SVDDocument.from_xml_content(get_test_svd_file_content("enumerated_values/simple_read_write.svd"))
+
+        device = Process.from_document(document).get_processed_device()
+
+        assert len(device.peripherals) == 1
+
+    def test_peripheral_register_map(self, get_test_svd_file_content: Callable[[str], bytes]):
+        document = SVDDocument.from_xml_content(get_test_svd_file_content("enumerated_values/simple_read_write.svd"))
+
+        peripheral_map = PeripheralRegisterMap.from_document(document)
+
+        assert len(peripheral_map.peripheral_map) == 1
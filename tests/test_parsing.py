@@ -1,7 +1,17 @@
 from typing import Callable, Any
+import io
+import mmap
+import warnings
 import pytest
 
-from svdsuite.parse import Parser, ParserException, _to_int  # type: ignore
+from svdsuite.parse import (  # type: ignore
+    Parser,
+    PeripheralStream,
+    ParserException,
+    ParserWarning,
+    _to_int,  # pyright: ignore[reportPrivateUsage]
+)
+from svdsuite.serialize import Serializer
 from svdsuite.model.parse import (
     SVDAddressBlock,
     SVDCluster,
@@ -16,6 +26,7 @@ from svdsuite.model.parse import (
     SVDSauRegion,
     SVDSauRegionsConfig,
     SVDWriteConstraint,
+    LazyList,
     AccessType,
     CPUNameType,
     DataTypeType,
@@ -86,6 +97,165 @@ class TestParserInstantiation:
 
         assert isinstance(parser, Parser)
 
+    def test_cls_for_buffer(self, get_test_svd_file_path: Callable[[str], str]):
+        file_path = get_test_svd_file_path("parser_testfile.svd")
+        with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            device = Parser.from_buffer(buffer).get_parsed_device()
+
+        assert Serializer.device_to_svd_content(device) == Serializer.device_to_svd_content(
+            Parser.from_svd_file(file_path).get_parsed_device()
+        )
+
+
+class TestPeripheralStream:
+    def test_same_peripherals_as_parser(self, get_test_svd_file_path: Callable[[str], str]):
+        file_path = get_test_svd_file_path("parser_testfile.svd")
+        device = Parser.from_svd_file(file_path).get_parsed_device()
+        stream = PeripheralStream.from_svd_file(file_path)
+
+        peripherals = list(stream)
+
+        assert [(p.name, p.base_address, len(p.registers_clusters)) for p in peripherals] == [
+            (p.name, p.base_address, len(p.registers_clusters)) for p in device.peripherals
+        ]
+        assert all(p.parent is stream.get_device_header() for p in peripherals)
+
+    def test_device_header(self, get_test_svd_file_content: Callable[[str], bytes]):
+        file_content = get_test_svd_file_content("parser_testfile.svd")
+        device = Parser.from_xml_content(file_content).get_parsed_device()
+
+        header = PeripheralStream.from_xml_content(file_content).get_device_header()
+
+        assert header.name == device.name
+        assert header.width == device.width
+        assert header.reset_mask == device.reset_mask
+        assert header.cpu is not None and device.cpu is not None
+        assert header.cpu.name == device.cpu.name
+        assert header.peripherals == []
+
+    def test_finished_peripherals_are_cleared(self):
+        file = io.BytesIO(
+            b"<device schemaVersion='1.1' xmlns:xs='http://www.w3.org/2001/XMLSchema-instance' "
+            b"xs:noNamespaceSchemaLocation='CMSIS-SVD.xsd'><name>A</name><version>1</version>"
+            b"<description>A</description><addressUnitBits>8</addressUnitBits><width>32</width><peripherals>"
+            b"<peripheral><name>P0</name><baseAddress>0</baseAddress></peripheral>"
+            b"<peripheral><name>P1</name><baseAddress>0x100</baseAddress></peripheral>"
+            b"<peripheral><name>P2</name><baseAddress>0x200</baseAddress></peripheral>"
+            b"</peripherals></device>"
+        )
+        stream = PeripheralStream(file)
+
+        names: list[str] = []
+        for peripheral in stream:
+            names.append(peripheral.name)
+            peripherals_element = stream._peripherals_element  # pyright: ignore[reportPrivateUsage]
+
+            # the parser may already have read ahead, but the first child is always the cleared current peripheral
+            assert peripherals_element is not None
+            assert len(peripherals_element[0]) == 0
+
+        assert names == ["P0", "P1", "P2"]
+
+    @pytest.mark.xfail(strict=True, raises=ParserException)
+    def test_missing_peripherals(self):
+        PeripheralStream.from_xml_str(
+            "<device schemaVersion='1.1'><name>A</name><version>1</version><description>A</description></device>"
+        ).get_device_header()
+
+
+class TestPeekDeviceInfo:
+    def test_same_header_as_parser(self, get_test_svd_file_path: Callable[[str], str]):
+        file_path = get_test_svd_file_path("parser_testfile.svd")
+        device = Parser.from_svd_file(file_path).get_parsed_device()
+
+        device_info = Parser.peek_device_info(file_path)
+
+        assert device_info.name == device.name
+        assert device_info.vendor == device.vendor
+        assert device_info.series == device.series
+        assert device_info.version == device.version
+        assert device_info.schema_version == device.schema_version
+        assert device_info.cpu is not None and device.cpu is not None
+        assert device_info.cpu.name == device.cpu.name
+        assert device_info.cpu.nvic_prio_bits == device.cpu.nvic_prio_bits
+        assert device_info.cpu.vendor_systick_config == device.cpu.vendor_systick_config
+        assert device_info.peripherals == []
+
+    def test_stops_reading_at_peripherals(self, get_test_svd_file_content: Callable[[str], bytes]):
+        file_content = get_test_svd_file_content("parser_testfile.svd")
+        index = file_content.index(b"<peripherals>") + len(b"<peripherals>")
+        peripherals = b"".join(
+            b"<peripheral><name>P%d</name><baseAddress>0</baseAddress></peripheral>" % i for i in range(20000)
+        )
+        file = io.BytesIO(file_content[:index] + peripherals + file_content[index:])
+
+        device_info = Parser.peek_device_info(file)
+
+        assert device_info.name == "parser"
+        assert file.tell() < len(peripherals) // 10
+
+
+class TestLazyParsing:
+    def test_same_result_as_eager(self, get_test_svd_file_path: Callable[[str], str]):
+        file_path = get_test_svd_file_path("parser_testfile.svd")
+        device = Parser.from_svd_file(file_path).get_parsed_device()
+        lazy_device = Parser.from_svd_file(file_path, lazy=True).get_parsed_device()
+
+        assert Serializer.device_to_svd_content(lazy_device) == Serializer.device_to_svd_content(device)
+
+    def test_registers_clusters_parsed_on_access(self, get_test_svd_file_content: Callable[[str], bytes]):
+        file_content = get_test_svd_file_content("parser_testfile.svd")
+        device = Parser.from_xml_content(file_content, lazy=True).get_parsed_device()
+        peripheral = device.peripherals[0]
+
+        assert isinstance(peripheral.__dict__["registers_clusters"], LazyList)
+
+        registers_clusters = peripheral.registers_clusters
+
+        assert registers_clusters
+        assert peripheral.registers_clusters is registers_clusters
+        assert all(register_cluster.parent is peripheral for register_cluster in registers_clusters)
+
+    def test_warnings_emitted_on_access(self):
+        xml_str = (
+            "<device schemaVersion='1.1' xmlns:xs='http://www.w3.org/2001/XMLSchema-instance' "
+            "xs:noNamespaceSchemaLocation='CMSIS-SVD.xsd'><name>A</name><version>1</version>"
+            "<description>A</description><addressUnitBits>8</addressUnitBits><width>32</width><peripherals>"
+            "<peripheral><name>P</name><baseAddress>0</baseAddress><registers><register><name> R </name>"
+            "<addressOffset>0</addressOffset></register></registers></peripheral></peripherals></device>"
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            device = Parser.from_xml_str(xml_str, lazy=True).get_parsed_device()
+
+        with pytest.warns(ParserWarning, match="has been stripped"):
+            assert device.peripherals[0].registers_clusters[0].name == "R"
+
+
+class TestChildElementLookup:
+    @pytest.fixture(name="xml_str")
+    def fixture_xml_str(self) -> str:
+        return (
+            "<device schemaVersion='1.1' xmlns:xs='http://www.w3.org/2001/XMLSchema-instance'\n"
+            "xs:noNamespaceSchemaLocation='CMSIS-SVD.xsd'>\n<version>1</version>\n<!-- comment -->\n"
+            "<version>2</version><name>A</name>\n<description>A</description><addressUnitBits>8</addressUnitBits>"
+            "<width>32</width><peripherals><peripheral><name>P</name><baseAddress>0</baseAddress><registers>"
+            "<register><name>R</name><addressOffset>0</addressOffset><addressOffset>4</addressOffset></register>"
+            "</registers></peripheral></peripherals></device>"
+        )
+
+    def test_last_duplicate_wins(self, xml_str: str):
+        with pytest.warns(ParserWarning, match="Multiple elements") as record:
+            device = Parser.from_xml_str(xml_str).get_parsed_device()
+
+        assert device.version == "2"
+        assert device.peripherals[0].registers_clusters[0].address_offset == 4
+        assert [str(warning.message).split(".")[0] for warning in record] == [
+            "Multiple elements 'version' with texts '1, 2' found at svd file source lines '3, 5'",
+            "Multiple elements 'addressOffset' with texts '0, 4' found at svd file source lines '6, 6'",
+        ]
+
 
 class TestToInt:
     @pytest.mark.parametrize(
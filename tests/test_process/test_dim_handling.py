@@ -735,3 +735,46 @@ def test_list_displayname_without_dim(get_processed_device_from_testfile: Callab
     """
 
     get_processed_device_from_testfile("dim_handling/list_displayname_without_dim.svd")
+
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_nested_array_with_derived_from_instance(get_processed_device_from_testfile: Callable[[str], Device]):
+    """
+    This test case checks nested arrays, where a cluster array contains a register array, and a register is derived
+    from one of the nested instances. The instances of each array exist once per instance of the enclosing array,
+    including their fields, and the derived register must find its base element by the names of the instances.
+
+    **Expected Outcome:** The parser should generate `Cluster0` and `Cluster1`, each with `Register0` and `Register1`
+    of size 16 and the field `FieldA`. `RegisterB` is derived from `PeripheralA.Cluster1.Register1` and inherits its
+    size and field.
+
+    **Processable with svdconv:** yes
+    """
+
+    device = get_processed_device_from_testfile("dim_handling/nested_array_with_derived_from_instance.svd")
+
+    assert len(device.peripherals) == 1
+    assert len(device.peripherals[0].registers_clusters) == 3
+
+    for cluster_index, cluster in enumerate(device.peripherals[0].registers_clusters[:2]):
+        assert isinstance(cluster, Cluster)
+        assert cluster.name == f"Cluster{cluster_index}"
+        assert cluster.address_offset == 0x10 * cluster_index
+        assert len(cluster.registers_clusters) == 2
+
+        for register_index, register in enumerate(cluster.registers_clusters):
+            assert isinstance(register, Register)
+            assert register.name == f"Register{register_index}"
+            assert register.address_offset == 0x4 * register_index
+            assert register.size == 16
+            assert len(register.fields) == 1
+            assert register.fields[0].name == "FieldA"
+
+    register_b = device.peripherals[0].registers_clusters[2]
+    assert isinstance(register_b, Register)
+    assert register_b.name == "RegisterB"
+    assert register_b.address_offset == 0x20
+    assert register_b.size == 16
+    assert len(register_b.fields) == 1
+    assert register_b.fields[0].name == "FieldA"
+    assert register_b.fields[0].msb == 3
@@ -7,12 +7,15 @@ This feature contains test cases that validate how enumerated values are defined
 scenarios. The test cases ensure that the parser correctly handles the definition and usage of enumerated values.
 """
 
+from itertools import islice
 from typing import Callable
 import pytest
 
 from svdsuite.process import Process, ProcessException, ProcessWarning
+from svdsuite.model.parse import SVDRegister
 from svdsuite.model.process import Device, Register
 from svdsuite.model.types import EnumUsageType
+from svdsuite.util.process_parse_model_convert import process_parse_convert_device
 
 
 @pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
@@ -310,7 +313,8 @@ def test_do_not_care_handling(get_processed_device_from_testfile: Callable[[str]
     enumerated values that represent different numeric values to share the same logical name and description. This
     results in a list of enumerated values that map distinct values, such as `0x00`, `0x04`, `0x01`, `0x05`, and
     so on, under similar names based on their functional grouping. The parser must handle this scenario without
-    confusion or conflicts, ensuring that each enumeration is correctly represented in the output.
+    confusion or conflicts, ensuring that each enumeration is correctly represented in the output. The container keeps
+    each of them as one enumerated value with the mask of its "do not care" bits, which is expanded on request.
 
     **Processable with svdconv:** yes
     """
@@ -325,39 +329,48 @@ def test_do_not_care_handling(get_processed_device_from_testfile: Callable[[str]
     assert len(device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers) == 1
     container = device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
 
-    assert len(container.enumerated_values) == 8
+    assert [(value.name, value.value, value.dont_care_mask) for value in container.enumerated_values] == [
+        ("0bx00", 0, 4),
+        ("0bx01", 1, 4),
+        ("0bx10", 2, 4),
+        ("0bx11", 3, 4),
+    ]
+    assert container.get_enumerated_value(6) is container.enumerated_values[2]
 
-    assert container.enumerated_values[0].name == "0bx00_0"
-    assert container.enumerated_values[0].description == "Description for 0bx00"
-    assert container.enumerated_values[0].value == 0
+    enumerated_values = container.get_expanded_enumerated_values()
+    assert len(enumerated_values) == 8
 
-    assert container.enumerated_values[1].name == "0bx01_1"
-    assert container.enumerated_values[1].description == "Description for 0bx01"
-    assert container.enumerated_values[1].value == 1
+    assert enumerated_values[0].name == "0bx00_0"
+    assert enumerated_values[0].description == "Description for 0bx00"
+    assert enumerated_values[0].value == 0
 
-    assert container.enumerated_values[2].name == "0bx10_2"
-    assert container.enumerated_values[2].description == "Description for 0bx10"
-    assert container.enumerated_values[2].value == 2
+    assert enumerated_values[1].name == "0bx01_1"
+    assert enumerated_values[1].description == "Description for 0bx01"
+    assert enumerated_values[1].value == 1
 
-    assert container.enumerated_values[3].name == "0bx11_3"
-    assert container.enumerated_values[3].description == "Description for 0bx11"
-    assert container.enumerated_values[3].value == 3
+    assert enumerated_values[2].name == "0bx10_2"
+    assert enumerated_values[2].description == "Description for 0bx10"
+    assert enumerated_values[2].value == 2
 
-    assert container.enumerated_values[4].name == "0bx00_4"
-    assert container.enumerated_values[4].description == "Description for 0bx00"
-    assert container.enumerated_values[4].value == 4
+    assert enumerated_values[3].name == "0bx11_3"
+    assert enumerated_values[3].description == "Description for 0bx11"
+    assert enumerated_values[3].value == 3
 
-    assert container.enumerated_values[5].name == "0bx01_5"
-    assert container.enumerated_values[5].description == "Description for 0bx01"
-    assert container.enumerated_values[5].value == 5
+    assert enumerated_values[4].name == "0bx00_4"
+    assert enumerated_values[4].description == "Description for 0bx00"
+    assert enumerated_values[4].value == 4
 
-    assert container.enumerated_values[6].name == "0bx10_6"
-    assert container.enumerated_values[6].description == "Description for 0bx10"
-    assert container.enumerated_values[6].value == 6
+    assert enumerated_values[5].name == "0bx01_5"
+    assert enumerated_values[5].description == "Description for 0bx01"
+    assert enumerated_values[5].value == 5
 
-    assert container.enumerated_values[7].name == "0bx11_7"
-    assert container.enumerated_values[7].description == "Description for 0bx11"
-    assert container.enumerated_values[7].value == 7
+    assert enumerated_values[6].name == "0bx10_6"
+    assert enumerated_values[6].description == "Description for 0bx10"
+    assert enumerated_values[6].value == 6
+
+    assert enumerated_values[7].name == "0bx11_7"
+    assert enumerated_values[7].description == "Description for 0bx11"
+    assert enumerated_values[7].value == 7
 
 
 @pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
@@ -387,19 +400,25 @@ def test_do_not_care_and_distinct_values(get_processed_device_from_testfile: Cal
     assert len(device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers) == 1
     container = device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
 
-    assert len(container.enumerated_values) == 3
+    assert [(value.name, value.value, value.dont_care_mask) for value in container.enumerated_values] == [
+        ("0bx0", 0, 2),
+        ("0b11", 3, 0),
+    ]
+
+    enumerated_values = container.get_expanded_enumerated_values()
+    assert len(enumerated_values) == 3
 
-    assert container.enumerated_values[0].name == "0bx0_0"
-    assert container.enumerated_values[0].description == "Description for 0bx0"
-    assert container.enumerated_values[0].value == 0
+    assert enumerated_values[0].name == "0bx0_0"
+    assert enumerated_values[0].description == "Description for 0bx0"
+    assert enumerated_values[0].value == 0
 
-    assert container.enumerated_values[1].name == "0bx0_2"
-    assert container.enumerated_values[1].description == "Description for 0bx0"
-    assert container.enumerated_values[1].value == 2
+    assert enumerated_values[1].name == "0bx0_2"
+    assert enumerated_values[1].description == "Description for 0bx0"
+    assert enumerated_values[1].value == 2
 
-    assert container.enumerated_values[2].name == "0b11"
-    assert container.enumerated_values[2].description == "Description for 0b11"
-    assert container.enumerated_values[2].value == 3
+    assert enumerated_values[2].name == "0b11"
+    assert enumerated_values[2].description == "Description for 0b11"
+    assert enumerated_values[2].value == 3
 
 
 def test_do_not_care_and_distinct_result_in_same_value(get_processed_device_from_testfile: Callable[[str], Device]):
@@ -427,13 +446,59 @@ def test_do_not_care_and_distinct_result_in_same_value(get_processed_device_from
     assert len(device.peripherals[0].registers_clusters[0].fields) == 1
     assert len(device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers) == 1
     enum_container = device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
-    assert len(enum_container.enumerated_values) == 2
-    assert enum_container.enumerated_values[0].name == "0bx0_0"
-    assert enum_container.enumerated_values[0].description == "Description for 0bx0"
-    assert enum_container.enumerated_values[0].value == 0
-    assert enum_container.enumerated_values[1].name == "0bx0_2"
-    assert enum_container.enumerated_values[1].description == "Description for 0bx0"
-    assert enum_container.enumerated_values[1].value == 2
+    assert [(value.name, value.value, value.dont_care_mask) for value in enum_container.enumerated_values] == [
+        ("0bx0", 0, 2)
+    ]
+    enumerated_values = enum_container.get_expanded_enumerated_values()
+    assert len(enumerated_values) == 2
+    assert enumerated_values[0].name == "0bx0_0"
+    assert enumerated_values[0].description == "Description for 0bx0"
+    assert enumerated_values[0].value == 0
+    assert enumerated_values[1].name == "0bx0_2"
+    assert enumerated_values[1].description == "Description for 0bx0"
+    assert enumerated_values[1].value == 2
+
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_do_not_care_wide_field(get_processed_device_from_testfile: Callable[[str], Device]):
+    """
+    This test case extends `test_do_not_care_handling` to a field of 32 bits with the enumerated value `0b1x...x`,
+    whose 31 "do not care" bits stand for 2^31 values. Listing them isn't feasible, so the enumerated value is kept
+    with the mask of its "do not care" bits, and its values are only created on expansion.
+
+    **Expected Outcome:** The container holds `ONE` and `HIGH`, where `HIGH` has the value `0x80000000` and the mask
+    `0x7FFFFFFF`. Looking up a value yields the enumerated value that matches it, independent of the number of
+    "do not care" bits. Expanding `HIGH` yields `HIGH_2147483648` first. Converted back to the SVD model, `HIGH` has the
+    value `0b1x...x` again.
+
+    **Processable with svdconv:** yes
+    """
+
+    device = get_processed_device_from_testfile("enumerated_values/do_not_care_wide_field.svd")
+
+    assert isinstance(device.peripherals[0].registers_clusters[0], Register)
+    container = device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
+
+    assert [(value.name, value.value, value.dont_care_mask) for value in container.enumerated_values] == [
+        ("ONE", 1, 0),
+        ("HIGH", 0x80000000, 0x7FFFFFFF),
+    ]
+
+    assert container.get_enumerated_value(0xFFFFFFFF) is container.enumerated_values[1]
+    assert container.get_enumerated_value(1) is container.enumerated_values[0]
+    assert container.get_enumerated_value(2) is None
+    assert [(value.name, value.value) for value in islice(container.enumerated_values[1].expand(), 2)] == [
+        ("HIGH_2147483648", 0x80000000),
+        ("HIGH_2147483649", 0x80000001),
+    ]
+
+    svd_device = process_parse_convert_device(device)
+    assert isinstance(svd_device.peripherals[0].registers_clusters[0], SVDRegister)
+    svd_container = svd_device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
+    assert [(value.name, value.value) for value in svd_container.enumerated_values] == [
+        ("ONE", "1"),
+        ("HIGH", "0b1" + "x" * 31),
+    ]
 
 
 @pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
@@ -447,12 +512,12 @@ def test_default_extension(get_processed_device_from_testfile: Callable[[str], D
     template.
 
     **Expected Outcome:** The parser should go beyond `svdconv`'s behavior by automatically identifying all values not
-    covered by explicit `enumeratedValue` entries and adding them to the container using the `isDefault`
-    description. For example, if the `isDefault` value is defined with a description like "Description for
-    default," the parser should generate new entries for every unlisted possible value, appending them to the
-    existing list of enumerated values. In this case, the parser should correctly identify that `0b10` is
-    explicitly listed, while the values `0`, `1`, and `3` are not. It should then add these values using the
-    `isDefault` template, resulting in a complete and exhaustive set of enumerated values, ensuring that any
+    covered by explicit `enumeratedValue` entries and describing them with the `isDefault` entry. Since a wide field
+    has up to 2^width uncovered values, the container keeps the `isDefault` entry as the complement of the covered
+    values, which answers membership and size without listing them. On request, the container is expanded to new
+    entries for every unlisted possible value, using the `isDefault` description like "Description for default". In
+    this case, the parser should correctly identify that `0b10` is explicitly listed, while the values `0`, `1`, and
+    `3` are not. The expanded container is a complete and exhaustive set of enumerated values, ensuring that any
     unspecified cases are properly accounted for and described, thus enhancing clarity and usability.
 
     **Processable with svdconv:** yes
@@ -468,23 +533,32 @@ def test_default_extension(get_processed_device_from_testfile: Callable[[str], D
     assert len(device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers) == 1
     container = device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
 
-    assert len(container.enumerated_values) == 4
+    assert len(container.enumerated_values) == 1
+    assert container.enumerated_values[0].name == "0b10"
 
-    assert container.enumerated_values[0].name == "default_0"
-    assert container.enumerated_values[0].description == "Description for default"
-    assert container.enumerated_values[0].value == 0
+    assert container.default is not None
+    assert container.default.name == "default"
+    assert container.default.size == 3
+    assert [value for value in range(5) if value in container.default] == [0, 1, 3]
 
-    assert container.enumerated_values[1].name == "default_1"
-    assert container.enumerated_values[1].description == "Description for default"
-    assert container.enumerated_values[1].value == 1
+    enumerated_values = container.get_expanded_enumerated_values()
+    assert len(enumerated_values) == 4
 
-    assert container.enumerated_values[2].name == "0b10"
-    assert container.enumerated_values[2].description == "Description for 0b10"
-    assert container.enumerated_values[2].value == 2
+    assert enumerated_values[0].name == "default_0"
+    assert enumerated_values[0].description == "Description for default"
+    assert enumerated_values[0].value == 0
 
-    assert container.enumerated_values[3].name == "default_3"
-    assert container.enumerated_values[3].description == "Description for default"
-    assert container.enumerated_values[3].value == 3
+    assert enumerated_values[1].name == "default_1"
+    assert enumerated_values[1].description == "Description for default"
+    assert enumerated_values[1].value == 1
+
+    assert enumerated_values[2].name == "0b10"
+    assert enumerated_values[2].description == "Description for 0b10"
+    assert enumerated_values[2].value == 2
+
+    assert enumerated_values[3].name == "default_3"
+    assert enumerated_values[3].description == "Description for default"
+    assert enumerated_values[3].value == 3
 
 
 def test_isdefault_with_value(get_processed_device_from_testfile: Callable[[str], Device]):
@@ -510,20 +584,71 @@ def test_isdefault_with_value(get_processed_device_from_testfile: Callable[[str]
     assert len(device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers) == 1
     container = device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
 
-    assert len(container.enumerated_values) == 4
+    assert len(container.enumerated_values) == 1
+    assert container.enumerated_values[0].name == "0b10"
 
-    assert container.enumerated_values[0].name == "default_0"
-    assert container.enumerated_values[0].description == "Description for default"
-    assert container.enumerated_values[0].value == 0
+    assert container.default is not None
+    assert container.default.name == "default"
+    assert container.default.size == 3
+    assert [value for value in range(5) if value in container.default] == [0, 1, 3]
 
-    assert container.enumerated_values[1].name == "default_1"
-    assert container.enumerated_values[1].description == "Description for default"
-    assert container.enumerated_values[1].value == 1
+    enumerated_values = container.get_expanded_enumerated_values()
+    assert len(enumerated_values) == 4
 
-    assert container.enumerated_values[2].name == "0b10"
-    assert container.enumerated_values[2].description == "Description for 0b10"
-    assert container.enumerated_values[2].value == 2
+    assert enumerated_values[0].name == "default_0"
+    assert enumerated_values[0].description == "Description for default"
+    assert enumerated_values[0].value == 0
+
+    assert enumerated_values[1].name == "default_1"
+    assert enumerated_values[1].description == "Description for default"
+    assert enumerated_values[1].value == 1
+
+    assert enumerated_values[2].name == "0b10"
+    assert enumerated_values[2].description == "Description for 0b10"
+    assert enumerated_values[2].value == 2
+
+    assert enumerated_values[3].name == "default_3"
+    assert enumerated_values[3].description == "Description for default"
+    assert enumerated_values[3].value == 3
+
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_default_extension_wide_field(get_processed_device_from_testfile: Callable[[str], Device]):
+    """
+    This test case extends `test_default_extension` to a field of 32 bits, whose `isDefault` entry stands for all
+    2^32 values except the explicitly listed `0b10`. Listing them isn't feasible, so the values of the `isDefault`
+    entry must be answered from the covered values, and its entries are only created on iteration.
+
+    **Expected Outcome:** The container holds `0b10` and the `isDefault` entry, which contains every value except `2`
+    within the 32 bits. Iterating it yields `default_0`, `default_1` and `default_3` first. Converted back to the SVD
+    model, the container contains the `isDefault` entry again instead of its values.
+
+    **Processable with svdconv:** yes
+    """
+
+    device = get_processed_device_from_testfile("enumerated_values/default_extension_wide_field.svd")
+
+    assert isinstance(device.peripherals[0].registers_clusters[0], Register)
+    container = device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
+
+    assert [enumerated_value.name for enumerated_value in container.enumerated_values] == ["0b10"]
+
+    assert container.default is not None
+    assert container.default.size == 2**32 - 1
+    assert 0xFFFFFFFF in container.default
+    assert 2 not in container.default
+    assert 2**32 not in container.default
+    assert [(enumerated_value.name, enumerated_value.value) for enumerated_value in islice(container.default, 3)] == [
+        ("default_0", 0),
+        ("default_1", 1),
+        ("default_3", 3),
+    ]
+
+    svd_device = process_parse_convert_device(device)
+    assert isinstance(svd_device.peripherals[0].registers_clusters[0], SVDRegister)
+    svd_container = svd_device.peripherals[0].registers_clusters[0].fields[0].enumerated_value_containers[0]
+    assert [(value.name, value.value, value.is_default) for value in svd_container.enumerated_values] == [
+        ("0b10", "2", False),
+        ("default", None, True),
+    ]
 
-    assert container.enumerated_values[3].name == "default_3"
-    assert container.enumerated_values[3].description == "Description for default"
-    assert container.enumerated_values[3].value == 3
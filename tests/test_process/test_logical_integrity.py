@@ -1495,6 +1495,46 @@ def test_field_bit_range_processing(get_processed_device_from_testfile: Callable
     assert device.peripherals[0].registers_clusters[0].fields[2].msb == 11
 
 
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_field_access_masks(get_processed_device_from_testfile: Callable[[str], Device]):
+    """
+    This test checks the bit masks, which are derived from the fields of a register during processing. Each field
+    provides the mask of its bits and its shift, and each register provides the masks of its readable, writable, and
+    reserved bits, so consumers don't have to compute them from the LSB and MSB of the fields. In the test file,
+    the read-only `FieldA` and the write-only `FieldB` share the bits `[3:0]`, `FieldC` is read-write, and `FieldD`
+    is write-once. `RegisterB` is a read-only register of 16 bits without fields.
+
+    **Expected Outcome:** The parser should process the SVD file without errors. `FieldC` should have the mask `0xF0`
+    and the shift `4`. `RegisterA` should have the read mask `0xFF`, the write mask `0x1FF`, and the reserved mask
+    `0xFFFFFE00`. `RegisterB` is accessed as a whole, so its read mask should cover all 16 bits, while its write mask
+    and reserved mask should be `0`.
+
+    **Processable with svdconv:** yes
+    """
+
+    device = get_processed_device_from_testfile("logical_integrity/field_access_masks.svd")
+
+    assert len(device.peripherals[0].registers_clusters) == 2
+    register_a = device.peripherals[0].registers_clusters[0]
+    register_b = device.peripherals[0].registers_clusters[1]
+    assert isinstance(register_a, Register)
+    assert isinstance(register_b, Register)
+
+    assert [(field.name, field.mask, field.shift) for field in register_a.fields] == [
+        ("FieldA", 0xF, 0),
+        ("FieldB", 0xF, 0),
+        ("FieldC", 0xF0, 4),
+        ("FieldD", 0x100, 8),
+    ]
+    assert register_a.read_mask == 0xFF
+    assert register_a.write_mask == 0x1FF
+    assert register_a.reserved_mask == 0xFFFFFE00
+
+    assert register_b.read_mask == 0xFFFF
+    assert register_b.write_mask == 0
+    assert register_b.reserved_mask == 0
+
 @pytest.mark.xfail(
     strict=True,
     raises=ProcessException,
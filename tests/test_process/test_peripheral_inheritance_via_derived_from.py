@@ -862,3 +862,31 @@ def test_derive_from_self(get_processed_device_from_testfile: Callable[[str], De
     """
 
     get_processed_device_from_testfile("peripheral_inheritance_via_derivedfrom/derive_from_self.svd")
+
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_register_derived_from_inherited_register(get_processed_device_from_testfile: Callable[[str], Device]):
+    """
+    In this test case, `PeripheralB` inherits the register `RegisterA` from `PeripheralA`, and the register
+    `RegisterB` of `PeripheralC` is derived from `PeripheralB.RegisterA`, i.e. from a register that only exists in
+    `PeripheralB` through inheritance.
+
+    **Expected Outcome:** The derive path is resolved to the inherited register. `RegisterB` has a size of 16 bits
+    and contains the field `FieldA`.
+
+    **Processable with svdconv:** no - `svdconv` can't handle references over different peripherals.
+    """
+
+    device = get_processed_device_from_testfile(
+        "peripheral_inheritance_via_derivedfrom/register_derived_from_inherited_register.svd"
+    )
+
+    assert len(device.peripherals) == 3
+
+    assert device.peripherals[2].name == "PeripheralC"
+    assert len(device.peripherals[2].registers_clusters) == 1
+    assert isinstance(device.peripherals[2].registers_clusters[0], Register)
+    assert device.peripherals[2].registers_clusters[0].name == "RegisterB"
+    assert device.peripherals[2].registers_clusters[0].size == 16
+    assert len(device.peripherals[2].registers_clusters[0].fields) == 1
+    assert device.peripherals[2].registers_clusters[0].fields[0].name == "FieldA"
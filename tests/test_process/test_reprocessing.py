@@ -0,0 +1,113 @@
+"""
+For this feature, test cases cover the reprocessing of a parsed device after some of its elements have been changed,
+ensuring that the changed peripherals and the peripherals depending on them are processed again, while the other
+peripherals are reused.
+"""
+
+from typing import Callable
+import pytest
+
+from svdsuite.parse import Parser
+from svdsuite.process import Process, ProcessException
+from svdsuite.model.parse import SVDPeripheral, SVDRegister
+from svdsuite.model.process import Register
+
+
+@pytest.mark.filterwarnings("ignore::svdsuite.process.ProcessWarning")
+def test_changed_register(get_test_svd_file_path: Callable[[str], str]):
+    """
+    The description of `PeripheralA.RegisterA` is changed. PeripheralB is derived from PeripheralA, and
+    `PeripheralC.RegisterB` is derived from `PeripheralB.RegisterA`.
+
+    **Expected Outcome:** PeripheralA, PeripheralB and PeripheralC are processed again and hold the new description.
+    The other peripherals are reused, and the device is the same as a device processed from scratch.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    file_path = get_test_svd_file_path("selective_processing/dependencies.svd")
+    parsed_device = Parser.from_svd_file(file_path).get_parsed_device()
+    process = Process(parsed_device, None)
+    previous_peripherals = {peripheral.name: peripheral for peripheral in process.get_processed_device().peripherals}
+
+    parsed_register = parsed_device.peripherals[0].registers_clusters[0]
+    assert isinstance(parsed_register, SVDRegister)
+    parsed_register.description = "Patched"
+    device = process.reprocess([parsed_register])
+
+    peripherals = {peripheral.name: peripheral for peripheral in device.peripherals}
+    assert list(peripherals) == list(previous_peripherals)
+    for name in ("PeripheralA", "PeripheralB", "PeripheralC"):
+        assert peripherals[name] is not previous_peripherals[name]
+    assert peripherals["PeripheralA"].registers_clusters[0].description == "Patched"
+    assert peripherals["PeripheralB"].registers_clusters[0].description == "Patched"
+    register_b = peripherals["PeripheralC"].registers_clusters[1]
+    assert isinstance(register_b, Register)
+    assert register_b.name == "RegisterB"
+    assert register_b.description == "Patched"
+    for name in ("PeripheralD", "UART0", "UART1", "PeripheralE", "PeripheralF"):
+        assert peripherals[name] is previous_peripherals[name]
+
+    assert device == Process(parsed_device, None).get_processed_device()
+
+
+@pytest.mark.filterwarnings("ignore::svdsuite.process.ProcessWarning")
+def test_added_and_removed_peripherals(get_test_svd_file_path: Callable[[str], str]):
+    """
+    PeripheralF is removed from the parsed device, and PeripheralG, which is derived from PeripheralD, is added.
+
+    **Expected Outcome:** The device holds PeripheralG with the register of PeripheralD, and PeripheralF is gone.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    file_path = get_test_svd_file_path("selective_processing/dependencies.svd")
+    parsed_device = Parser.from_svd_file(file_path).get_parsed_device()
+    process = Process(parsed_device, None)
+
+    parsed_device.peripherals.pop()
+    parsed_device.peripherals.append(
+        SVDPeripheral(name="PeripheralG", base_address=0x40009000, derived_from="PeripheralD", parent=parsed_device)
+    )
+    device = process.reprocess([])
+
+    assert [peripheral.name for peripheral in device.peripherals][-2:] == ["PeripheralE", "PeripheralG"]
+    assert device.peripherals[-1].registers_clusters[0].name == "RegisterA"
+    assert device == Process(parsed_device, None).get_processed_device()
+
+
+@pytest.mark.filterwarnings("ignore::svdsuite.process.ProcessWarning")
+def test_changed_device(get_test_svd_file_path: Callable[[str], str]):
+    """
+    The reset value of the parsed device is changed, which all registers without an own reset value inherit.
+
+    **Expected Outcome:** The device is processed again as a whole, and the registers have the new reset value.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    file_path = get_test_svd_file_path("selective_processing/dependencies.svd")
+    parsed_device = Parser.from_svd_file(file_path).get_parsed_device()
+    process = Process(parsed_device, None)
+
+    parsed_device.reset_value = 0x1
+    device = process.reprocess([parsed_device])
+
+    for peripheral in device.peripherals:
+        assert peripheral.registers_clusters[0].reset_value == 0x1
+
+
+@pytest.mark.filterwarnings("ignore::svdsuite.process.ProcessWarning")
+def test_element_without_device(get_test_svd_file_path: Callable[[str], str]):
+    """
+    A register, which isn't part of a parsed device, is passed as changed element.
+
+    **Expected Outcome:** The reprocessing fails, as the register can't be assigned to a peripheral.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    process = Process.from_svd_file(get_test_svd_file_path("selective_processing/dependencies.svd"))
+
+    with pytest.raises(ProcessException, match="Changed element isn't part of a parsed device"):
+        process.reprocess([SVDRegister(name="RegisterA", address_offset=0x0)])
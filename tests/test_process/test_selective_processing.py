@@ -0,0 +1,106 @@
+"""
+For this feature, test cases cover the processing of selected peripherals, ensuring that the peripherals they depend on
+via derivedFrom are processed as well, while the processed device only holds the selected peripherals.
+"""
+
+from typing import Callable
+import pytest
+
+from svdsuite.process import ProcessException, ProcessWarning
+from svdsuite.model.process import Device, Register
+
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_peripheral_dependency(get_processed_device_from_testfile: Callable[[str, list[str]], Device]):
+    """
+    PeripheralB is derived from PeripheralA, and only PeripheralB is selected.
+
+    **Expected Outcome:** The device contains only PeripheralB, which inherits the register `RegisterA` from
+    PeripheralA. The misaligned PeripheralF isn't processed, so no warning is raised.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    device = get_processed_device_from_testfile("selective_processing/dependencies.svd", ["PeripheralB"])
+
+    assert [peripheral.name for peripheral in device.peripherals] == ["PeripheralB"]
+    assert len(device.peripherals[0].registers_clusters) == 1
+    assert isinstance(device.peripherals[0].registers_clusters[0], Register)
+    assert device.peripherals[0].registers_clusters[0].name == "RegisterA"
+    assert device.peripherals[0].registers_clusters[0].fields[0].name == "FieldA"
+
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_transitive_dependencies(get_processed_device_from_testfile: Callable[[str, list[str]], Device]):
+    """
+    The enumerated value container of `PeripheralC.RegisterA.FieldA` is derived from PeripheralD, and
+    `PeripheralC.RegisterB` is derived from `PeripheralB.RegisterA`, which is inherited from PeripheralA. Only
+    PeripheralC is selected.
+
+    **Expected Outcome:** The device contains only PeripheralC. `RegisterA.FieldA` holds the enumerated values of
+    PeripheralD, and `RegisterB` inherits the field `FieldA` of PeripheralA.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    device = get_processed_device_from_testfile("selective_processing/dependencies.svd", ["PeripheralC"])
+
+    assert [peripheral.name for peripheral in device.peripherals] == ["PeripheralC"]
+    register_a = device.peripherals[0].registers_clusters[0]
+    register_b = device.peripherals[0].registers_clusters[1]
+    assert isinstance(register_a, Register)
+    assert isinstance(register_b, Register)
+    assert len(register_a.fields[0].enumerated_value_containers) == 1
+    enumerated_values = register_a.fields[0].enumerated_value_containers[0].enumerated_values
+    assert [value.name for value in enumerated_values] == ["0b0", "0b1"]
+    assert register_b.name == "RegisterB"
+    assert register_b.address_offset == 0x4
+    assert [field.name for field in register_b.fields] == ["FieldA"]
+
+
+@pytest.mark.filterwarnings("error::svdsuite.process.ProcessWarning")
+def test_dim_peripheral_dependency(get_processed_device_from_testfile: Callable[[str, list[str]], Device]):
+    """
+    `PeripheralE.RegisterA` is derived from `UART1.RegisterA`, where UART1 is an instance of the peripheral array
+    `UART[%s]`. PeripheralE and the instance UART0 are selected.
+
+    **Expected Outcome:** The device contains UART0 and PeripheralE, sorted by their base addresses. The register of
+    PeripheralE inherits the field `FieldB` of UART1, and UART1 isn't part of the device.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    device = get_processed_device_from_testfile("selective_processing/dependencies.svd", ["PeripheralE", "UART0"])
+
+    assert [peripheral.name for peripheral in device.peripherals] == ["UART0", "PeripheralE"]
+    register = device.peripherals[1].registers_clusters[0]
+    assert isinstance(register, Register)
+    assert [field.name for field in register.fields] == ["FieldB"]
+
+
+def test_diagnostics_of_selected_peripheral(get_processed_device_from_testfile: Callable[[str, list[str]], Device]):
+    """
+    PeripheralF has a base address, which isn't 4 byte aligned, and is selected.
+
+    **Expected Outcome:** The device contains only PeripheralF, and a warning is raised for its base address.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    with pytest.warns(ProcessWarning, match="Peripheral 'PeripheralF' base address is not 4 byte aligned"):
+        device = get_processed_device_from_testfile("selective_processing/dependencies.svd", ["PeripheralF"])
+
+    assert [peripheral.name for peripheral in device.peripherals] == ["PeripheralF"]
+
+
+def test_unknown_peripheral(get_processed_device_from_testfile: Callable[[str, list[str]], Device]):
+    """
+    A peripheral, which isn't part of the device, is selected.
+
+    **Expected Outcome:** The processing fails, as the peripheral can't be found.
+
+    **Processable with svdconv:** not applicable
+    """
+
+    with pytest.raises(ProcessException, match="Peripheral 'PeripheralG' not found"):
+        get_processed_device_from_testfile("selective_processing/dependencies.svd", ["PeripheralG"])
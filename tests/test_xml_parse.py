@@ -0,0 +1,112 @@
+import codecs
+import io
+import mmap
+import pathlib
+import pytest
+import lxml.etree
+
+from svdsuite.util.parser_exception_warning import ParserWarning
+from svdsuite.util.xml_parse import safe_frombuffer, safe_fromstring, safe_iterparse, safe_parse, sniff_encoding
+
+
+class TestSniffEncoding:
+    @pytest.mark.parametrize(
+        "test_input,expected",
+        [
+            (b"<device><name>A</name></device>", ("utf-8", False)),
+            (b"<?xml version='1.0' encoding='UTF-8'?><device/>", ("utf-8", False)),
+            (b"<?xml version='1.0' encoding='ISO-8859-1'?><device>\xe4</device>", ("iso-8859-1", False)),
+            ("<?xml version='1.0'?><device>ä</device>".encode("utf-8"), ("utf-8", False)),
+            (b"<?xml version='1.0' encoding='utf-8'?><device>\xe4\x80</device>", ("windows-1252", True)),
+            (b"<?xml version='1.0' encoding='utf-8'?><device>\xe4\x81</device>", ("iso-8859-1", True)),
+            (b"<?xml version='1.0' encoding='unknown'?><device/>", ("utf-8", True)),
+            (codecs.BOM_UTF8 + b"<device/>", ("utf-8", False)),
+            (codecs.BOM_UTF16_LE + "<device/>".encode("utf-16-le"), ("utf-16-le", False)),
+            ("<device/>".encode("utf-16-le"), ("utf-16-le", True)),
+        ],
+    )
+    def test_sniff_encoding(self, test_input: bytes, expected: tuple[str, bool]):
+        assert sniff_encoding(test_input) == expected
+
+
+class TestSafeFromstring:
+    @pytest.mark.filterwarnings("error::svdsuite.util.parser_exception_warning.ParserWarning")
+    def test_well_formed(self):
+        root = safe_fromstring("<?xml version='1.0' encoding='utf-8'?><device>ä</device>".encode("utf-8"))
+
+        assert root.text == "ä"
+
+    def test_fallback_encoding(self):
+        content = "<?xml version='1.0' encoding='utf-8'?><device>ä€</device>".encode("windows-1252")
+
+        with pytest.warns(ParserWarning, match="fallback encoding 'windows-1252' with recover=False"):
+            root = safe_fromstring(content)
+
+        assert root.text == "ä€"
+
+    def test_recover(self):
+        with pytest.warns(ParserWarning, match="fallback encoding 'utf-8' with recover=True"):
+            root = safe_fromstring(b"<device><name>A</device>")
+
+        assert root.tag == "device"
+
+    @pytest.mark.xfail(strict=True, raises=lxml.etree.XMLSyntaxError)
+    def test_not_recoverable(self):
+        safe_fromstring(b"no xml content")
+
+
+class TestSafeParse:
+    @pytest.mark.filterwarnings("error::svdsuite.util.parser_exception_warning.ParserWarning")
+    def test_file_path(self, tmp_path: pathlib.Path):
+        path = str(tmp_path / "test.svd")
+        with open(path, "wb") as file:
+            file.write(b"<device><name>A</name></device>")
+
+        tree = safe_parse(path)
+
+        assert tree.getroot().findtext("name") == "A"
+        assert tree.docinfo.URL == path
+
+
+class TestSafeFrombuffer:
+    @pytest.mark.filterwarnings("error::svdsuite.util.parser_exception_warning.ParserWarning")
+    def test_mmap(self, tmp_path: pathlib.Path):
+        path = tmp_path / "test.svd"
+        path.write_bytes(b"<device><name>A</name></device>")
+
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            root = safe_frombuffer(buffer)
+
+        assert root.findtext("name") == "A"
+
+    def test_fallback_encoding(self):
+        content = "<?xml version='1.0' encoding='utf-8'?><device>ä€</device>".encode("windows-1252")
+
+        with pytest.warns(ParserWarning, match="fallback encoding 'windows-1252' with recover=False"):
+            root = safe_frombuffer(bytearray(content))
+
+        assert root.text == "ä€"
+
+    def test_recover(self):
+        with pytest.warns(ParserWarning, match="fallback encoding 'utf-8' with recover=True"):
+            root = safe_frombuffer(memoryview(b"<device><name>A</device>"))
+
+        assert root.tag == "device"
+
+    @pytest.mark.xfail(strict=True, raises=lxml.etree.XMLSyntaxError)
+    def test_not_recoverable(self):
+        safe_frombuffer(bytearray(b"no xml content"))
+
+
+class TestSafeIterparse:
+    def test_fallback_encoding(self):
+        content = "<?xml version='1.0' encoding='utf-8'?><device><name>ä€</name></device>".encode("windows-1252")
+
+        with pytest.warns(ParserWarning, match="fallback encoding 'windows-1252' with recover=False"):
+            texts = [element.text for _, element in safe_iterparse(io.BytesIO(content), ("end",), ("name",))]
+
+        assert texts == ["ä€"]
+
+    @pytest.mark.xfail(strict=True, raises=lxml.etree.XMLSyntaxError)
+    def test_not_recoverable(self):
+        list(safe_iterparse(io.BytesIO(b"no xml content"), ("end",), ("name",)))